@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix API Async Transport Module
+
+Shared aiohttp session with bounded concurrency for the asyncio clients
+"""
+
+import asyncio
+import datetime
+
+import aiohttp
+
+from teamdynamix.auth.ratelimit import (
+    RateLimitError,
+    endpoint_key,
+    get_rate_limiter,
+)
+from teamdynamix.utils.decode import decode_json
+
+DEFAULT_MAX_CONCURRENCY = 20
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_TIMEOUT = 30  # Total seconds per request
+DEFAULT_THROTTLE_RETRIES = 5  # Times a 429 response is waited out and retried
+
+
+class AsyncResponse:
+    """Fully read HTTP response
+
+    Mirrors the parts of requests.Response the clients rely on, so the async
+    clients can handle results exactly like the sync ones.
+    """
+
+    def __init__(self, status_code, text, headers):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers
+
+    def json(self):
+        """Decode the response body as JSON"""
+        return decode_json(self.text)
+
+
+class AsyncTransport:
+    """Async HTTP transport sharing one aiohttp session across clients
+
+    Pass the same transport to AsyncTicketsClient and AsyncPeopleClient so
+    both use one connection pool and one concurrency limit.
+    """
+
+    def __init__(
+        self,
+        auth,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+        connection_limit=DEFAULT_CONNECTION_LIMIT,
+        timeout=DEFAULT_TIMEOUT,
+        rate_limiter=None,
+        throttle_retries=DEFAULT_THROTTLE_RETRIES,
+    ):
+        """Initialize the transport
+
+        Args:
+            auth: Authenticated TeamDynamixAuth instance
+            max_concurrency (int): Maximum requests in flight at once
+            connection_limit (int): Maximum open connections in the pool
+            timeout (float): Default total timeout for each request in seconds
+            rate_limiter (RateLimiter, optional): Scheduler shared with other
+                transports (default: the environment's shared limiter)
+            throttle_retries (int): Times a 429 response is waited out and retried
+        """
+        self.auth = auth
+        self.max_concurrency = max_concurrency
+        self.connection_limit = connection_limit
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter or get_rate_limiter(
+            getattr(auth, "environment", None) or auth.base_url
+        )
+        self.throttle_retries = throttle_retries
+
+        self._session = None
+        # Created once, so the limit holds across session rebuilds
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._login_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _get_session(self):
+        """Create the session lazily so it binds to the running event loop"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.connection_limit),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    def _token_valid(self):
+        """Check whether the auth token can still be used"""
+        token = getattr(self.auth, "token", None)
+        expiry = getattr(self.auth, "token_expiry", None)
+
+        if token and isinstance(expiry, datetime.datetime):
+            return expiry > datetime.datetime.now(expiry.tzinfo)
+        return bool(token)
+
+    async def _ensure_token(self):
+        """Log in again (off the event loop) if the token has expired"""
+        if self._token_valid():
+            return True
+
+        async with self._login_lock:
+            # Another task may have refreshed the token while we waited
+            if self._token_valid():
+                return True
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.auth.login)
+
+    async def request(self, method, endpoint, timeout=None, headers=None, **kwargs):
+        """Send an API request over the shared session
+
+        The request waits for a slot from the rate limiter, and a 429 response
+        is retried after the reset time the server reports.
+
+        Args:
+            method (str): HTTP method
+            endpoint (str): API endpoint relative to the base URL
+            timeout (float, optional): Override the default total timeout
+            headers (dict, optional): Extra headers to send
+            **kwargs: Passed through to aiohttp (json, params, data, ...)
+
+        Returns:
+            AsyncResponse: The response, or None if the request failed
+
+        Raises:
+            RateLimitError: If the request was still throttled after
+                throttle_retries retries
+        """
+        session = self._get_session()
+
+        if not await self._ensure_token():
+            print("Error: unable to authenticate request")
+            return None
+
+        request_headers = {
+            "Authorization": f"Bearer {self.auth.token}",
+            "Accept": "application/json",
+        }
+        if headers:
+            request_headers.update(headers)
+
+        url = f"{self.auth.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+
+        key = endpoint_key(method, endpoint)
+        for _ in range(self.throttle_retries + 1):
+            await self._acquire(key)
+            response = await self._send(session, method, url, request_headers, kwargs)
+            if not self.rate_limiter.update(key, response):
+                break
+        else:
+            raise RateLimitError(
+                f"{method} {endpoint} is still rate limited after "
+                f"{self.throttle_retries} retries",
+                response,
+            )
+
+        return response
+
+    async def _acquire(self, key):
+        """Take a rate limit slot without blocking the event loop"""
+        delay = self.rate_limiter.try_acquire(key)
+        if delay <= 0:
+            return
+
+        while delay > 0:
+            self.rate_limiter.record_wait(delay)
+            await asyncio.sleep(delay)
+            delay = self.rate_limiter.try_acquire(key)
+        self.rate_limiter.record_delayed()
+
+    async def _send(self, session, method, url, headers, kwargs):
+        """Send a single request, returning None on connection errors"""
+        async with self._semaphore:
+            try:
+                async with session.request(
+                    method, url, headers=headers, **kwargs
+                ) as response:
+                    text = await response.text()
+                    return AsyncResponse(response.status, text, response.headers)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"Error: {method} {url} failed: {str(e)}")
+                return None
+
+    async def close(self):
+        """Close the shared session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
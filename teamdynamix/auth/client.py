@@ -7,6 +7,8 @@ Handles authentication and environment selection for the TeamDynamix API
 
 import os
 from archive.teamdynamix_auth import TeamDynamixAuth
+from teamdynamix.auth.token_cache import TokenCache, TokenRefresher
+from teamdynamix.auth.user_cache import CurrentUserCache
 
 
 class AuthClient:
@@ -31,15 +33,37 @@ class AuthClient:
                 print("Invalid selection. Please try again.")
 
     @staticmethod
-    def authenticate(environment):
-        """Authenticate to the TeamDynamix API"""
+    def authenticate(environment, use_cache=True):
+        """Authenticate to the TeamDynamix API
+
+        A still-valid token from a previous run is reused instead of logging
+        in again, and the token is refreshed in the background before it
+        expires.
+
+        Args:
+            environment (str): Environment name ('sandbox' or 'production')
+            use_cache (bool): Whether to read and write the on-disk token cache
+        """
         auth = TeamDynamixAuth(environment=environment)
         print(f"\nUsing TeamDynamix API at: {auth.base_url}")
 
+        token_cache = TokenCache() if use_cache else None
+
         print("\nAuthenticating...", end="", flush=True)
-        if auth.login():
+        if token_cache and token_cache.load(auth):
+            print(" Using cached token.")
+        elif auth.login():
             print(" Success!")
-            user_info = auth.get_current_user()
+            if token_cache:
+                token_cache.save(auth)
+        else:
+            auth = None
+
+        if auth:
+            auth.token_refresher = TokenRefresher(auth, token_cache)
+            auth.token_refresher.start()
+            auth.current_user = CurrentUserCache(auth)
+            user_info = auth.current_user.get()
             if user_info:
                 print(f"Logged in as: {user_info.get('FullName', 'Unknown')}")
             print(f"Token expires at: {auth.token_expiry}")
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix API Rate Limit Module
+
+Per-endpoint token buckets learned from TeamDynamix rate limit headers
+"""
+
+import email.utils
+import re
+import threading
+import time
+
+DEFAULT_WINDOW = 60  # seconds between refills when the server gives no reset time
+DEFAULT_RETRY_DELAY = 5  # seconds, for a 429 without a usable reset time
+MAX_RESET_DELAY = 300  # seconds, cap on how long a reset time can make us wait
+
+# Path segments that identify a record rather than an endpoint
+_ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$"
+)
+
+# Routes whose last segment is a username, with the fixed names that can
+# take the same position
+_NAME_ROUTES = {
+    ("api", "people"): frozenset(("search", "lookup", "getuid")),
+    ("api", "people", "getuid"): frozenset(),
+}
+
+# One limiter per environment, shared by the sync and async transports
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def endpoint_key(method, endpoint):
+    """Normalize a request to the endpoint it is rate limited under
+
+    IDs and usernames are replaced with placeholders and the query string is
+    dropped, so "GET api/12/tickets/345?x=1" becomes
+    "GET api/{id}/tickets/{id}" and "GET api/people/jdoe" becomes
+    "GET api/people/{id}".
+
+    Args:
+        method (str): HTTP method
+        endpoint (str): API endpoint relative to the base URL
+
+    Returns:
+        str: The rate limit key
+    """
+    path = endpoint.split("?", 1)[0].strip("/")
+    segments = ["{id}" if _ID_SEGMENT.match(s) else s for s in path.split("/")]
+    fixed = _NAME_ROUTES.get(tuple(segments[:-1]))
+    if fixed is not None and segments[-1] not in fixed:
+        segments[-1] = "{id}"
+    return f"{method.upper()} {'/'.join(segments)}"
+
+
+class RateLimitError(Exception):
+    """A request was still throttled after every retry
+
+    Raised instead of returning, so a throttled call can't be mistaken for
+    an empty result or a missing record.
+
+    Attributes:
+        response: The last throttled (429) response
+    """
+
+    def __init__(self, message, response=None):
+        super().__init__(message)
+        self.response = response
+
+
+def _parse_reset(value):
+    """Convert a rate limit reset header to seconds from now
+
+    TeamDynamix sends an HTTP date; epoch seconds and relative seconds are
+    accepted as well.
+    """
+    if not value:
+        return None
+
+    try:
+        number = float(value)
+    except ValueError:
+        try:
+            reset_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return reset_at.timestamp() - time.time()
+
+    # Large numbers are absolute epoch times, small ones are relative
+    return number - time.time() if number > 1e9 else number
+
+
+class _Bucket:
+    """Token bucket for a single endpoint
+
+    Holds up to `limit` tokens and is refilled to that amount at the reset
+    time reported by the server, then every window after that.
+    """
+
+    def __init__(self):
+        self.limit = None
+        self.remaining = None
+        self.reset_at = None  # time.monotonic() of the next refill
+        self.window = DEFAULT_WINDOW
+        self.server_reset_at = None  # Last reset time reported by the server
+        self.window_learned = False
+
+    def refill(self, now):
+        """Refill the bucket if its reset time has passed"""
+        if self.reset_at is None or now < self.reset_at:
+            return
+        self.remaining = self.limit
+
+        if not self.window_learned:
+            # Assume a default window until a response reports when it ends
+            self.reset_at = now + self.window
+            return
+        while self.reset_at <= now:
+            self.reset_at += self.window
+
+    def learn_window(self, reset_at):
+        """Learn the window length from consecutive server reset times
+
+        Idle periods can skip windows, so the shortest gap seen is used.
+        """
+        previous = self.server_reset_at
+        self.server_reset_at = reset_at
+        if previous is None or reset_at - previous <= 1:
+            return
+
+        gap = reset_at - previous
+        if not self.window_learned or gap < self.window:
+            self.window = gap
+            self.window_learned = True
+
+    def take(self, now):
+        """Take a token, or return how long until the next refill"""
+        if self.limit is None:
+            return 0.0  # Limits not learned yet
+
+        self.refill(now)
+        if self.remaining > 0:
+            self.remaining -= 1
+            return 0.0
+        if self.reset_at is None:
+            self.reset_at = now + self.window
+        return max(self.reset_at - now, 0.001)
+
+
+class RateLimiter:
+    """Shared request scheduler honoring TeamDynamix rate limits
+
+    Requests take a token from their endpoint's bucket before they are sent
+    and wait for the next refill when the bucket is empty. Limits are learned
+    from the X-RateLimit-* headers, and a 429 response empties the bucket
+    until the reset time it reports.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._throttled_seconds = 0.0
+        self._delayed_requests = 0
+        self._throttled_responses = 0
+
+    def _bucket(self, key):
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket()
+        return bucket
+
+    def try_acquire(self, key):
+        """Take a request slot for an endpoint without blocking
+
+        Args:
+            key (str): Rate limit key from endpoint_key
+
+        Returns:
+            float: 0 if the request may be sent now, otherwise the seconds to
+            wait before trying again
+        """
+        with self._lock:
+            return self._bucket(key).take(time.monotonic())
+
+    def acquire(self, key):
+        """Take a request slot, sleeping until one is available
+
+        Args:
+            key (str): Rate limit key from endpoint_key
+        """
+        delayed = False
+        delay = self.try_acquire(key)
+        while delay > 0:
+            delayed = True
+            self.record_wait(delay)
+            time.sleep(delay)
+            delay = self.try_acquire(key)
+
+        if delayed:
+            self.record_delayed()
+
+    def record_wait(self, delay):
+        """Record time spent waiting on rate limits"""
+        with self._lock:
+            self._throttled_seconds += delay
+
+    def record_delayed(self):
+        """Record a request that had to wait for a slot"""
+        with self._lock:
+            self._delayed_requests += 1
+
+    def update(self, key, response):
+        """Learn limits from a response
+
+        Args:
+            key (str): Rate limit key from endpoint_key
+            response: Response with status_code and headers, or None
+
+        Returns:
+            bool: True if the request was throttled (429) and should be retried
+        """
+        if response is None:
+            return False
+
+        headers = response.headers
+        limit = headers.get("X-RateLimit-Limit")
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset_in = _parse_reset(headers.get("X-RateLimit-Reset"))
+        if reset_in is None:
+            reset_in = _parse_reset(headers.get("Retry-After"))
+        if reset_in is not None:
+            reset_in = min(max(reset_in, 0.0), MAX_RESET_DELAY)
+
+        throttled = response.status_code == 429
+
+        with self._lock:
+            bucket = self._bucket(key)
+            now = time.monotonic()
+
+            if limit is not None and limit.isdigit():
+                bucket.limit = max(int(limit), 1)
+            elif throttled and bucket.limit is None:
+                bucket.limit = 1  # Unknown limit, send one request per window
+
+            if bucket.limit is None:
+                return False
+
+            if bucket.remaining is None:
+                bucket.remaining = bucket.limit - 1
+
+            if reset_in is not None:
+                reset_at = now + reset_in
+                bucket.learn_window(reset_at)
+                if bucket.reset_at is not None and reset_at > bucket.reset_at + 1:
+                    # The server has already started a window we expected later
+                    bucket.refill(bucket.reset_at)
+                bucket.reset_at = reset_at
+            elif throttled:
+                bucket.reset_at = now + DEFAULT_RETRY_DELAY
+            elif bucket.reset_at is None:
+                bucket.reset_at = now + bucket.window
+
+            if remaining is not None and remaining.isdigit():
+                # Trust whichever count is lower, other requests may be in flight
+                bucket.remaining = min(bucket.remaining, int(remaining))
+
+            if throttled:
+                self._throttled_responses += 1
+                bucket.remaining = 0
+            return throttled
+
+    def get_stats(self):
+        """Get throttling statistics
+
+        Returns:
+            dict: Time spent throttled (summed across requests), delayed
+            request and 429 counts, and the learned limit for each endpoint
+        """
+        with self._lock:
+            return {
+                "throttled_seconds": self._throttled_seconds,
+                "delayed_requests": self._delayed_requests,
+                "throttled_responses": self._throttled_responses,
+                "endpoints": {
+                    key: {
+                        "limit": bucket.limit,
+                        "remaining": bucket.remaining,
+                        "window": bucket.window,
+                    }
+                    for key, bucket in self._buckets.items()
+                    if bucket.limit is not None
+                },
+            }
+
+
+def get_rate_limiter(environment):
+    """Get the shared rate limiter for an environment
+
+    Args:
+        environment (str): Environment name ('sandbox' or 'production')
+
+    Returns:
+        RateLimiter: Shared limiter for the environment
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(environment)
+        if limiter is None:
+            limiter = _limiters[environment] = RateLimiter()
+        return limiter
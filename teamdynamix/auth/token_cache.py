@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix API Token Cache Module
+
+Persists auth tokens between runs and refreshes them before they expire
+"""
+
+import datetime
+import hashlib
+import os
+import threading
+
+import jwt
+
+from teamdynamix.utils.storage import atomic_write_json, cache_dir, read_json
+
+# Tokens are refreshed (and not reused from disk) this long before they expire
+DEFAULT_REFRESH_MARGIN = 300  # seconds
+MIN_REFRESH_DELAY = 30  # minimum seconds between refresh attempts
+
+
+def get_username(auth):
+    """Get the username an auth object logs in with
+
+    Args:
+        auth: TeamDynamixAuth instance
+
+    Returns:
+        str: The username, or None if it can't be determined
+    """
+    username = getattr(auth, "username", None)
+    if username:
+        return username
+
+    environment = (getattr(auth, "environment", None) or "").upper()
+    return os.getenv(f"TDX_{environment}_USERNAME") or os.getenv("TD_USERNAME")
+
+
+def get_token_expiry(auth):
+    """Get the token expiry as a timezone-aware datetime
+
+    Uses auth.token_expiry when it is set, otherwise the JWT "exp" claim.
+
+    Args:
+        auth: TeamDynamixAuth instance
+
+    Returns:
+        datetime.datetime: Expiry in UTC, or None if unknown
+    """
+    expiry = getattr(auth, "token_expiry", None)
+    if isinstance(expiry, datetime.datetime):
+        if expiry.tzinfo is None:
+            expiry = expiry.astimezone()  # Naive values are local time
+        return expiry.astimezone(datetime.timezone.utc)
+
+    claims = get_token_claims(getattr(auth, "token", None))
+    if "exp" not in claims:
+        return None
+    return datetime.datetime.fromtimestamp(claims["exp"], datetime.timezone.utc)
+
+
+def get_token_claims(token):
+    """Read the claims of a JWT without verifying its signature
+
+    Args:
+        token (str): The JWT
+
+    Returns:
+        dict: The token claims, or an empty dict if it can't be decoded
+    """
+    if not token:
+        return {}
+
+    try:
+        return jwt.decode(token, options={"verify_signature": False})
+    except jwt.PyJWTError:
+        return {}
+
+
+class TokenCache:
+    """On-disk token cache keyed by environment and username
+
+    Each environment/username pair is stored in its own file, readable only
+    by the current user and replaced atomically on every save.
+    """
+
+    def __init__(self, directory=None, refresh_margin=DEFAULT_REFRESH_MARGIN):
+        """Initialize the cache
+
+        Args:
+            directory (str, optional): Where to store tokens (default: cache dir)
+            refresh_margin (float): Seconds before expiry a token counts as stale
+        """
+        self.directory = directory or cache_dir("tokens")
+        self.refresh_margin = refresh_margin
+
+    def _path(self, environment, username):
+        """Get the cache file for an environment and username"""
+        key = hashlib.sha256(f"{environment}:{username}".encode()).hexdigest()[:32]
+        return os.path.join(self.directory, f"{environment}-{key}.json")
+
+    def load(self, auth):
+        """Apply a cached token to the auth object if it is still fresh
+
+        Args:
+            auth: TeamDynamixAuth instance
+
+        Returns:
+            bool: True if a cached token was applied
+        """
+        username = get_username(auth)
+        if not username:
+            return False
+
+        entry = read_json(self._path(auth.environment, username))
+        if not entry or not entry.get("token") or not entry.get("expiry"):
+            return False
+
+        try:
+            expiry = datetime.datetime.fromisoformat(entry["expiry"])
+        except ValueError:
+            return False
+
+        now = datetime.datetime.now(datetime.timezone.utc)
+        if (expiry - now).total_seconds() <= self.refresh_margin:
+            return False
+
+        auth.token = entry["token"]
+        # Keep the naive local-time convention used by token_expiry
+        auth.token_expiry = expiry.astimezone().replace(tzinfo=None)
+        return True
+
+    def save(self, auth):
+        """Store the auth object's current token
+
+        Args:
+            auth: TeamDynamixAuth instance
+
+        Returns:
+            bool: True if the token was written
+        """
+        username = get_username(auth)
+        token = getattr(auth, "token", None)
+        expiry = get_token_expiry(auth)
+        if not username or not token or not expiry:
+            return False
+
+        try:
+            atomic_write_json(
+                self._path(auth.environment, username),
+                {"token": token, "expiry": expiry.isoformat()},
+            )
+        except OSError as e:
+            print(f"Warning: unable to write token cache: {str(e)}")
+            return False
+        return True
+
+    def clear(self, auth):
+        """Remove the cached token for the auth object"""
+        username = get_username(auth)
+        if not username:
+            return
+
+        try:
+            os.unlink(self._path(auth.environment, username))
+        except FileNotFoundError:
+            pass
+
+
+class TokenRefresher:
+    """Background thread that logs in again shortly before the token expires"""
+
+    def __init__(self, auth, cache=None, refresh_margin=DEFAULT_REFRESH_MARGIN):
+        """Initialize the refresher
+
+        Args:
+            auth: Authenticated TeamDynamixAuth instance
+            cache (TokenCache, optional): Cache updated after each refresh
+            refresh_margin (float): Seconds before expiry to refresh
+        """
+        self.auth = auth
+        self.cache = cache
+        self.refresh_margin = refresh_margin
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _seconds_until_refresh(self):
+        """Seconds to wait before the next refresh"""
+        expiry = get_token_expiry(self.auth)
+        if expiry is None:
+            return None
+
+        now = datetime.datetime.now(datetime.timezone.utc)
+        delay = (expiry - now).total_seconds() - self.refresh_margin
+        return max(delay, MIN_REFRESH_DELAY)
+
+    def _run(self):
+        while not self._stop.is_set():
+            delay = self._seconds_until_refresh()
+            if delay is None:
+                return  # Nothing to schedule without a known expiry
+
+            if self._stop.wait(delay):
+                return
+
+            # On failure the next pass retries after MIN_REFRESH_DELAY, and the
+            # transport still logs in on demand once the token has expired
+            if self.auth.login() and self.cache:
+                self.cache.save(self.auth)
+
+    def start(self):
+        """Start refreshing in a daemon thread"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="tdx-token-refresh", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background refresh"""
+        self._stop.set()
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix API Transport Module
+
+Pooled keep-alive HTTP transport shared by the API clients
+"""
+
+import inspect
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from teamdynamix.auth.ratelimit import (
+    RateLimitError,
+    endpoint_key,
+    get_rate_limiter,
+)
+
+# Default pool settings, can be overridden per environment with configure_transport
+DEFAULT_POOL_CONNECTIONS = 4
+DEFAULT_POOL_MAXSIZE = 16
+DEFAULT_KEEPALIVE_TIMEOUT = 60  # Seconds an idle pool is kept before recycling
+DEFAULT_TIMEOUT = (5, 30)  # (connect, read) seconds
+DEFAULT_THROTTLE_RETRIES = 5  # Times a 429 response is waited out and retried
+
+# One transport per environment, shared by every client in the process
+_transports = {}
+_transport_options = {}
+_transports_lock = threading.Lock()
+
+
+class Transport:
+    """Keep-alive connection pool and rate limiting for the auth class's requests
+
+    Requests still go through auth.make_api_request, which builds the headers
+    and logs in again when the token has expired. The transport mounts a sized
+    HTTPAdapter on the auth object's requests.Session so TCP/TLS connections
+    are reused between calls instead of being re-established every time.
+    """
+
+    def __init__(
+        self,
+        auth,
+        pool_connections=DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        keepalive_timeout=DEFAULT_KEEPALIVE_TIMEOUT,
+        timeout=DEFAULT_TIMEOUT,
+        pool_block=False,
+        rate_limiter=None,
+        throttle_retries=DEFAULT_THROTTLE_RETRIES,
+    ):
+        """Initialize the transport
+
+        Args:
+            auth: Authenticated TeamDynamixAuth instance
+            pool_connections (int): Number of host pools to cache
+            pool_maxsize (int): Maximum connections kept alive per host
+            keepalive_timeout (float): Idle seconds before pooled connections are dropped
+            timeout (float or tuple): Default timeout for each request
+            pool_block (bool): Wait for a free connection instead of opening extra ones
+            rate_limiter (RateLimiter, optional): Scheduler shared with other
+                transports (default: the environment's shared limiter)
+            throttle_retries (int): Times a 429 response is waited out and retried
+        """
+        self.auth = auth
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.pool_block = pool_block
+        self.rate_limiter = rate_limiter or get_rate_limiter(
+            getattr(auth, "environment", None) or auth.base_url
+        )
+        self.throttle_retries = throttle_retries
+
+        self._lock = threading.Lock()
+        self._adapter = None
+        self._pooling_warned = False
+        self._in_flight = 0
+        self._last_used = 0.0
+        self._sends_timeout = _accepts_timeout(auth.make_api_request)
+
+        # Counters reported by get_stats
+        self._closed_connections = 0  # From pools already recycled
+        self._requests = 0
+        self._pooled_requests = 0  # Sent while the pool was mounted
+        self._recycled = 0
+        self._errors = 0
+
+    def _mount_adapter(self):
+        """Mount a sized connection pool on the auth session (lock must be held)"""
+        session = getattr(self.auth, "session", None)
+        if not isinstance(session, requests.Session):
+            # The auth class manages its own connections
+            if not self._pooling_warned:
+                self._pooling_warned = True
+                print(
+                    "Warning: connection pooling is inactive, the auth object "
+                    "has no requests.Session"
+                )
+            return
+
+        self._adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+
+    def _close_adapter(self):
+        """Close the pooled connections and keep their counters (lock must be held)"""
+        if self._adapter is None:
+            return
+
+        self._closed_connections += _pool_connections(self._adapter)
+        self._adapter.close()
+        self._adapter = None
+
+    def _start_request(self):
+        """Count a request as in flight, recycling the pool if it sat idle too long"""
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._adapter is not None
+                and self._in_flight == 0
+                and self.keepalive_timeout is not None
+                and now - self._last_used > self.keepalive_timeout
+            ):
+                # Server side has most likely closed idle sockets by now
+                self._close_adapter()
+                self._recycled += 1
+
+            if self._adapter is None:
+                self._mount_adapter()
+
+            self._in_flight += 1
+            self._requests += 1
+            if self._adapter is not None:
+                self._pooled_requests += 1
+
+    def _finish_request(self):
+        """Count a request as done, starting the idle time of the pool"""
+        with self._lock:
+            self._in_flight -= 1
+            self._last_used = time.monotonic()
+
+    def request(self, method, endpoint, timeout=None, quiet=False, **kwargs):
+        """Send an API request through the auth class over the pooled connections
+
+        The request waits for a slot from the rate limiter, and a 429 response
+        is retried after the reset time the server reports.
+
+        Args:
+            method (str): HTTP method
+            endpoint (str): API endpoint relative to the base URL
+            timeout (float or tuple, optional): Override the default timeout
+            quiet (bool): Don't print connection errors, for callers that
+                report failures themselves
+            **kwargs: Passed through to auth.make_api_request (json, params, ...)
+
+        Returns:
+            requests.Response: The response, or None if the request failed
+
+        Raises:
+            RateLimitError: If the request was still throttled after
+                throttle_retries retries
+        """
+        key = endpoint_key(method, endpoint)
+        for _ in range(self.throttle_retries + 1):
+            # A throttled response empties the bucket, so the next acquire
+            # waits for the reset time the server reported
+            self.rate_limiter.acquire(key)
+            response = self._send(method, endpoint, timeout, quiet, **kwargs)
+            if not self.rate_limiter.update(key, response):
+                break
+        else:
+            raise RateLimitError(
+                f"{method} {endpoint} is still rate limited after "
+                f"{self.throttle_retries} retries",
+                response,
+            )
+
+        return response
+
+    def _send(self, method, endpoint, timeout, quiet, **kwargs):
+        """Send a single request, returning None on connection errors"""
+        if self._sends_timeout:
+            kwargs["timeout"] = timeout if timeout is not None else self.timeout
+
+        self._start_request()
+        try:
+            return self.auth.make_api_request(method, endpoint, **kwargs)
+        except requests.RequestException as e:
+            with self._lock:
+                self._errors += 1
+            if not quiet:
+                print(f"Error: request to {endpoint} failed: {str(e)}")
+            return None
+        finally:
+            self._finish_request()
+
+    def get_stats(self):
+        """Get connection reuse statistics
+
+        Only requests sent over the pool count towards reuse; when the auth
+        object has no session to pool, reuse is unknown and reported as None.
+
+        Returns:
+            dict: Request, connection and reuse counts for this transport
+        """
+        with self._lock:
+            connections = self._closed_connections
+            if self._adapter is not None:
+                connections += _pool_connections(self._adapter)
+
+            pooled = self._pooled_requests
+            reused = max(pooled - connections, 0) if pooled else None
+            return {
+                "requests": self._requests,
+                "pooled_requests": pooled,
+                "connections_opened": connections,
+                "connections_reused": reused,
+                "reuse_ratio": reused / pooled if pooled else None,
+                "sessions_recycled": self._recycled,
+                "errors": self._errors,
+            }
+
+    def close(self):
+        """Close all pooled connections"""
+        with self._lock:
+            self._close_adapter()
+
+
+def _accepts_timeout(func):
+    """Check whether a request function takes a timeout keyword argument"""
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return True  # Can't tell, assume it passes kwargs on to requests
+    return any(
+        p.name == "timeout" or p.kind is inspect.Parameter.VAR_KEYWORD
+        for p in parameters
+    )
+
+
+def _pool_connections(adapter):
+    """Count connections opened across an adapter's urllib3 pools"""
+    pool_manager = getattr(adapter, "poolmanager", None)
+    if pool_manager is None:
+        return 0
+
+    connections = 0
+    for key in list(pool_manager.pools.keys()):
+        pool = pool_manager.pools.get(key)
+        if pool is not None:
+            connections += pool.num_connections
+
+    return connections
+
+
+def configure_transport(environment, **options):
+    """Set pool options for an environment
+
+    Options apply to transports created after this call; an existing transport
+    for the environment is closed so the next request picks them up.
+
+    Args:
+        environment (str): Environment name ('sandbox' or 'production')
+        **options: Keyword arguments accepted by Transport
+    """
+    with _transports_lock:
+        _transport_options[environment] = options
+        transport = _transports.pop(environment, None)
+
+    if transport:
+        transport.close()
+
+
+def get_transport(auth):
+    """Get the shared transport for the auth object's environment
+
+    Args:
+        auth: Authenticated TeamDynamixAuth instance
+
+    Returns:
+        Transport: Shared transport for the environment
+    """
+    environment = getattr(auth, "environment", None) or auth.base_url
+
+    with _transports_lock:
+        transport = _transports.get(environment)
+        if transport is None or transport.auth is not auth:
+            if transport is not None:
+                # A new login for the same environment replaces the old transport
+                transport.close()
+            transport = Transport(auth, **_transport_options.get(environment, {}))
+            _transports[environment] = transport
+        return transport
+
+
+def close_transports():
+    """Close every shared transport"""
+    with _transports_lock:
+        transports = list(_transports.values())
+        _transports.clear()
+
+    for transport in transports:
+        transport.close()
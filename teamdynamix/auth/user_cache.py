@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix API Current User Module
+
+Caches the authenticated user for the lifetime of a session
+"""
+
+import threading
+import time
+
+from teamdynamix.auth.token_cache import get_token_claims
+
+DEFAULT_USER_TTL = 900  # seconds
+DEFAULT_FAILURE_TTL = 60  # seconds a failed lookup is remembered
+
+# Claims that change on every login and don't identify the user
+_VOLATILE_CLAIMS = ("exp", "iat", "nbf", "jti")
+
+
+def get_token_identity(token):
+    """Get the identifying claims of a token
+
+    Args:
+        token (str): The JWT
+
+    Returns:
+        tuple: Sorted identifying claims, or None if the token can't be decoded
+    """
+    claims = get_token_claims(token)
+    if not claims:
+        return None
+    return tuple(
+        sorted(
+            (key, str(value))
+            for key, value in claims.items()
+            if key not in _VOLATILE_CLAIMS
+        )
+    )
+
+
+class CurrentUserCache:
+    """Current user details, looked up once per authenticated session
+
+    The cached user is dropped when the TTL runs out, when the auth object
+    switches environment, or when a refreshed token belongs to someone else.
+    A failed lookup is remembered for a short time, so callers that ask on
+    every screen redraw don't wait on the network each time.
+    AuthClient.authenticate attaches one to the auth object as
+    auth.current_user.
+    """
+
+    def __init__(self, auth, ttl=DEFAULT_USER_TTL, failure_ttl=DEFAULT_FAILURE_TTL):
+        """Initialize the cache
+
+        Args:
+            auth: Authenticated TeamDynamixAuth instance
+            ttl (float): Seconds before the user is looked up again
+            failure_ttl (float): Seconds before a failed lookup is tried again
+        """
+        self.auth = auth
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        self._lock = threading.Lock()
+        self._user = None
+        self._fetched_at = 0.0
+        self._failed_at = None
+        self._environment = None
+        self._identity = None
+
+    def _same_session(self):
+        """Check the environment and token match the last lookup (lock must be held)"""
+        if self._environment != getattr(self.auth, "environment", None):
+            return False
+
+        identity = get_token_identity(getattr(self.auth, "token", None))
+        return identity is None or identity == self._identity
+
+    def _is_fresh(self):
+        """Check whether the cached user still applies (lock must be held)"""
+        if self._user is None:
+            return False
+        if time.monotonic() - self._fetched_at > self.ttl:
+            return False
+        return self._same_session()
+
+    def _failed_recently(self):
+        """Check whether a lookup failed within failure_ttl (lock must be held)"""
+        if self._failed_at is None:
+            return False
+        if time.monotonic() - self._failed_at > self.failure_ttl:
+            return False
+        return self._same_session()
+
+    def get(self, refresh=False):
+        """Get the current user
+
+        Args:
+            refresh (bool): Look the user up again even if a cached copy is
+                fresh or a recent lookup failed
+
+        Returns:
+            dict: Current user details or None if the lookup failed
+        """
+        with self._lock:
+            if not refresh:
+                if self._is_fresh():
+                    return self._user
+                if self._failed_recently():
+                    return None
+
+            user = self.auth.get_current_user()
+            self._environment = getattr(self.auth, "environment", None)
+            self._identity = get_token_identity(getattr(self.auth, "token", None))
+            if user:
+                self._user = user
+                self._fetched_at = time.monotonic()
+                self._failed_at = None
+            else:
+                self._user = None
+                self._failed_at = time.monotonic()
+            return user
+
+    def peek(self):
+        """Get the cached user without making a request
+
+        Returns:
+            dict: Cached user details, or None if there is no fresh copy
+        """
+        with self._lock:
+            return self._user if self._is_fresh() else None
+
+    def invalidate(self):
+        """Drop the cached user"""
+        with self._lock:
+            self._user = None
+            self._failed_at = None
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix API Async People Module
+
+Asyncio variant of the people client
+"""
+
+import urllib.parse
+
+from teamdynamix.auth.async_transport import AsyncTransport
+
+
+class AsyncPeopleClient:
+    """Asyncio client for people-related operations in TeamDynamix API
+
+    Methods return the same dicts and lists as PeopleClient. Requests still rate
+    limited after the transport's retries raise RateLimitError.
+    """
+
+    def __init__(self, auth, transport=None):
+        """Initialize with authentication client
+
+        Args:
+            auth: Authenticated TeamDynamixAuth instance
+            transport (AsyncTransport, optional): Shared transport to use, left
+                open on exit for its owner to close
+        """
+        self.auth = auth
+        self._owns_transport = transport is None
+        self.transport = transport or AsyncTransport(auth)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._owns_transport:
+            await self.transport.close()
+
+    async def search_people(self, search_text, max_results=50):
+        """Search for people in TeamDynamix
+
+        Args:
+            search_text (str): Text to search for (name, email, etc.)
+            max_results (int): Maximum number of results to return (1-100)
+
+        Returns:
+            list: List of people matching the search criteria
+        """
+        if not search_text:
+            return []
+
+        if max_results < 1 or max_results > 100:
+            max_results = 50
+
+        encoded_search = urllib.parse.quote(search_text)
+        endpoint = (
+            f"api/people/lookup?searchText={encoded_search}&maxResults={max_results}"
+        )
+        response = await self.transport.request("GET", endpoint)
+
+        if response and response.status_code == 200:
+            return response.json()
+        else:
+            print("Error performing person lookup")
+            if response:
+                print(f"Status code: {response.status_code}")
+                print(f"Response: {response.text[:200]}...")
+            return []
+
+    async def get_person_by_uid(self, uid):
+        """Get detailed information about a person by UID
+
+        Args:
+            uid (str): The UID of the person to retrieve
+
+        Returns:
+            dict: Person details or None if not found
+        """
+        if not uid:
+            return None
+
+        response = await self.transport.request("GET", f"api/people/{uid}")
+
+        if response and response.status_code == 200:
+            return response.json()
+        else:
+            print(f"Error retrieving person with UID {uid}")
+            if response:
+                print(f"Status code: {response.status_code}")
+                print(f"Response: {response.text[:200]}...")
+            return None
+
+    async def get_person_by_username(self, username):
+        """Get person information by username
+
+        Args:
+            username (str): The username to look up
+
+        Returns:
+            dict: Person details or None if not found
+        """
+        if not username:
+            return None
+
+        response = await self.transport.request("GET", f"api/people/{username}")
+
+        if response and response.status_code == 200:
+            return response.json()
+        else:
+            print(f"Error retrieving person with username {username}")
+            if response:
+                print(f"Status code: {response.status_code}")
+                print(f"Response: {response.text[:200]}...")
+            return None
+
+    async def get_uid_by_username(self, username):
+        """Get person's UID by their username
+
+        Args:
+            username (str): The username to look up
+
+        Returns:
+            str: The UID of the person or None if not found
+        """
+        if not username:
+            return None
+
+        response = await self.transport.request(
+            "GET", f"api/people/getuid/{username}"
+        )
+
+        if response and response.status_code == 200:
+            return response.text.strip('"')  # API returns the UID as a JSON string
+        else:
+            print(f"Error retrieving UID for username {username}")
+            if response:
+                print(f"Status code: {response.status_code}")
+                print(f"Response: {response.text[:200]}...")
+            return None
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix API People Cache Module
+
+Bounded LRU/TTL cache for person lookups by UID and username
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_MAX_SIZE = 5000  # people kept in memory
+DEFAULT_TTL = 900  # seconds a person stays cached
+DEFAULT_NEGATIVE_TTL = 60  # seconds a failed lookup stays cached
+
+# People caches shared by every PeopleClient, keyed by environment
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_username(person):
+    """Get a person's username from their record
+
+    Args:
+        person (dict): Person details
+
+    Returns:
+        str: The username, or None if the record has none
+    """
+    return person.get("UserName") or person.get("Username")
+
+
+class PeopleCache:
+    """LRU cache of people shared by UID and username lookups
+
+    A person fetched by UID also answers lookups by their username and the
+    reverse. Lookups the API couldn't answer are remembered for a short
+    time so repeated bad usernames don't hit the server again. People are
+    copied going in and out, so callers can change what they get back.
+    """
+
+    def __init__(
+        self,
+        max_size=DEFAULT_MAX_SIZE,
+        ttl=DEFAULT_TTL,
+        negative_ttl=DEFAULT_NEGATIVE_TTL,
+    ):
+        """Initialize the cache
+
+        Args:
+            max_size (int): Maximum people (and username to UID mappings) kept
+            ttl (float): Seconds a person stays cached
+            negative_ttl (float): Seconds a not-found lookup stays cached
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+
+        self._lock = threading.Lock()
+        self._people = OrderedDict()  # uid -> (expires_at, person)
+        self._usernames = {}  # username -> uid, for people in _people
+        self._uids = OrderedDict()  # username -> (expires_at, uid), UID-only lookups
+        self._missing = OrderedDict()  # (kind, key) -> expires_at
+
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(value):
+        return str(value).strip().casefold()
+
+    def _live_person(self, uid, now):
+        """Get a cached person if not expired (lock must be held)"""
+        entry = self._people.get(uid)
+        if entry is None:
+            return None
+        expires_at, person = entry
+        if now >= expires_at:
+            self._remove_person(uid)
+            return None
+        self._people.move_to_end(uid)
+        return person
+
+    def _remove_person(self, uid):
+        """Drop a person and their username index entry (lock must be held)"""
+        _, person = self._people.pop(uid)
+        username = get_username(person)
+        if username and self._usernames.get(self._key(username)) == uid:
+            del self._usernames[self._key(username)]
+
+    def _is_missing(self, kind, key, now):
+        """Check the negative cache (lock must be held)"""
+        expires_at = self._missing.get((kind, key))
+        if expires_at is None:
+            return False
+        if now >= expires_at:
+            del self._missing[(kind, key)]
+            return False
+        return True
+
+    def _record(self, found, missing=False):
+        """Update the hit/miss counters (lock must be held)"""
+        if missing:
+            self.negative_hits += 1
+        elif found:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def get_by_uid(self, uid):
+        """Look up a person by UID
+
+        Args:
+            uid (str): The UID of the person
+
+        Returns:
+            tuple: (cached, person), where cached is False on a cache miss and
+            person is None for a cached not-found result
+        """
+        key = self._key(uid)
+        now = time.monotonic()
+        with self._lock:
+            person = self._live_person(key, now)
+            if person is not None:
+                self._record(True)
+                return True, copy.deepcopy(person)
+            if self._is_missing("uid", key, now):
+                self._record(False, missing=True)
+                return True, None
+            self._record(False)
+            return False, None
+
+    def get_by_username(self, username):
+        """Look up a person by username
+
+        Returns:
+            tuple: (cached, person), as for get_by_uid
+        """
+        key = self._key(username)
+        now = time.monotonic()
+        with self._lock:
+            uid = self._usernames.get(key)
+            person = self._live_person(uid, now) if uid else None
+            if person is not None:
+                self._record(True)
+                return True, copy.deepcopy(person)
+            if self._is_missing("username", key, now):
+                self._record(False, missing=True)
+                return True, None
+            self._record(False)
+            return False, None
+
+    def get_uid(self, username):
+        """Look up a UID by username
+
+        Returns:
+            tuple: (cached, uid), where uid is None for a cached not-found result
+        """
+        key = self._key(username)
+        now = time.monotonic()
+        with self._lock:
+            uid = self._usernames.get(key)
+            if uid and self._live_person(uid, now) is not None:
+                self._record(True)
+                return True, self._people[uid][1].get("UID", uid)
+
+            entry = self._uids.get(key)
+            if entry is not None:
+                expires_at, uid = entry
+                if now < expires_at:
+                    self._uids.move_to_end(key)
+                    self._record(True)
+                    return True, uid
+                del self._uids[key]
+
+            if self._is_missing("username", key, now):
+                self._record(False, missing=True)
+                return True, None
+            self._record(False)
+            return False, None
+
+    def put_person(self, person):
+        """Cache a person under their UID and username
+
+        Args:
+            person (dict): Person details including "UID"
+        """
+        if not person or not person.get("UID"):
+            return
+
+        uid = self._key(person["UID"])
+        username = get_username(person)
+        person = copy.deepcopy(person)
+        with self._lock:
+            if uid in self._people:
+                self._remove_person(uid)
+            self._people[uid] = (time.monotonic() + self.ttl, person)
+            self._missing.pop(("uid", uid), None)
+            if username:
+                self._usernames[self._key(username)] = uid
+                self._missing.pop(("username", self._key(username)), None)
+
+            while len(self._people) > self.max_size:
+                self._remove_person(next(iter(self._people)))
+                self.evictions += 1
+
+    def put_uid(self, username, uid):
+        """Cache the UID for a username
+
+        Args:
+            username (str): The username
+            uid (str): The UID returned for it
+        """
+        key = self._key(username)
+        with self._lock:
+            self._uids[key] = (time.monotonic() + self.ttl, uid)
+            self._uids.move_to_end(key)
+            self._missing.pop(("username", key), None)
+            while len(self._uids) > self.max_size:
+                self._uids.popitem(last=False)
+                self.evictions += 1
+
+    def put_missing(self, kind, value):
+        """Remember that a lookup found nothing
+
+        Args:
+            kind (str): "uid" or "username"
+            value (str): The UID or username that wasn't found
+        """
+        key = (kind, self._key(value))
+        with self._lock:
+            self._missing[key] = time.monotonic() + self.negative_ttl
+            self._missing.move_to_end(key)
+            while len(self._missing) > self.max_size:
+                self._missing.popitem(last=False)
+
+    def get_stats(self):
+        """Get cache statistics
+
+        Returns:
+            dict: Hit, miss, negative hit and eviction counts and current size
+        """
+        with self._lock:
+            lookups = self.hits + self.misses + self.negative_hits
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "negative_hits": self.negative_hits,
+                "hit_ratio": (
+                    (self.hits + self.negative_hits) / lookups if lookups else 0.0
+                ),
+                "evictions": self.evictions,
+                "people": len(self._people),
+                "uids": len(self._uids),
+                "missing": len(self._missing),
+            }
+
+    def clear(self):
+        """Drop every cached entry"""
+        with self._lock:
+            self._people.clear()
+            self._usernames.clear()
+            self._uids.clear()
+            self._missing.clear()
+
+
+def get_people_cache(environment):
+    """Get the shared people cache for an environment
+
+    Args:
+        environment (str): Environment name ('sandbox' or 'production')
+
+    Returns:
+        PeopleCache: Shared cache for the environment
+    """
+    with _caches_lock:
+        cache = _caches.get(environment)
+        if cache is None:
+            cache = _caches[environment] = PeopleCache()
+        return cache
@@ -6,22 +6,54 @@ Handles operations related to people in TeamDynamix
 """
 
 import json
+import time
 import urllib.parse
 
+from teamdynamix.auth.transport import get_transport
+from teamdynamix.people.cache import get_people_cache
+from teamdynamix.people.directory import (
+    DEFAULT_PAGE_SIZE,
+    download_people,
+    open_people_directory,
+)
+from teamdynamix.utils.decode import decode_response, project
+from teamdynamix.utils.export import export_ndjson
+from teamdynamix.utils.models import Person, json_default
+
+# Responses cached as "not found" by the people cache
+NOT_FOUND_STATUS_CODES = (400, 404)
+
 
 class PeopleClient:
-    """Client for people-related operations in TeamDynamix API"""
+    """Client for people-related operations in TeamDynamix API
+
+    A request that is still rate limited after the transport's retries
+    raises RateLimitError rather than looking like an empty result.
+    """
 
     def __init__(self, auth):
         """Initialize with authentication client"""
         self.auth = auth
+        self.transport = get_transport(auth)
+        self.cache = get_people_cache(
+            getattr(auth, "environment", None) or auth.base_url
+        )
+        self._directory = None
 
-    def search_people(self, search_text, max_results=50):
+    def search_people(
+        self, search_text, max_results=50, local=False, fields=None, records=False
+    ):
         """Search for people in TeamDynamix
 
         Args:
             search_text (str): Text to search for (name, email, etc.)
-            max_results (int): Maximum number of results to return (1-100)
+            max_results (int): Maximum number of results to return (1-100, or
+                any number / None for no cap when searching locally)
+            local (bool): Search the local people directory instead of the API
+                (see sync_directory)
+            fields (iterable, optional): Only keep these person fields, which
+                skips decoding the rest (e.g. ["UID", "FullName"])
+            records (bool): Return compact Person records instead of dicts
 
         Returns:
             list: List of people matching the search criteria
@@ -29,6 +61,14 @@ class PeopleClient:
         if not search_text:
             return []
 
+        if records:
+            people = self.search_people(search_text, max_results, local, fields)
+            return list(Person.wrap(people))
+
+        if local:
+            people = self.get_directory().search(search_text, max_results)
+            return people if fields is None else project(people, fields)
+
         if max_results < 1 or max_results > 100:
             max_results = 50
 
@@ -41,13 +81,13 @@ class PeopleClient:
         )
 
         # Make the API request
-        response = self.auth.make_api_request("GET", endpoint)
+        response = self.transport.request("GET", endpoint)
 
         if response and response.status_code == 200:
-            return response.json()
+            return decode_response(response, fields)
         else:
             print("Error performing person lookup")
-            if response:
+            if response is not None:
                 print(f"Status code: {response.status_code}")
                 print(f"Response: {response.text[:200]}...")
             return []
@@ -64,17 +104,25 @@ class PeopleClient:
         if not uid:
             return None
 
+        cached, person = self.cache.get_by_uid(uid)
+        if cached:
+            return person
+
         # Construct the endpoint URL
         endpoint = f"api/people/{uid}"
 
         # Make the API request
-        response = self.auth.make_api_request("GET", endpoint)
+        response = self.transport.request("GET", endpoint)
 
         if response and response.status_code == 200:
-            return response.json()
+            person = decode_response(response)
+            self.cache.put_person(person)
+            return person
         else:
+            if response is not None and response.status_code in NOT_FOUND_STATUS_CODES:
+                self.cache.put_missing("uid", uid)
             print(f"Error retrieving person with UID {uid}")
-            if response:
+            if response is not None:
                 print(f"Status code: {response.status_code}")
                 print(f"Response: {response.text[:200]}...")
             return None
@@ -91,17 +139,25 @@ class PeopleClient:
         if not username:
             return None
 
+        cached, person = self.cache.get_by_username(username)
+        if cached:
+            return person
+
         # Construct the endpoint URL
         endpoint = f"api/people/{username}"
 
         # Make the API request
-        response = self.auth.make_api_request("GET", endpoint)
+        response = self.transport.request("GET", endpoint)
 
         if response and response.status_code == 200:
-            return response.json()
+            person = decode_response(response)
+            self.cache.put_person(person)
+            return person
         else:
+            if response is not None and response.status_code in NOT_FOUND_STATUS_CODES:
+                self.cache.put_missing("username", username)
             print(f"Error retrieving person with username {username}")
-            if response:
+            if response is not None:
                 print(f"Status code: {response.status_code}")
                 print(f"Response: {response.text[:200]}...")
             return None
@@ -118,21 +174,113 @@ class PeopleClient:
         if not username:
             return None
 
+        cached, uid = self.cache.get_uid(username)
+        if cached:
+            return uid
+
         # Construct the endpoint URL
         endpoint = f"api/people/getuid/{username}"
 
         # Make the API request
-        response = self.auth.make_api_request("GET", endpoint)
+        response = self.transport.request("GET", endpoint)
 
         if response and response.status_code == 200:
-            return response.text.strip('"')  # API returns the UID as a JSON string
+            uid = response.text.strip('"')  # API returns the UID as a JSON string
+            self.cache.put_uid(username, uid)
+            return uid
         else:
+            if response is not None and response.status_code in NOT_FOUND_STATUS_CODES:
+                self.cache.put_missing("username", username)
             print(f"Error retrieving UID for username {username}")
-            if response:
+            if response is not None:
+                print(f"Status code: {response.status_code}")
+                print(f"Response: {response.text[:200]}...")
+            return None
+
+    def get_directory(self):
+        """Get the local people directory for this environment
+
+        Returns:
+            PeopleDirectory: The directory, opened on first use
+        """
+        if self._directory is None:
+            self._directory = open_people_directory(
+                getattr(self.auth, "environment", None) or "default"
+            )
+        return self._directory
+
+    def sync_directory(self, search_params=None, page_size=DEFAULT_PAGE_SIZE):
+        """Download people into the local directory
+
+        Searches that may have been cut off are split up (see
+        download_people). Without search parameters every person is
+        downloaded, and if the download is known to be complete, people no
+        longer returned by the API are removed from the directory.
+
+        Args:
+            search_params (dict, optional): People search filters (e.g. IsActive)
+            page_size (int): MaxResults sent with each search
+
+        Returns:
+            int: Number of people stored, or None if the download failed
+        """
+        full_sync = not search_params
+        search_params = dict(search_params or {})
+        search_params.pop("MaxResults", None)
+
+        def search(params):
+            response = self.transport.request("POST", "api/people/search", json=params)
+            if response is not None and response.status_code == 200:
+                return decode_response(response)
+            print("Error downloading people directory")
+            if response is not None:
                 print(f"Status code: {response.status_code}")
                 print(f"Response: {response.text[:200]}...")
             return None
 
+        started_at = time.time()
+        people, complete = download_people(
+            search, search_params, page_size, self._fetch_account_ids
+        )
+        if people is None:
+            return None
+
+        directory = self.get_directory()
+        count = directory.upsert(people)
+        if full_sync and complete:
+            directory.remove_older_than(started_at)
+            directory.set_meta("last_full_sync", started_at)
+        elif full_sync:
+            print(
+                "Warning: the people download may be incomplete, "
+                "people it didn't return were kept"
+            )
+        return count
+
+    def _fetch_account_ids(self):
+        """Get the IDs of all accounts (departments), or None on failure"""
+        response = self.transport.request("GET", "api/accounts")
+        if response is not None and response.status_code == 200:
+            return [
+                account["ID"]
+                for account in decode_response(response)
+                if account.get("ID") is not None
+            ]
+        return None
+
+    def export_people(self, people, filename, compression="auto"):
+        """Stream people to an NDJSON file (one person per line)
+
+        Args:
+            people (iterable): People to export
+            filename (str): Destination file; a .gz or .zst suffix compresses it
+            compression (str): "gzip", "zstd", None, or "auto" (from the suffix)
+
+        Returns:
+            int: Number of people written
+        """
+        return export_ndjson(people, filename, compression)
+
     def save_person_to_file(self, person, filename=None):
         """Save person details to a JSON file
 
@@ -150,6 +298,6 @@ class PeopleClient:
             filename = f"person_{person.get('UID', 'unknown')}.json"
 
         with open(filename, "w") as f:
-            json.dump(person, f, indent=2)
+            json.dump(person, f, indent=2, default=json_default)
 
         return filename
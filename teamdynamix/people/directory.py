@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix API People Directory Module
+
+Local SQLite copy of the people directory with full-text search
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from teamdynamix.people.cache import get_username
+from teamdynamix.utils.decode import decode_json
+from teamdynamix.utils.models import json_default
+from teamdynamix.utils.storage import cache_dir
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS people (
+    uid TEXT PRIMARY KEY,
+    username TEXT,
+    full_name TEXT,
+    email TEXT,
+    title TEXT,
+    is_active INTEGER,
+    data TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS people_username ON people (username COLLATE NOCASE);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS people_fts USING fts5(
+    full_name, email, username, title,
+    content='people', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS people_ai AFTER INSERT ON people BEGIN
+    INSERT INTO people_fts (rowid, full_name, email, username, title)
+    VALUES (new.rowid, new.full_name, new.email, new.username, new.title);
+END;
+CREATE TRIGGER IF NOT EXISTS people_ad AFTER DELETE ON people BEGIN
+    INSERT INTO people_fts (people_fts, rowid, full_name, email, username, title)
+    VALUES ('delete', old.rowid, old.full_name, old.email, old.username, old.title);
+END;
+CREATE TRIGGER IF NOT EXISTS people_au AFTER UPDATE ON people BEGIN
+    INSERT INTO people_fts (people_fts, rowid, full_name, email, username, title)
+    VALUES ('delete', old.rowid, old.full_name, old.email, old.username, old.title);
+    INSERT INTO people_fts (rowid, full_name, email, username, title)
+    VALUES (new.rowid, new.full_name, new.email, new.username, new.title);
+END;
+"""
+
+# Same word boundaries the FTS tokenizer uses, so "bob@byui" matches emails
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+# MaxResults sent with each directory search
+DEFAULT_PAGE_SIZE = 1000
+
+
+def download_people(search, search_params, page_size, list_accounts=None):
+    """Run a people search in parts small enough to come back whole
+
+    The people search has no paging, so a search that returns page_size
+    people (and may have been cut off) is split up: first into active and
+    inactive people, then by account. A part counts as complete when it
+    returns fewer than page_size people. Splitting by account can't reach
+    people outside the listed accounts, so it never counts as complete.
+
+    Args:
+        search (callable): Takes a search body and returns a list of people,
+            or None if the request failed
+        search_params (dict): People search filters
+        page_size (int): MaxResults sent with each search
+        list_accounts (callable, optional): Returns account IDs to split by
+
+    Returns:
+        tuple: (people, complete), or (None, False) if a request failed
+    """
+    people = search(dict(search_params, MaxResults=page_size))
+    if people is None:
+        return None, False
+    if len(people) < page_size:
+        return people, True
+
+    if "IsActive" not in search_params:
+        parts = [dict(search_params, IsActive=active) for active in (True, False)]
+        complete = True
+    elif "AccountIDs" not in search_params and list_accounts is not None:
+        account_ids = list_accounts()
+        if not account_ids:
+            return people, False
+        parts = [dict(search_params, AccountIDs=[i]) for i in account_ids]
+        complete = False
+    else:
+        return people, False
+
+    result = []
+    for part in parts:
+        found, part_complete = download_people(search, part, page_size, list_accounts)
+        if found is None:
+            return None, False
+        result.extend(found)
+        complete = complete and part_complete
+    return result, complete
+
+
+class PeopleDirectory:
+    """People stored locally in SQLite with FTS5 indexes
+
+    Name, email, username and title are full-text indexed, so search
+    answers locally without the 100-result cap of the lookup endpoint.
+    If SQLite was built without FTS5, search falls back to LIKE matching.
+    """
+
+    def __init__(self, path):
+        """Open (and create if needed) a directory database
+
+        Args:
+            path (str): SQLite database file, or ":memory:"
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        try:
+            self._conn.executescript(_FTS_SCHEMA)
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            self.has_fts = False
+        self._conn.commit()
+
+        if path != ":memory:":
+            os.chmod(path, 0o600)
+
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM people").fetchone()[0]
+
+    def upsert(self, people):
+        """Add or replace people in the directory
+
+        Args:
+            people (iterable): Person records as returned by the API
+
+        Returns:
+            int: Number of people stored
+        """
+        now = time.time()
+        rows = [
+            (
+                person["UID"],
+                get_username(person),
+                person.get("FullName"),
+                person.get("PrimaryEmail"),
+                person.get("Title"),
+                None if person.get("IsActive") is None else int(person["IsActive"]),
+                json.dumps(person, default=json_default),
+                now,
+            )
+            for person in people
+            if person and person.get("UID")
+        ]
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO people "
+                "(uid, username, full_name, email, title, is_active, data, synced_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (uid) DO UPDATE SET "
+                "username = excluded.username, full_name = excluded.full_name, "
+                "email = excluded.email, title = excluded.title, "
+                "is_active = excluded.is_active, data = excluded.data, "
+                "synced_at = excluded.synced_at",
+                rows,
+            )
+            self._conn.commit()
+        return len(rows)
+
+    def remove_older_than(self, timestamp):
+        """Remove people not seen by a sync since the given time
+
+        Args:
+            timestamp (float): Epoch seconds the last full sync started
+
+        Returns:
+            int: Number of people removed
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM people WHERE synced_at < ?", (timestamp,)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def search(self, search_text, max_results=None, active_only=False, ranked=False):
+        """Search the directory
+
+        Every word in the search text must match the start of a word in the
+        person's name, email, username or title.
+
+        Args:
+            search_text (str): Text to search for (name, email, etc.)
+            max_results (int, optional): Maximum number of results (no cap if None)
+            active_only (bool): Only return active people
+            ranked (bool): Order by relevance; this has to score every match,
+                so broad searches get slower
+
+        Returns:
+            list: Matching person records
+        """
+        words = _WORD.findall(search_text or "")
+        if not words:
+            return []
+
+        limit = -1 if max_results is None else max(int(max_results), 0)
+        active = " AND p.is_active = 1" if active_only else ""
+
+        if self.has_fts:
+            query = " AND ".join(f'"{word}"*' for word in words)
+            order = " ORDER BY rank" if ranked else ""
+            sql = (
+                "SELECT p.data FROM people_fts f JOIN people p ON p.rowid = f.rowid "
+                f"WHERE people_fts MATCH ?{active}{order} LIMIT ?"
+            )
+            params = [query, limit]
+        else:
+            clause = " AND ".join(
+                "(p.full_name LIKE ? OR p.email LIKE ? OR p.username LIKE ? "
+                "OR p.title LIKE ?)"
+                for _ in words
+            )
+            order = " ORDER BY p.full_name" if ranked else ""
+            sql = f"SELECT p.data FROM people p WHERE {clause}{active}{order} LIMIT ?"
+            params = [f"%{word}%" for word in words for _ in range(4)] + [limit]
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [decode_json(row[0]) for row in rows]
+
+    def get_by_uid(self, uid):
+        """Get a person by UID
+
+        Returns:
+            dict: Person details or None if not in the directory
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM people WHERE uid = ?", (uid,)
+            ).fetchone()
+        return decode_json(row[0]) if row else None
+
+    def get_by_username(self, username):
+        """Get a person by username (case-insensitive)
+
+        Returns:
+            dict: Person details or None if not in the directory
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM people WHERE username = ? COLLATE NOCASE",
+                (username,),
+            ).fetchone()
+        return decode_json(row[0]) if row else None
+
+    def get_meta(self, key, default=None):
+        """Read a directory setting such as the last sync time"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key, value):
+        """Store a directory setting"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO meta (key, value) VALUES (?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                (key, str(value)),
+            )
+            self._conn.commit()
+
+
+def open_people_directory(environment):
+    """Open the people directory for an environment in the cache directory
+
+    Args:
+        environment (str): Environment name ('sandbox' or 'production')
+
+    Returns:
+        PeopleDirectory: The environment's directory
+    """
+    return PeopleDirectory(os.path.join(cache_dir("people"), f"{environment}.sqlite3"))
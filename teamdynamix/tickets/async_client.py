@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix API Async Tickets Module
+
+Asyncio variant of the tickets client
+"""
+
+from teamdynamix.auth.async_transport import AsyncTransport
+
+
+class AsyncTicketsClient:
+    """Asyncio client for tickets-related operations in TeamDynamix API
+
+    Methods return the same dicts and lists as TicketsClient. Requests still rate
+    limited after the transport's retries raise RateLimitError.
+    """
+
+    def __init__(self, auth, transport=None):
+        """Initialize with authentication client
+
+        Args:
+            auth: Authenticated TeamDynamixAuth instance
+            transport (AsyncTransport, optional): Shared transport to use, left
+                open on exit for its owner to close
+        """
+        self.auth = auth
+        self._owns_transport = transport is None
+        self.transport = transport or AsyncTransport(auth)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._owns_transport:
+            await self.transport.close()
+
+    async def get_ticket(self, app_id, ticket_id):
+        """Get detailed information about a ticket by ID
+
+        Args:
+            app_id (str): The application ID
+            ticket_id (str): The ticket ID to retrieve
+
+        Returns:
+            dict: Ticket details or None if not found
+        """
+        if not app_id or not ticket_id:
+            return None
+
+        endpoint = f"api/{app_id}/tickets/{ticket_id}"
+        response = await self.transport.request("GET", endpoint)
+
+        if response and response.status_code == 200:
+            return response.json()
+        else:
+            print(f"Error retrieving ticket with ID {ticket_id}")
+            if response:
+                print(f"Status code: {response.status_code}")
+                print(f"Response: {response.text[:200]}...")
+            return None
+
+    async def search_tickets(self, app_id, search_params=None):
+        """Search for tickets with given parameters
+
+        Args:
+            app_id (str): The application ID
+            search_params (dict): Parameters for ticket search
+
+        Returns:
+            list: List of tickets matching the search criteria
+        """
+        if not app_id:
+            return []
+
+        if not search_params:
+            search_params = {}
+
+        endpoint = f"api/{app_id}/tickets/search"
+        response = await self.transport.request("POST", endpoint, json=search_params)
+
+        if response and response.status_code == 200:
+            return response.json()
+        else:
+            print("Error performing ticket search")
+            if response:
+                print(f"Status code: {response.status_code}")
+                print(f"Response: {response.text[:200]}...")
+            return []
+
+    async def create_ticket(
+        self, app_id, ticket_data, notify_requestor=True, notify_responsible=True
+    ):
+        """Create a new ticket
+
+        Args:
+            app_id (str): The application ID
+            ticket_data (dict): The ticket data to submit
+            notify_requestor (bool): Whether to notify the requestor
+            notify_responsible (bool): Whether to notify the responsible resource
+
+        Returns:
+            dict: The created ticket or None if failed
+        """
+        if not app_id or not ticket_data:
+            return None
+
+        endpoint = f"api/{app_id}/tickets?NotifyRequestor={str(notify_requestor).lower()}&NotifyResponsible={str(notify_responsible).lower()}"
+        response = await self.transport.request("POST", endpoint, json=ticket_data)
+
+        if response and response.status_code == 201:  # 201 Created
+            return response.json()
+        else:
+            print("Error creating ticket")
+            if response:
+                print(f"Status code: {response.status_code}")
+                print(f"Response: {response.text[:200]}...")
+            return None
+
+    async def update_ticket(
+        self, app_id, ticket_id, ticket_data, notify_new_responsible=True
+    ):
+        """Update an existing ticket
+
+        Args:
+            app_id (str): The application ID
+            ticket_id (str): The ticket ID to update
+            ticket_data (dict): The updated ticket data
+            notify_new_responsible (bool): Whether to notify new responsible resources
+
+        Returns:
+            dict: The updated ticket or None if failed
+        """
+        if not app_id or not ticket_id or not ticket_data:
+            return None
+
+        endpoint = f"api/{app_id}/tickets/{ticket_id}?notifyNewResponsible={str(notify_new_responsible).lower()}"
+        response = await self.transport.request("POST", endpoint, json=ticket_data)
+
+        if response and response.status_code == 200:
+            return response.json()
+        else:
+            print(f"Error updating ticket with ID {ticket_id}")
+            if response:
+                print(f"Status code: {response.status_code}")
+                print(f"Response: {response.text[:200]}...")
+            return None
+
+    async def get_ticket_statuses(self, app_id):
+        """Get available ticket statuses for the application
+
+        Args:
+            app_id (str): The application ID
+
+        Returns:
+            list: Available ticket statuses
+        """
+        if not app_id:
+            return []
+
+        endpoint = f"api/{app_id}/tickets/statuses"
+        response = await self.transport.request("GET", endpoint)
+
+        if response and response.status_code == 200:
+            return response.json()
+        else:
+            print("Error retrieving ticket statuses")
+            if response:
+                print(f"Status code: {response.status_code}")
+                print(f"Response: {response.text[:200]}...")
+            return []
+
+    async def get_ticket_feed(self, app_id, ticket_id):
+        """Get feed entries (comments/updates) for a ticket
+
+        Args:
+            app_id (str): The application ID
+            ticket_id (str): The ticket ID
+
+        Returns:
+            list: Feed entries for the ticket
+        """
+        if not app_id or not ticket_id:
+            return []
+
+        endpoint = f"api/{app_id}/tickets/{ticket_id}/feed"
+        response = await self.transport.request("GET", endpoint)
+
+        if response and response.status_code == 200:
+            return response.json()
+        else:
+            print(f"Error retrieving feed for ticket with ID {ticket_id}")
+            if response:
+                print(f"Status code: {response.status_code}")
+                print(f"Response: {response.text[:200]}...")
+            return []
+
+    async def add_feed_entry(self, app_id, ticket_id, feed_entry):
+        """Add a comment or update to a ticket's feed
+
+        Args:
+            app_id (str): The application ID
+            ticket_id (str): The ticket ID
+            feed_entry (dict): The feed entry data
+
+        Returns:
+            dict: The created feed entry or None if failed
+        """
+        if not app_id or not ticket_id or not feed_entry:
+            return None
+
+        endpoint = f"api/{app_id}/tickets/{ticket_id}/feed"
+        response = await self.transport.request("POST", endpoint, json=feed_entry)
+
+        if response and response.status_code == 200:
+            return response.json()
+        else:
+            print(f"Error adding feed entry to ticket with ID {ticket_id}")
+            if response:
+                print(f"Status code: {response.status_code}")
+                print(f"Response: {response.text[:200]}...")
+            return None
+
+    async def get_applications(self):
+        """Get available ticketing applications
+
+        Returns:
+            list: Available ticketing applications
+        """
+        response = await self.transport.request("GET", "api/applications")
+
+        if response and response.status_code == 200:
+            apps = response.json()
+            return [app for app in apps if app.get("AppClass") == "TDTickets"]
+        else:
+            print("Error retrieving applications")
+            if response:
+                print(f"Status code: {response.status_code}")
+                print(f"Response: {response.text[:200]}...")
+            return []
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix API Tickets Bulk Module
+
+Result types and helpers for bulk ticket operations
+"""
+
+import csv
+import hashlib
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+
+from teamdynamix.utils.decode import decode_response
+
+# Status codes that mean a record can't be read with the current account
+FORBIDDEN_STATUS_CODES = (401, 403)
+
+# Responses that mean a POST wasn't processed, so it's safe to send again.
+# 502/504 come from gateways and the API may have created the record anyway.
+RETRYABLE_POST_STATUS_CODES = (429, 503)
+
+# Seconds waited before resending a POST without a Retry-After header, and
+# the longest Retry-After honored
+DEFAULT_RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 60.0
+
+# Items read ahead per worker by iter_completed
+QUEUE_PER_WORKER = 4
+
+# Ticket fields that hold numeric IDs; other CSV columns stay text, so
+# values such as ExternalID keep their leading zeros
+NUMERIC_TICKET_FIELDS = frozenset(
+    (
+        "ParentID",
+        "TypeID",
+        "FormID",
+        "ClassificationID",
+        "AccountID",
+        "SourceID",
+        "StatusID",
+        "ImpactID",
+        "UrgencyID",
+        "PriorityID",
+        "ResponsibleGroupID",
+        "LocationID",
+        "LocationRoomID",
+        "ServiceID",
+        "ServiceOfferingID",
+        "ArticleID",
+    )
+)
+
+
+def unique_ids(ids):
+    """Remove duplicate IDs, keeping the first occurrence of each
+
+    IDs are compared as strings, so 42 and "42" count as the same ticket.
+
+    Args:
+        ids (iterable): Ticket IDs
+
+    Returns:
+        list: IDs in input order without duplicates or blanks
+    """
+    seen = set()
+    result = []
+    for item in ids:
+        if item is None or item == "":
+            continue
+        key = str(item)
+        if key not in seen:
+            seen.add(key)
+            result.append(item)
+    return result
+
+
+def retry_delay(response):
+    """Get how long to wait before sending a request again
+
+    Args:
+        response: A 429 or 5xx response, or None if the request never completed
+
+    Returns:
+        float: Seconds from the Retry-After header (capped), or the default
+    """
+    try:
+        delay = float(response.headers.get("Retry-After"))
+    except (AttributeError, TypeError, ValueError):
+        return DEFAULT_RETRY_DELAY
+    return min(max(delay, 0.0), MAX_RETRY_DELAY)
+
+
+def is_transient(response):
+    """Check whether a failed request may succeed if sent again
+
+    Args:
+        response: The response, or None if the request never completed
+
+    Returns:
+        bool: True for no response, a 429 or a server error (5xx)
+    """
+    if response is None:
+        return True
+    return response.status_code == 429 or response.status_code >= 500
+
+
+def iter_completed(function, items, max_workers):
+    """Call a function for each item on a thread pool, yielding results
+
+    Results are yielded as soon as each call finishes, not in input order.
+    Only a few items per worker are read ahead, so items can be a generator
+    of any length. If the caller stops early, queued calls are cancelled.
+
+    Args:
+        function (callable): Called with each item
+        items (iterable): Arguments for the calls
+        max_workers (int): Number of calls running at the same time
+
+    Yields:
+        The return value of each call
+    """
+    items = iter(items)
+    pending = set()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            while True:
+                for item in islice(
+                    items, max_workers * QUEUE_PER_WORKER - len(pending)
+                ):
+                    pending.add(executor.submit(function, item))
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def describe_failure(response):
+    """Describe a failed response for an error report
+
+    Args:
+        response: The failed response, or None if the request never completed
+
+    Returns:
+        str: Short description of the failure
+    """
+    if response is None:
+        return "No response from API"
+    return f"Status code {response.status_code}: {response.text[:200]}"
+
+
+class BulkFetchResult:
+    """Outcome of a bulk ticket fetch or update
+
+    Attributes:
+        ids (list): Requested IDs in input order, without duplicates
+        tickets (dict): Ticket details keyed by ticket ID (as requested)
+        not_found (list): IDs the API reported as missing (404)
+        forbidden (list): IDs the account isn't allowed to read (401/403)
+        errors (dict): Other failures keyed by ticket ID, with a description
+    """
+
+    def __init__(self, ids):
+        self.ids = ids
+        self.tickets = {}
+        self.not_found = []
+        self.forbidden = []
+        self.errors = {}
+
+    def __len__(self):
+        return len(self.tickets)
+
+    def __repr__(self):
+        return (
+            f"<BulkFetchResult found={len(self.tickets)} "
+            f"not_found={len(self.not_found)} forbidden={len(self.forbidden)} "
+            f"errors={len(self.errors)}>"
+        )
+
+    def add_response(self, ticket_id, response):
+        """Sort a ticket's response into the matching outcome
+
+        Args:
+            ticket_id: The ticket ID as requested
+            response: The final response, or None if the request never completed
+        """
+        if response is not None and response.status_code == 200:
+            self.tickets[ticket_id] = decode_response(response)
+        elif response is not None and response.status_code == 404:
+            self.not_found.append(ticket_id)
+        elif response is not None and response.status_code in FORBIDDEN_STATUS_CODES:
+            self.forbidden.append(ticket_id)
+        else:
+            self.errors[ticket_id] = describe_failure(response)
+
+    @property
+    def ok(self):
+        """True if every requested ticket was retrieved"""
+        return len(self.tickets) == len(self.ids)
+
+    def found(self):
+        """Get the retrieved tickets in input order
+
+        Returns:
+            list: Ticket details for every ID that was found
+        """
+        return [self.tickets[i] for i in self.ids if i in self.tickets]
+
+    def summary(self):
+        """Get counts for each outcome
+
+        Returns:
+            dict: Number of found, not found, forbidden and failed tickets
+        """
+        return {
+            "requested": len(self.ids),
+            "found": len(self.tickets),
+            "not_found": len(self.not_found),
+            "forbidden": len(self.forbidden),
+            "errors": len(self.errors),
+        }
+
+
+def _csv_value(field, value):
+    """Convert a CSV cell: numeric ID fields become integers, Is* fields booleans"""
+    value = value.strip()
+    if field in NUMERIC_TICKET_FIELDS and value.lstrip("-").isdigit():
+        return int(value)
+    if value.lower() in ("true", "false") and field.startswith("Is"):
+        return value.lower() == "true"
+    return value
+
+
+def read_ticket_rows(path):
+    """Stream ticket rows from a CSV or JSONL file
+
+    CSV headers are ticket field names (e.g. Title, TypeID, StatusName).
+    The fields in NUMERIC_TICKET_FIELDS are sent as numbers, every other
+    value as text, and empty cells are left out. JSONL files hold one
+    ticket object per line, with their own types.
+
+    Args:
+        path (str): .csv, .jsonl or .ndjson file
+
+    Yields:
+        tuple: (row_number, ticket_data), numbered from 1 in file order
+    """
+    if os.path.splitext(path)[1].lower() == ".csv":
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            for number, row in enumerate(csv.DictReader(f), 1):
+                yield number, {
+                    field: _csv_value(field, value)
+                    for field, value in row.items()
+                    if field and value is not None and value.strip() != ""
+                }
+    else:
+        with open(path, encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                if line.strip():
+                    yield number, json.loads(line)
+
+
+def row_fingerprint(data):
+    """Hash a record so a resumed run can tell if its input changed"""
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def unjournaled(journal, items, result, retry_uncertain=False):
+    """Filter out items a journal shows as already handled
+
+    Created items go straight into the result. Items whose earlier outcome
+    is unknown are only passed on with retry_uncertain, and items that
+    changed since they were journaled are reported as failed.
+
+    Args:
+        journal (Journal): The operation's journal
+        items (iterable): (key, data, fingerprint) tuples
+        result (BulkCreateResult): Result to record skipped items in
+        retry_uncertain (bool): Pass on items whose earlier outcome is unknown
+
+    Yields:
+        tuple: (key, data, fingerprint) for each item that should be sent
+    """
+    for key, data, fingerprint in items:
+        entry = journal.get(key)
+        if entry is None or entry["state"] == "failed":
+            yield key, data, fingerprint
+        elif entry.get("fingerprint") != fingerprint:
+            result.failed[key] = "Item changed since it was journaled"
+        elif entry["state"] == "created":
+            result.created[key] = entry.get("id")
+            result.resumed += 1
+        elif retry_uncertain:
+            yield key, data, fingerprint
+        else:
+            result.uncertain[key] = entry.get(
+                "error", "Interrupted before the response was recorded"
+            )
+
+
+class BulkCreateResult:
+    """Outcome of a bulk creation of tickets or feed entries
+
+    Items are keyed by their journal key: the row number for tickets created
+    from a file, "ticket_id:fingerprint" for feed entries.
+
+    Attributes:
+        created (dict): New record ID keyed by item, including items created
+            by an earlier run of the same journal
+        failed (dict): Rejected items with a description; nothing was
+            created, so they can be fixed and run again
+        uncertain (dict): Items whose request may or may not have created a
+            record (no response, a server error, or a crash mid-request)
+        resumed (int): Items skipped because the journal shows them created
+    """
+
+    def __init__(self):
+        self.created = {}
+        self.failed = {}
+        self.uncertain = {}
+        self.resumed = 0
+
+    def __repr__(self):
+        return (
+            f"<BulkCreateResult created={len(self.created)} "
+            f"failed={len(self.failed)} uncertain={len(self.uncertain)}>"
+        )
+
+    def add(self, key, state, value):
+        """Record an item's outcome
+
+        Args:
+            key: The item's journal key
+            state (str): "created", "failed" or "uncertain"
+            value: The new record ID, or a description of the failure
+        """
+        if state == "created":
+            self.created[key] = value
+        elif state == "failed":
+            self.failed[key] = value
+        else:
+            self.uncertain[key] = value
+
+    @property
+    def ok(self):
+        """True if every item was created"""
+        return not self.failed and not self.uncertain
+
+    def summary(self):
+        """Get counts for each outcome
+
+        Returns:
+            dict: Number of created, resumed, failed and uncertain items
+        """
+        return {
+            "created": len(self.created),
+            "resumed": self.resumed,
+            "failed": len(self.failed),
+            "uncertain": len(self.uncertain),
+        }
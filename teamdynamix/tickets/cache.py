@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix API Tickets Cache Module
+
+In-memory and on-disk caches for rarely changing ticketing data
+"""
+
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from teamdynamix.utils.storage import atomic_write_json, cache_dir, read_json
+
+DEFAULT_CATALOG_TTL = 3600  # seconds before the catalog is revalidated
+DEFAULT_CATALOG_STALE_TTL = 86400  # seconds a stale catalog may still be served
+DEFAULT_METADATA_TTL = 86400  # seconds before metadata is downloaded again
+METADATA_RETRY_DELAY = 300  # seconds before a failed metadata download is retried
+
+# Metadata kinds: endpoint and the ticket field prefix they resolve
+TICKET_METADATA = {
+    "statuses": ("api/{app_id}/tickets/statuses", "Status"),
+    "priorities": ("api/{app_id}/tickets/priorities", "Priority"),
+    "types": ("api/{app_id}/tickets/types", "Type"),
+    "sources": ("api/{app_id}/tickets/sources", "Source"),
+    "urgencies": ("api/{app_id}/tickets/urgencies", "Urgency"),
+}
+
+# Metadata kinds the ticket search endpoint can filter by ID
+SEARCH_ID_FILTERS = ("statuses", "priorities", "types", "urgencies")
+
+# Application catalogs shared by every TicketsClient, keyed by environment and user
+_catalogs = {}
+_catalogs_lock = threading.Lock()
+
+# Ticket metadata shared by every TicketsClient, keyed by (environment, app ID)
+_metadata = {}
+_metadata_lock = threading.Lock()
+
+
+class ApplicationCatalog:
+    """Cached list of the TeamDynamix applications one user can see
+
+    The catalog is kept in memory and on disk. Within the TTL it is served
+    as is; after that a stale copy is still served while a background thread
+    fetches a new one (stale-while-revalidate). The ticketing application
+    list is computed once per download instead of on every call.
+    """
+
+    def __init__(
+        self,
+        environment,
+        fetch,
+        username=None,
+        ttl=DEFAULT_CATALOG_TTL,
+        stale_ttl=DEFAULT_CATALOG_STALE_TTL,
+        path=None,
+    ):
+        """Initialize the catalog
+
+        Args:
+            environment (str): Environment name ('sandbox' or 'production')
+            fetch (callable): Returns the full application list, or None on failure
+            username (str, optional): User the list was downloaded for, since
+                each user only sees the applications they have access to
+            ttl (float): Seconds the catalog is served without revalidation
+            stale_ttl (float): Extra seconds a stale catalog is served while
+                it is refreshed in the background
+            path (str, optional): Cache file (default: cache dir per environment
+                and user)
+        """
+        self.environment = environment
+        self.fetch = fetch
+        self.username = username
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        if path is None:
+            key = hashlib.sha256(f"{environment}:{username}".encode()).hexdigest()
+            path = os.path.join(
+                cache_dir("applications"), f"{environment}-{key[:32]}.json"
+            )
+        self.path = path
+
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._applications = None
+        self._ticketing = None
+        self._fetched_at = 0.0
+        self._load()
+
+    def _load(self):
+        """Load the catalog saved by a previous run"""
+        data = read_json(self.path)
+        if not data or not isinstance(data.get("applications"), list):
+            return
+        self._set(data["applications"], data.get("fetched_at", 0.0))
+
+    def _set(self, applications, fetched_at):
+        """Store a catalog and precompute the ticketing applications"""
+        self._applications = applications
+        self._ticketing = [
+            app for app in applications if app.get("AppClass") == "TDTickets"
+        ]
+        self._fetched_at = fetched_at
+
+    def age(self):
+        """Seconds since the catalog was downloaded, or None if never"""
+        if self._applications is None:
+            return None
+        return max(time.time() - self._fetched_at, 0.0)
+
+    def refresh(self):
+        """Download the catalog now
+
+        Returns:
+            bool: True if the catalog was updated
+        """
+        applications = self.fetch()
+        if applications is None:
+            return False
+
+        fetched_at = time.time()
+        with self._lock:
+            self._set(applications, fetched_at)
+
+        try:
+            atomic_write_json(
+                self.path, {"fetched_at": fetched_at, "applications": applications}
+            )
+        except OSError as e:
+            print(f"Warning: unable to write application cache: {str(e)}")
+        return True
+
+    def _refresh_in_background(self):
+        """Start a background refresh unless one is already running"""
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def run():
+            try:
+                self.refresh()
+            finally:
+                with self._lock:
+                    self._refreshing = False
+
+        threading.Thread(target=run, name="tdx-app-catalog", daemon=True).start()
+
+    def _ensure(self, force_refresh):
+        """Make sure a usable catalog is loaded"""
+        age = self.age()
+        if force_refresh or age is None or age > self.ttl + self.stale_ttl:
+            # Keep serving whatever we have if the download fails
+            self.refresh()
+        elif age > self.ttl:
+            self._refresh_in_background()
+
+    def get_applications(self, force_refresh=False):
+        """Get every application in the environment
+
+        Args:
+            force_refresh (bool): Download the catalog even if it is fresh
+
+        Returns:
+            list: All applications, or an empty list if none could be loaded
+        """
+        self._ensure(force_refresh)
+        return list(self._applications or [])
+
+    def get_ticketing_applications(self, force_refresh=False):
+        """Get the ticketing applications (AppClass "TDTickets")
+
+        Args:
+            force_refresh (bool): Download the catalog even if it is fresh
+
+        Returns:
+            list: Ticketing applications, or an empty list if none could be loaded
+        """
+        self._ensure(force_refresh)
+        return list(self._ticketing or [])
+
+    def clear(self):
+        """Forget the cached catalog in memory and on disk"""
+        with self._lock:
+            self._applications = None
+            self._ticketing = None
+            self._fetched_at = 0.0
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def get_application_catalog(environment, fetch, username=None):
+    """Get the shared application catalog for an environment and user
+
+    Args:
+        environment (str): Environment name ('sandbox' or 'production')
+        fetch (callable): Returns the full application list, or None on failure
+        username (str, optional): User the applications are listed for
+
+    Returns:
+        ApplicationCatalog: Shared catalog for the environment and user
+    """
+    key = (environment, username)
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = _catalogs[key] = ApplicationCatalog(environment, fetch, username)
+        else:
+            # Newer clients may carry a fresher auth object
+            catalog.fetch = fetch
+        return catalog
+
+
+class TicketMetadata:
+    """Statuses, priorities, types, sources and urgencies for one application
+
+    Downloaded once, saved to disk, and indexed by lowercase name and by ID
+    so names typed by users can be turned into IDs without API calls.
+    """
+
+    def __init__(
+        self, environment, app_id, fetch, ttl=DEFAULT_METADATA_TTL, path=None
+    ):
+        """Initialize the metadata cache
+
+        Args:
+            environment (str): Environment name ('sandbox' or 'production')
+            app_id (str): The application ID
+            fetch (callable): Takes an endpoint and returns its list, or None on failure
+            ttl (float): Seconds before the metadata is downloaded again
+            path (str, optional): Cache file (default: cache dir per environment/app)
+        """
+        self.environment = environment
+        self.app_id = app_id
+        self.fetch = fetch
+        self.ttl = ttl
+        self.path = path or os.path.join(
+            cache_dir("metadata"), f"{environment}-{app_id}.json"
+        )
+
+        self._lock = threading.Lock()
+        self._items = {}
+        self._by_name = {}
+        self._by_id = {}
+        self._fetched_at = {}  # Download time per kind
+        self._retry_at = {}  # Earliest retry per kind after a failed download
+        self._load()
+
+    def _load(self):
+        """Load metadata saved by a previous run"""
+        data = read_json(self.path)
+        if not data or not isinstance(data.get("items"), dict):
+            return
+        fetched_at = data.get("fetched_at") or {}
+        for kind, items in data["items"].items():
+            if kind in TICKET_METADATA and isinstance(items, list):
+                self._index(kind, items)
+                self._fetched_at[kind] = fetched_at.get(kind, 0.0)
+
+    def _index(self, kind, items):
+        """Store a metadata list and build its name and ID indexes"""
+        self._items[kind] = items
+        self._by_name[kind] = {
+            str(item.get("Name", "")).casefold(): item for item in items
+        }
+        self._by_id[kind] = {str(item.get("ID")): item for item in items}
+
+    def _stale_kinds(self, force_refresh):
+        """Get the kinds that are missing or older than the TTL"""
+        now = time.time()
+        stale = []
+        for kind in TICKET_METADATA:
+            if now < self._retry_at.get(kind, 0.0) and not force_refresh:
+                continue
+            if force_refresh or now - self._fetched_at.get(kind, 0.0) > self.ttl:
+                stale.append(kind)
+        return stale
+
+    def is_fresh(self):
+        """True if every kind is loaded and younger than the TTL"""
+        now = time.time()
+        return all(
+            kind in self._items and now - self._fetched_at.get(kind, 0.0) <= self.ttl
+            for kind in TICKET_METADATA
+        )
+
+    def warm(self, force_refresh=False):
+        """Download any metadata that is missing or older than the TTL
+
+        Kinds that fail to download keep their previously cached values and
+        are not retried for METADATA_RETRY_DELAY seconds.
+
+        Args:
+            force_refresh (bool): Download every kind even if the cache is fresh
+
+        Returns:
+            bool: True if every kind is available
+        """
+        with self._lock:
+            kinds = self._stale_kinds(force_refresh)
+            if not kinds:
+                return len(self._items) == len(TICKET_METADATA)
+
+            endpoints = [
+                TICKET_METADATA[kind][0].format(app_id=self.app_id) for kind in kinds
+            ]
+            with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+                results = list(executor.map(self.fetch, endpoints))
+
+            now = time.time()
+            for kind, items in zip(kinds, results):
+                if items is None:
+                    self._retry_at[kind] = now + METADATA_RETRY_DELAY
+                else:
+                    self._index(kind, items)
+                    self._fetched_at[kind] = now
+                    self._retry_at.pop(kind, None)
+
+            try:
+                atomic_write_json(
+                    self.path, {"fetched_at": self._fetched_at, "items": self._items}
+                )
+            except OSError as e:
+                print(f"Warning: unable to write ticket metadata cache: {str(e)}")
+
+            return len(self._items) == len(TICKET_METADATA)
+
+    def items(self, kind):
+        """Get every entry of a metadata kind
+
+        Args:
+            kind (str): One of statuses, priorities, types, sources, urgencies
+
+        Returns:
+            list: Metadata entries
+        """
+        return list(self._items.get(kind, []))
+
+    def get_by_name(self, kind, name):
+        """Look up an entry by name (case-insensitive)
+
+        Returns:
+            dict: The entry or None if there is no match
+        """
+        if name is None:
+            return None
+        return self._by_name.get(kind, {}).get(str(name).strip().casefold())
+
+    def get_by_id(self, kind, item_id):
+        """Look up an entry by ID
+
+        Returns:
+            dict: The entry or None if there is no match
+        """
+        return self._by_id.get(kind, {}).get(str(item_id))
+
+    def id_for(self, kind, name):
+        """Get the ID for a metadata name
+
+        Returns:
+            int: The ID or None if the name is unknown
+        """
+        item = self.get_by_name(kind, name)
+        return item.get("ID") if item else None
+
+    def name_for(self, kind, item_id):
+        """Get the name for a metadata ID
+
+        Returns:
+            str: The name or None if the ID is unknown
+        """
+        item = self.get_by_id(kind, item_id)
+        return item.get("Name") if item else None
+
+    def resolve_ticket_fields(self, ticket_data):
+        """Fill in ID fields from name fields on a ticket
+
+        For example a "PriorityName" of "High" adds the matching "PriorityID".
+        Existing IDs and unknown names are left alone.
+
+        Args:
+            ticket_data (dict): Ticket data to submit
+
+        Returns:
+            dict: A copy of the ticket data with IDs added
+        """
+        resolved = dict(ticket_data)
+        for kind, (_, field) in TICKET_METADATA.items():
+            name = resolved.get(f"{field}Name")
+            if name and not resolved.get(f"{field}ID"):
+                item_id = self.id_for(kind, name)
+                if item_id is not None:
+                    resolved[f"{field}ID"] = item_id
+        return resolved
+
+    def resolve_search_params(self, search_params, kinds=SEARCH_ID_FILTERS):
+        """Replace name filters in a search with ID filters
+
+        For example a "StatusName" of "Open" becomes "StatusIDs": [<id>].
+        Names that can't be resolved are left as they are, and so are names
+        whose ID filter is already set, since the search matches both.
+
+        Args:
+            search_params (dict): Parameters for ticket search
+            kinds (tuple): Metadata kinds the search endpoint filters by ID
+
+        Returns:
+            dict: A copy of the search parameters
+        """
+        resolved = dict(search_params)
+        for kind in kinds:
+            field = TICKET_METADATA[kind][1]
+            name = resolved.get(f"{field}Name")
+            if not name or resolved.get(f"{field}IDs"):
+                continue
+            item_id = self.id_for(kind, name)
+            if item_id is not None:
+                del resolved[f"{field}Name"]
+                resolved[f"{field}IDs"] = [item_id]
+        return resolved
+
+
+def get_ticket_metadata(environment, app_id, fetch):
+    """Get the shared metadata cache for an application
+
+    Args:
+        environment (str): Environment name ('sandbox' or 'production')
+        app_id (str): The application ID
+        fetch (callable): Takes an endpoint and returns its list, or None on failure
+
+    Returns:
+        TicketMetadata: Shared metadata cache for the application
+    """
+    key = (environment, str(app_id))
+    with _metadata_lock:
+        metadata = _metadata.get(key)
+        if metadata is None:
+            metadata = _metadata[key] = TicketMetadata(environment, app_id, fetch)
+        else:
+            metadata.fetch = fetch
+        return metadata
@@ -5,16 +5,76 @@ TeamDynamix API Tickets Module
 Handles operations related to tickets in TeamDynamix
 """
 
+import datetime
 import json
+import time
 import urllib.parse
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+
+from teamdynamix.auth.ratelimit import RateLimitError
+from teamdynamix.auth.token_cache import get_username
+from teamdynamix.auth.transport import get_transport
+from teamdynamix.tickets.bulk import (
+    RETRYABLE_POST_STATUS_CODES,
+    BulkCreateResult,
+    BulkFetchResult,
+    describe_failure,
+    is_transient,
+    iter_completed,
+    read_ticket_rows,
+    retry_delay,
+    row_fingerprint,
+    unique_ids,
+    unjournaled,
+)
+from teamdynamix.tickets.cache import (
+    TICKET_METADATA,
+    get_application_catalog,
+    get_ticket_metadata,
+)
+from teamdynamix.tickets.export import export_ticket_columns
+from teamdynamix.tickets.feed import merge_feeds, open_feed_cache, stream_feeds
+from teamdynamix.tickets.patch import diff_ticket
+from teamdynamix.tickets.search import (
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_WINDOW,
+    SearchError,
+    iter_search_windows,
+)
+from teamdynamix.tickets.store import open_ticket_store
+from teamdynamix.utils.decode import decode_response, project
+from teamdynamix.utils.export import export_ndjson
+from teamdynamix.utils.journal import Journal
+from teamdynamix.utils.models import FeedEntry, Ticket, json_default
+
+DEFAULT_BULK_WORKERS = 8  # Keep at or below the transport's pool_maxsize
+DEFAULT_BULK_RETRIES = 2  # Extra attempts for transient failures
+DEFAULT_CREATE_WORKERS = 4  # Tickets created at the same time
+
+# Overlap with the previous sync, for clock skew and late-committed edits
+DEFAULT_SYNC_OVERLAP = datetime.timedelta(minutes=5)
 
 
 class TicketsClient:
-    """Client for tickets-related operations in TeamDynamix API"""
+    """Client for tickets-related operations in TeamDynamix API
+
+    A request that is still rate limited after the transport's retries
+    raises RateLimitError rather than looking like an empty result.
+    """
 
     def __init__(self, auth):
         """Initialize with authentication client"""
         self.auth = auth
+        self.transport = get_transport(auth)
+        self.applications = get_application_catalog(
+            getattr(auth, "environment", None) or auth.base_url,
+            self._fetch_applications,
+            get_username(auth),
+        )
+        self._store = None
+        self._feed_cache = None
 
     def get_ticket(self, app_id, ticket_id):
         """Get detailed information about a ticket by ID
@@ -33,23 +93,150 @@ class TicketsClient:
         endpoint = f"api/{app_id}/tickets/{ticket_id}"
 
         # Make the API request
-        response = self.auth.make_api_request("GET", endpoint)
+        response = self.transport.request("GET", endpoint)
 
         if response and response.status_code == 200:
-            return response.json()
+            return decode_response(response)
         else:
             print(f"Error retrieving ticket with ID {ticket_id}")
-            if response:
+            if response is not None:
                 print(f"Status code: {response.status_code}")
                 print(f"Response: {response.text[:200]}...")
             return None
 
-    def search_tickets(self, app_id, search_params=None):
+    def get_tickets(
+        self,
+        app_id,
+        ticket_ids,
+        max_workers=DEFAULT_BULK_WORKERS,
+        retries=DEFAULT_BULK_RETRIES,
+    ):
+        """Get detailed information about many tickets concurrently
+
+        Duplicate IDs are fetched once. Failures are collected in the result
+        instead of being printed.
+
+        Args:
+            app_id (str): The application ID
+            ticket_ids (iterable): The ticket IDs to retrieve
+            max_workers (int): Number of tickets fetched at the same time
+            retries (int): Extra attempts for transient failures (see is_transient)
+
+        Returns:
+            BulkFetchResult: Tickets in input order plus not-found, forbidden
+            and transient error reports
+        """
+        result = BulkFetchResult(unique_ids(ticket_ids))
+        if not app_id or not result.ids:
+            return result
+
+        def fetch(ticket_id):
+            return ticket_id, self._fetch_ticket(app_id, ticket_id, retries)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for ticket_id, response in executor.map(fetch, result.ids):
+                result.add_response(ticket_id, response)
+
+        return result
+
+    def iter_tickets(
+        self,
+        app_id,
+        ticket_ids,
+        max_workers=DEFAULT_BULK_WORKERS,
+        retries=DEFAULT_BULK_RETRIES,
+        records=False,
+    ):
+        """Fetch many tickets concurrently, yielding them in input order
+
+        Like get_tickets, but only a few batches are in flight at a time, so
+        an export of any size runs in constant memory. Tickets that can't be
+        retrieved are skipped with an error message.
+
+        Args:
+            app_id (str): The application ID
+            ticket_ids (iterable): The ticket IDs to retrieve (may be a generator)
+            max_workers (int): Number of tickets fetched at the same time
+            retries (int): Extra attempts for transient failures (see is_transient)
+            records (bool): Yield compact Ticket records instead of dicts, for
+                callers that keep many tickets in memory
+
+        Yields:
+            dict: Details of each ticket that was found
+        """
+        if not app_id:
+            return
+        if records:
+            yield from Ticket.wrap(
+                self.iter_tickets(app_id, ticket_ids, max_workers, retries)
+            )
+            return
+
+        seen = set()
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                for ticket_id in ticket_ids:
+                    if ticket_id is None or ticket_id == "" or str(ticket_id) in seen:
+                        continue
+                    seen.add(str(ticket_id))
+                    future = executor.submit(
+                        self._fetch_ticket, app_id, ticket_id, retries
+                    )
+                    pending.append((ticket_id, future))
+                    # Keep a few requests queued per worker, no more
+                    if len(pending) >= max_workers * 4:
+                        yield from _ticket_or_skip(*pending.popleft())
+                while pending:
+                    yield from _ticket_or_skip(*pending.popleft())
+            finally:
+                # The caller stopped early; don't wait for queued requests
+                for _, future in pending:
+                    future.cancel()
+
+    def _fetch_ticket(self, app_id, ticket_id, retries):
+        """Request a ticket, retrying transient failures
+
+        Returns:
+            The last response, or None if the request never completed
+        """
+        return self._request_with_retries(
+            "GET", f"api/{app_id}/tickets/{ticket_id}", retries
+        )
+
+    def _request_with_retries(self, method, endpoint, retries, **kwargs):
+        """Make a request, retrying transient failures after a delay
+
+        Only a missing response, a 429 or a server error is retried (see
+        is_transient); other errors are returned at once. Nothing is
+        printed, the caller reports the failure.
+
+        Returns:
+            The last response, or None if the request never completed
+        """
+        try:
+            response = self.transport.request(method, endpoint, quiet=True, **kwargs)
+            for _ in range(retries):
+                if not is_transient(response):
+                    break
+                time.sleep(retry_delay(response))
+                response = self.transport.request(
+                    method, endpoint, quiet=True, **kwargs
+                )
+        except RateLimitError as e:
+            return e.response  # The transport already waited out its retries
+        return response
+
+    def search_tickets(self, app_id, search_params=None, local=False, fields=None):
         """Search for tickets with given parameters
 
         Args:
             app_id (str): The application ID
             search_params (dict): Parameters for ticket search
+            local (bool): Search tickets in the local store instead of the API
+                (see sync_tickets), newest modified first
+            fields (iterable, optional): Only keep these ticket fields, which
+                skips decoding the rest (e.g. ["ID", "Title", "StatusName"])
 
         Returns:
             list: List of tickets matching the search criteria
@@ -60,21 +247,190 @@ class TicketsClient:
         if not search_params:
             search_params = {}
 
+        if local:
+            try:
+                tickets = self.get_store().query(app_id, search_params)
+                return tickets if fields is None else project(tickets, fields)
+            except ValueError as e:
+                print(f"Error searching local tickets: {str(e)}")
+                return []
+
+        # Send status/priority/type filters by ID when the name is known
+        if _has_name_fields(search_params):
+            search_params = self.get_ticket_metadata(app_id).resolve_search_params(
+                search_params
+            )
+
         # Construct the endpoint URL
         endpoint = f"api/{app_id}/tickets/search"
 
         # Make the API request with search parameters in the body
-        response = self.auth.make_api_request("POST", endpoint, json=search_params)
+        response = self.transport.request("POST", endpoint, json=search_params)
 
         if response and response.status_code == 200:
-            return response.json()
+            return decode_response(response, fields)
         else:
             print("Error performing ticket search")
-            if response:
+            if response is not None:
                 print(f"Status code: {response.status_code}")
                 print(f"Response: {response.text[:200]}...")
             return []
 
+    def iter_search_tickets(
+        self,
+        app_id,
+        search_params=None,
+        page_size=DEFAULT_PAGE_SIZE,
+        window=None,
+        date_field="CreatedDate",
+        fields=None,
+        records=False,
+    ):
+        """Search for every matching ticket, yielding them as they arrive
+
+        Unlike search_tickets, results aren't capped by MaxResults: the search
+        is split into date windows small enough to come back complete. Only
+        one window is held in memory, and the caller can stop at any time.
+
+        Args:
+            app_id (str): The application ID
+            search_params (dict): Parameters for ticket search; CreatedDateFrom
+                and CreatedDateTo limit the range searched
+            page_size (int): MaxResults sent for each window
+            window (datetime.timedelta, optional): Length of the first window
+            date_field (str): Date to window by, "CreatedDate" or "ModifiedDate"
+            fields (iterable, optional): Only keep these ticket fields (ID is
+                always kept)
+            records (bool): Yield compact Ticket records instead of dicts, for
+                callers that keep many tickets in memory
+
+        Yields:
+            dict: Each ticket matching the search criteria
+
+        Raises:
+            SearchError: If a search request fails part way through
+        """
+        for _, tickets in self.iter_search_windows(
+            app_id, search_params, page_size, window, date_field, fields
+        ):
+            yield from Ticket.wrap(tickets) if records else tickets
+
+    def iter_search_windows(
+        self,
+        app_id,
+        search_params=None,
+        page_size=DEFAULT_PAGE_SIZE,
+        window=None,
+        date_field="CreatedDate",
+        fields=None,
+    ):
+        """Search for every matching ticket, one date window at a time
+
+        Same as iter_search_tickets, but yields each window's tickets together
+        with the end of the window, for callers that checkpoint progress.
+
+        Yields:
+            tuple: (window_end, tickets) with window_end a UTC datetime
+
+        Raises:
+            SearchError: If a search request fails part way through
+        """
+        if not app_id:
+            return
+
+        search_params = dict(search_params or {})
+        if _has_name_fields(search_params):
+            search_params = self.get_ticket_metadata(app_id).resolve_search_params(
+                search_params
+            )
+
+        endpoint = f"api/{app_id}/tickets/search"
+        if fields is not None:
+            fields = ("ID", *fields)  # needed to drop boundary duplicates
+
+        def search(params):
+            response = self.transport.request("POST", endpoint, json=params)
+            if response is not None and response.status_code == 200:
+                return decode_response(response, fields)
+            if response is not None:
+                print(f"Status code: {response.status_code}")
+                print(f"Response: {response.text[:200]}...")
+            return None
+
+        yield from iter_search_windows(
+            search, search_params, page_size, window or DEFAULT_WINDOW, date_field
+        )
+
+    def get_store(self):
+        """Get the local ticket store for this environment
+
+        Returns:
+            TicketStore: The store, opened on first use
+        """
+        if self._store is None:
+            self._store = open_ticket_store(
+                getattr(self.auth, "environment", None) or "default"
+            )
+        return self._store
+
+    def sync_tickets(
+        self,
+        app_id,
+        search_params=None,
+        full=False,
+        overlap=DEFAULT_SYNC_OVERLAP,
+        page_size=DEFAULT_PAGE_SIZE,
+    ):
+        """Download tickets modified since the last sync into the local store
+
+        The first sync (or a full one) downloads every ticket. Later syncs
+        only ask for tickets modified since the stored watermark. The
+        watermark moves forward after each window of tickets is stored, so
+        an interrupted sync picks up where it stopped. Deleted tickets are
+        not removed from the store.
+
+        Args:
+            app_id (str): The application ID
+            search_params (dict, optional): Extra search filters; use the same
+                filters on every sync of an application
+            full (bool): Ignore the watermark and download every ticket
+            overlap (datetime.timedelta): How far before the watermark to start
+            page_size (int): MaxResults sent for each window
+
+        Returns:
+            dict: Tickets stored, the new watermark and whether the sync
+            finished, or None if app_id is missing
+        """
+        if not app_id:
+            return None
+
+        store = self.get_store()
+        search_params = dict(search_params or {})
+        end = datetime.datetime.now(datetime.timezone.utc)
+        watermark = None if full else store.get_watermark(app_id)
+        if watermark is not None:
+            search_params["ModifiedDateFrom"] = watermark - overlap
+        search_params["ModifiedDateTo"] = end
+
+        stored = 0
+        try:
+            for window_end, tickets in self.iter_search_windows(
+                app_id, search_params, page_size, date_field="ModifiedDate"
+            ):
+                stored += store.upsert(app_id, tickets, watermark=window_end)
+                watermark = window_end
+        except (SearchError, RateLimitError) as e:
+            # The watermark stops before the failed window; the next sync resumes
+            print(f"{str(e)}, sync stopped")
+
+        return {
+            "app_id": app_id,
+            "stored": stored,
+            "watermark": watermark,
+            "complete": watermark is not None and watermark >= end,
+            "total": store.count(app_id),
+        }
+
     def create_ticket(
         self, app_id, ticket_data, notify_requestor=True, notify_responsible=True
     ):
@@ -92,21 +448,142 @@ class TicketsClient:
         if not app_id or not ticket_data:
             return None
 
+        # Fill in IDs for fields given by name (e.g. PriorityName)
+        if _has_name_fields(ticket_data):
+            ticket_data = self.get_ticket_metadata(app_id).resolve_ticket_fields(
+                ticket_data
+            )
+
         # Construct the endpoint URL with query parameters
         endpoint = f"api/{app_id}/tickets?NotifyRequestor={str(notify_requestor).lower()}&NotifyResponsible={str(notify_responsible).lower()}"
 
         # Make the API request
-        response = self.auth.make_api_request("POST", endpoint, json=ticket_data)
+        response = self.transport.request("POST", endpoint, json=ticket_data)
 
         if response and response.status_code == 201:  # 201 Created
-            return response.json()
+            return decode_response(response)
         else:
             print("Error creating ticket")
-            if response:
+            if response is not None:
                 print(f"Status code: {response.status_code}")
                 print(f"Response: {response.text[:200]}...")
             return None
 
+    def create_tickets_from_file(
+        self,
+        app_id,
+        path,
+        journal_path=None,
+        max_workers=DEFAULT_CREATE_WORKERS,
+        notify_requestor=True,
+        notify_responsible=True,
+        retries=DEFAULT_BULK_RETRIES,
+        retry_uncertain=False,
+    ):
+        """Create a ticket for every row of a CSV or JSONL file
+
+        Rows are streamed from the file and created concurrently, within the
+        shared rate limit. Every row is written to a journal before and
+        after its request, so running the same file again skips rows that
+        were already created. A row whose request was cut off can't be
+        checked for a new ticket; it is reported as uncertain and only sent
+        again with retry_uncertain.
+
+        Args:
+            app_id (str): The application ID
+            path (str): .csv, .jsonl or .ndjson file (see read_ticket_rows)
+            journal_path (str, optional): Checkpoint journal (default: path + ".journal")
+            max_workers (int): Number of tickets created at the same time
+            notify_requestor (bool): Whether to notify the requestors
+            notify_responsible (bool): Whether to notify the responsible resources
+            retries (int): Extra attempts while the API is unavailable (429/503)
+            retry_uncertain (bool): Send rows whose earlier outcome is unknown
+
+        Returns:
+            BulkCreateResult: New ticket IDs keyed by row number, plus failed
+            and uncertain rows
+        """
+        result = BulkCreateResult()
+        if not app_id or not path:
+            return result
+
+        endpoint = f"api/{app_id}/tickets?NotifyRequestor={str(notify_requestor).lower()}&NotifyResponsible={str(notify_responsible).lower()}"
+        metadata = []  # loaded on the first row that names a field
+
+        def create(item):
+            row, data, fingerprint = item
+            if _has_name_fields(data):
+                if not metadata:
+                    metadata.append(self.get_ticket_metadata(app_id))
+                data = metadata[0].resolve_ticket_fields(data)
+            return row, *self._post_journaled(
+                journal, row, fingerprint, endpoint, data, 201, retries
+            )
+
+        def rows():
+            for row, data in read_ticket_rows(path):
+                yield row, data, row_fingerprint(data)
+
+        with Journal(journal_path or f"{path}.journal") as journal:
+            for row, state, value in iter_completed(
+                create,
+                unjournaled(journal, rows(), result, retry_uncertain),
+                max_workers,
+            ):
+                result.add(row, state, value)
+
+        return result
+
+    def _post_journaled(
+        self, journal, key, fingerprint, endpoint, data, success_status, retries
+    ):
+        """POST a new record, journaling the attempt and its outcome
+
+        Only responses that show the request wasn't processed (see
+        RETRYABLE_POST_STATUS_CODES) are retried, so a record is never
+        created twice.
+
+        Returns:
+            tuple: (state, value): ("created", new ID), or ("failed" or
+            "uncertain", error description)
+        """
+        journal.record(key, "pending", fingerprint=fingerprint)
+
+        def post():
+            try:
+                return self.transport.request("POST", endpoint, json=data), False
+            except RateLimitError as e:
+                return e.response, True  # Throttled, so nothing was created
+
+        response, throttled = post()
+        for _ in range(retries):
+            if (
+                throttled
+                or response is None
+                or response.status_code not in RETRYABLE_POST_STATUS_CODES
+            ):
+                break
+            time.sleep(retry_delay(response))
+            response, throttled = post()
+
+        if response is not None and response.status_code == success_status:
+            record_id = decode_response(response).get("ID")
+            journal.record(key, "created", fingerprint=fingerprint, id=record_id)
+            return "created", record_id
+
+        error = describe_failure(response)
+        # A 4xx or 503 means nothing was created; no response, a timeout or a
+        # gateway error (502/504) may have created the record
+        if response is not None and (
+            400 <= response.status_code < 500
+            or response.status_code in RETRYABLE_POST_STATUS_CODES
+        ):
+            state = "failed"
+        else:
+            state = "uncertain"
+        journal.record(key, state, fingerprint=fingerprint, error=error)
+        return state, error
+
     def update_ticket(
         self, app_id, ticket_id, ticket_data, notify_new_responsible=True
     ):
@@ -128,17 +605,149 @@ class TicketsClient:
         endpoint = f"api/{app_id}/tickets/{ticket_id}?notifyNewResponsible={str(notify_new_responsible).lower()}"
 
         # Make the API request
-        response = self.auth.make_api_request("POST", endpoint, json=ticket_data)
+        response = self.transport.request("POST", endpoint, json=ticket_data)
 
         if response and response.status_code == 200:
-            return response.json()
+            return decode_response(response)
         else:
             print(f"Error updating ticket with ID {ticket_id}")
-            if response:
+            if response is not None:
+                print(f"Status code: {response.status_code}")
+                print(f"Response: {response.text[:200]}...")
+            return None
+
+    def patch_ticket(self, app_id, ticket_id, operations, notify_new_responsible=True):
+        """Apply JSON Patch operations to a ticket
+
+        Only the listed fields are sent, so concurrent edits to other fields
+        aren't overwritten. See diff_ticket and field_patch for building the
+        operations.
+
+        Args:
+            app_id (str): The application ID
+            ticket_id (str): The ticket ID to update
+            operations (list): JSON Patch operations, e.g.
+                [{"op": "replace", "path": "/StatusID", "value": 123}]
+            notify_new_responsible (bool): Whether to notify new responsible resources
+
+        Returns:
+            dict: The updated ticket or None if failed
+        """
+        if not app_id or not ticket_id or not operations:
+            return None
+
+        endpoint = f"api/{app_id}/tickets/{ticket_id}?notifyNewResponsible={str(notify_new_responsible).lower()}"
+        response = self.transport.request("PATCH", endpoint, json=operations)
+
+        if response is not None and response.status_code == 200:
+            return decode_response(response)
+        else:
+            print(f"Error patching ticket with ID {ticket_id}")
+            if response is not None:
                 print(f"Status code: {response.status_code}")
                 print(f"Response: {response.text[:200]}...")
             return None
 
+    def update_ticket_fields(
+        self, app_id, original, modified, notify_new_responsible=True
+    ):
+        """Update a ticket by sending only the fields that changed
+
+        Changed display names (e.g. StatusName) are turned into their ID
+        field using the cached ticket metadata.
+
+        Args:
+            app_id (str): The application ID
+            original (dict): The ticket as retrieved
+            modified (dict): A copy of the ticket with changes applied, or
+                just the changed fields
+            notify_new_responsible (bool): Whether to notify new responsible resources
+
+        Returns:
+            dict: The updated ticket, the original if nothing changed, or None
+            if the update failed
+        """
+        if not app_id or not original or not modified:
+            return None
+
+        operations = diff_ticket(
+            original, self._resolve_changed_names(app_id, original, modified)
+        )
+        if not operations:
+            return original
+        return self.patch_ticket(
+            app_id, original.get("ID"), operations, notify_new_responsible
+        )
+
+    def patch_tickets(
+        self,
+        app_id,
+        patches,
+        max_workers=DEFAULT_BULK_WORKERS,
+        retries=DEFAULT_BULK_RETRIES,
+        notify_new_responsible=True,
+    ):
+        """Apply JSON Patch operations to many tickets concurrently
+
+        Failures are collected in the result instead of being printed.
+
+        Args:
+            app_id (str): The application ID
+            patches (iterable): (ticket_id, operations) pairs; use
+                diff_ticket or field_patch to build the operations
+            max_workers (int): Number of tickets updated at the same time
+            retries (int): Extra attempts for transient failures (see is_transient)
+            notify_new_responsible (bool): Whether to notify new responsible resources
+
+        Returns:
+            BulkFetchResult: Updated tickets keyed by ticket ID plus not-found,
+            forbidden and error reports
+        """
+        patches = [(ticket_id, ops) for ticket_id, ops in patches if ops]
+        result = BulkFetchResult(unique_ids(ticket_id for ticket_id, _ in patches))
+        if not app_id or not patches:
+            return result
+
+        notify = str(notify_new_responsible).lower()
+
+        def patch(item):
+            ticket_id, operations = item
+            endpoint = f"api/{app_id}/tickets/{ticket_id}?notifyNewResponsible={notify}"
+            return ticket_id, self._request_with_retries(
+                "PATCH", endpoint, retries, json=operations
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for ticket_id, response in executor.map(patch, patches):
+                result.add_response(ticket_id, response)
+
+        return result
+
+    def _resolve_changed_names(self, app_id, original, modified):
+        """Set the ID field for metadata names changed without their ID
+
+        Returns:
+            dict: The modified ticket, copied if any ID was filled in
+        """
+        changed = [
+            (kind, field)
+            for kind, (_, field) in TICKET_METADATA.items()
+            if f"{field}Name" in modified
+            and modified[f"{field}Name"] != original.get(f"{field}Name")
+            and modified.get(f"{field}ID", original.get(f"{field}ID"))
+            == original.get(f"{field}ID")
+        ]
+        if not changed:
+            return modified
+
+        metadata = self.get_ticket_metadata(app_id)
+        modified = dict(modified)
+        for kind, field in changed:
+            item_id = metadata.id_for(kind, modified.get(f"{field}Name"))
+            if item_id is not None:
+                modified[f"{field}ID"] = item_id
+        return modified
+
     def get_ticket_statuses(self, app_id):
         """Get available ticket statuses for the application
 
@@ -155,23 +764,70 @@ class TicketsClient:
         endpoint = f"api/{app_id}/tickets/statuses"
 
         # Make the API request
-        response = self.auth.make_api_request("GET", endpoint)
+        response = self.transport.request("GET", endpoint)
 
         if response and response.status_code == 200:
-            return response.json()
+            return decode_response(response)
         else:
             print("Error retrieving ticket statuses")
-            if response:
+            if response is not None:
                 print(f"Status code: {response.status_code}")
                 print(f"Response: {response.text[:200]}...")
             return []
 
-    def get_ticket_feed(self, app_id, ticket_id):
+    def get_ticket_metadata(self, app_id, force_refresh=False):
+        """Get cached statuses, priorities, types, sources and urgencies
+
+        The metadata is downloaded once per application and kept on disk, see
+        TicketMetadata for name and ID lookups.
+
+        Args:
+            app_id (str): The application ID
+            force_refresh (bool): Download the metadata even if the cache is fresh
+
+        Returns:
+            TicketMetadata: Metadata cache for the application
+        """
+        metadata = get_ticket_metadata(
+            getattr(self.auth, "environment", None) or self.auth.base_url,
+            app_id,
+            self._fetch_list,
+        )
+        metadata.warm(force_refresh)
+        return metadata
+
+    def _fetch_list(self, endpoint):
+        """Download a list endpoint
+
+        Returns:
+            list: The decoded list, or None if the request failed
+        """
+        try:
+            response = self.transport.request("GET", endpoint)
+        except RateLimitError as e:
+            print(f"Error: {str(e)}")
+            return None  # The cache retries later
+
+        if response is not None and response.status_code == 200:
+            return decode_response(response)
+        else:
+            print(f"Error retrieving {endpoint}")
+            if response is not None:
+                print(f"Status code: {response.status_code}")
+                print(f"Response: {response.text[:200]}...")
+            return None
+
+    def get_ticket_feed(self, app_id, ticket_id, modified_date=None):
         """Get feed entries (comments/updates) for a ticket
 
+        With the ticket's ModifiedDate (from a search result or the local
+        store), a feed cached since the last change is returned without a
+        request; otherwise the fetched feed is merged into the cache.
+
         Args:
             app_id (str): The application ID
             ticket_id (str): The ticket ID
+            modified_date (str, optional): The ticket's current ModifiedDate
 
         Returns:
             list: Feed entries for the ticket
@@ -179,21 +835,144 @@ class TicketsClient:
         if not app_id or not ticket_id:
             return []
 
+        if modified_date:
+            entries = self.get_feed_cache().get(app_id, ticket_id, modified_date)
+            if entries is not None:
+                return entries
+
         # Construct the endpoint URL
         endpoint = f"api/{app_id}/tickets/{ticket_id}/feed"
 
         # Make the API request
-        response = self.auth.make_api_request("GET", endpoint)
+        response = self.transport.request("GET", endpoint)
 
         if response and response.status_code == 200:
-            return response.json()
+            entries = decode_response(response)
+            if modified_date:
+                return self.get_feed_cache().merge(
+                    app_id, ticket_id, entries, modified_date
+                )
+            return entries
         else:
             print(f"Error retrieving feed for ticket with ID {ticket_id}")
-            if response:
+            if response is not None:
                 print(f"Status code: {response.status_code}")
                 print(f"Response: {response.text[:200]}...")
             return []
 
+    def get_feed_cache(self):
+        """Get the local feed cache for this environment
+
+        Returns:
+            FeedCache: The cache, opened on first use
+        """
+        if self._feed_cache is None:
+            self._feed_cache = open_feed_cache(
+                getattr(self.auth, "environment", None) or "default"
+            )
+        return self._feed_cache
+
+    def iter_ticket_feeds(
+        self,
+        app_id,
+        ticket_ids,
+        max_workers=DEFAULT_BULK_WORKERS,
+        retries=DEFAULT_BULK_RETRIES,
+        records=False,
+    ):
+        """Fetch the feeds of many tickets concurrently
+
+        Feeds are yielded as soon as each one arrives, not in input order.
+        Tickets whose feed can't be retrieved are skipped with an error message.
+        Pass tickets instead of IDs to serve unchanged feeds from the feed
+        cache (see get_ticket_feed).
+
+        Args:
+            app_id (str): The application ID
+            ticket_ids (iterable): The ticket IDs, or tickets with ID and
+                ModifiedDate (may be a generator)
+            max_workers (int): Number of feeds fetched at the same time
+            retries (int): Extra attempts for transient failures (see is_transient)
+            records (bool): Give the entries as compact FeedEntry records
+
+        Yields:
+            tuple: (ticket_id, entries) for each ticket
+        """
+        if not app_id:
+            return
+
+        modified_dates = {}
+        cache = self.get_feed_cache()
+
+        def ids_to_fetch():
+            for item in ticket_ids:
+                if isinstance(item, Mapping):
+                    ticket_id = item.get("ID")
+                    modified_dates[str(ticket_id)] = item.get("ModifiedDate")
+                else:
+                    ticket_id = item
+                yield ticket_id
+
+        def fetch(ticket_id):
+            modified_date = modified_dates.get(str(ticket_id))
+            if modified_date:
+                entries = cache.get(app_id, ticket_id, modified_date)
+                if entries is not None:
+                    return ticket_id, entries
+            endpoint = f"api/{app_id}/tickets/{ticket_id}/feed"
+            response = self._request_with_retries("GET", endpoint, retries)
+            if response is None or response.status_code != 200:
+                return ticket_id, response
+            entries = decode_response(response)
+            if modified_date:
+                entries = cache.merge(app_id, ticket_id, entries, modified_date)
+            return ticket_id, entries
+
+        for ticket_id, result in iter_completed(
+            fetch, unique_ids(ids_to_fetch()), max_workers
+        ):
+            if isinstance(result, list):
+                yield ticket_id, list(FeedEntry.wrap(result)) if records else result
+            else:
+                print(
+                    f"Skipping feed for ticket {ticket_id}: {describe_failure(result)}"
+                )
+
+    def get_feed_timeline(
+        self,
+        app_id,
+        ticket_ids,
+        since=None,
+        newest_first=True,
+        max_workers=DEFAULT_BULK_WORKERS,
+        stream=False,
+    ):
+        """Get the feeds of many tickets as one timeline
+
+        Feeds are fetched concurrently (see iter_ticket_feeds). By default
+        they are merged by CreatedDate with a k-way merge, which is not
+        streaming: the first entry can only be known once every feed has
+        arrived. With stream=True each ticket's entries are yielded as soon
+        as its feed arrives, sorted within the ticket only.
+
+        Args:
+            app_id (str): The application ID
+            ticket_ids (iterable): The ticket IDs, or tickets (see iter_ticket_feeds)
+            since (datetime.datetime, optional): Only entries created after this
+                (naive values are taken as UTC)
+            newest_first (bool): Start with the most recent entry
+            max_workers (int): Number of feeds fetched at the same time
+            stream (bool): Yield feeds as they arrive instead of merging them
+
+        Returns:
+            iterator: (created, ticket_id, entry) tuples, created being a UTC
+            datetime
+        """
+        feeds = self.iter_ticket_feeds(app_id, ticket_ids, max_workers)
+        if stream:
+            return stream_feeds(feeds, newest_first=newest_first, since=since)
+        return merge_feeds(feeds, newest_first=newest_first, since=since)
+
     def add_feed_entry(self, app_id, ticket_id, feed_entry):
         """Add a comment or update to a ticket's feed
 
@@ -212,57 +991,151 @@ class TicketsClient:
         endpoint = f"api/{app_id}/tickets/{ticket_id}/feed"
 
         # Make the API request
-        response = self.auth.make_api_request("POST", endpoint, json=feed_entry)
+        response = self.transport.request("POST", endpoint, json=feed_entry)
 
         if response and response.status_code == 200:
-            return response.json()
+            return decode_response(response)
         else:
             print(f"Error adding feed entry to ticket with ID {ticket_id}")
-            if response:
+            if response is not None:
                 print(f"Status code: {response.status_code}")
                 print(f"Response: {response.text[:200]}...")
             return None
 
-    def get_applications(self):
-        """Get available ticketing applications
+    def add_feed_entries(
+        self,
+        app_id,
+        entries,
+        journal_path,
+        max_workers=DEFAULT_CREATE_WORKERS,
+        retries=DEFAULT_BULK_RETRIES,
+        retry_uncertain=False,
+    ):
+        """Post many feed entries (comments/updates) concurrently
+
+        Each (ticket, entry) pair is written to a journal before and after
+        its request, so running the same entries again skips those already
+        posted, and the same entry is never posted to a ticket twice. An
+        entry whose request was cut off is reported as uncertain and only
+        posted again with retry_uncertain.
+
+        Args:
+            app_id (str): The application ID
+            entries (iterable): (ticket_id, feed_entry) pairs (may be a generator)
+            journal_path (str): Checkpoint journal file
+            max_workers (int): Number of entries posted at the same time
+            retries (int): Extra attempts while the API is unavailable (429/503)
+            retry_uncertain (bool): Post entries whose earlier outcome is unknown
 
         Returns:
-            list: Available ticketing applications
+            BulkCreateResult: New feed entry IDs keyed by "ticket_id:fingerprint",
+            plus failed and uncertain entries
         """
-        print("DEBUG: Calling get_applications method")
+        result = BulkCreateResult()
+        if not app_id:
+            return result
 
-        # Construct the endpoint URL
-        endpoint = "api/applications"
-        print(f"DEBUG: Using endpoint: {endpoint}")
+        def post(item):
+            key, (ticket_id, feed_entry), fingerprint = item
+            endpoint = f"api/{app_id}/tickets/{ticket_id}/feed"
+            return key, *self._post_journaled(
+                journal, key, fingerprint, endpoint, feed_entry, 200, retries
+            )
 
-        # Make the API request
-        response = self.auth.make_api_request("GET", endpoint)
+        def keyed_entries():
+            seen = set()
+            for ticket_id, feed_entry in entries:
+                if not ticket_id or not feed_entry:
+                    continue
+                fingerprint = row_fingerprint(feed_entry)
+                key = f"{ticket_id}:{fingerprint}"
+                if key not in seen:
+                    seen.add(key)
+                    yield key, (ticket_id, feed_entry), fingerprint
 
-        if response:
-            print(f"DEBUG: Response status: {response.status_code}")
-            print(f"DEBUG: Response headers: {response.headers}")
-        else:
-            print("DEBUG: No response received from API")
+        with Journal(journal_path) as journal:
+            for key, state, value in iter_completed(
+                post,
+                unjournaled(journal, keyed_entries(), result, retry_uncertain),
+                max_workers,
+            ):
+                result.add(key, state, value)
 
-        if response and response.status_code == 200:
-            apps = response.json()
-            print(f"DEBUG: Received {len(apps)} total applications")
+        return result
 
-            # Filter to only include ticketing applications
-            ticketing_apps = [app for app in apps if app.get("AppClass") == "TDTickets"]
-            print(f"DEBUG: Filtered to {len(ticketing_apps)} ticketing applications")
+    def get_applications(self, force_refresh=False):
+        """Get available ticketing applications
+
+        The application list is cached in memory and on disk per environment,
+        see ApplicationCatalog.
 
-            # Additional debug: print first app in detail
-            if ticketing_apps:
-                print(f"DEBUG: First app details: {ticketing_apps[0]}")
+        Args:
+            force_refresh (bool): Download the list even if the cache is fresh
 
-            return ticketing_apps
+        Returns:
+            list: Available ticketing applications
+        """
+        return self.applications.get_ticketing_applications(force_refresh)
+
+    def _fetch_applications(self):
+        """Download every application in the environment
+
+        Returns:
+            list: All applications, or None if the request failed
+        """
+        # Make the API request
+        try:
+            response = self.transport.request("GET", "api/applications")
+        except RateLimitError as e:
+            print(f"Error: {str(e)}")
+            return None  # The cache retries later
+
+        if response is not None and response.status_code == 200:
+            return decode_response(response)
         else:
             print("Error retrieving applications")
-            if response:
+            if response is not None:
                 print(f"Status code: {response.status_code}")
                 print(f"Response: {response.text[:200]}...")
-            return []
+            return None
+
+    def export_tickets(self, tickets, filename, compression="auto"):
+        """Stream tickets to an NDJSON file (one ticket per line)
+
+        Takes any iterable, so the output of iter_search_tickets or
+        iter_tickets is written as it arrives. The file only appears once
+        the export is complete.
+
+        Args:
+            tickets (iterable): Tickets to export
+            filename (str): Destination file; a .gz or .zst suffix compresses it
+            compression (str): "gzip", "zstd", None, or "auto" (from the suffix)
+
+        Returns:
+            int: Number of tickets written
+        """
+        return export_ndjson(tickets, filename, compression)
+
+    def export_ticket_table(
+        self, tickets, filename, file_format="auto", attributes=None
+    ):
+        """Write tickets to a Parquet, Arrow or CSV file for analysis
+
+        Tickets are flattened into typed columns, with dates as timestamps
+        and custom attributes pivoted into one column each. Parquet and
+        Arrow need pyarrow; CSV works without it.
+
+        Args:
+            tickets (iterable): Tickets to export
+            filename (str): Destination file (.parquet, .arrow/.feather or .csv)
+            file_format (str): "parquet", "arrow", "csv" or "auto" (from the suffix)
+            attributes (list, optional): Custom attribute names to include
+                (default: those found in the first batch of tickets)
+
+        Returns:
+            int: Number of tickets written
+        """
+        return export_ticket_columns(tickets, filename, file_format, attributes)
 
     def save_ticket_to_file(self, ticket, filename=None):
         """Save ticket details to a JSON file
@@ -281,6 +1154,20 @@ class TicketsClient:
             filename = f"ticket_{ticket.get('ID', 'unknown')}.json"
 
         with open(filename, "w") as f:
-            json.dump(ticket, f, indent=2)
+            json.dump(ticket, f, indent=2, default=json_default)
 
         return filename
+
+
+def _has_name_fields(data):
+    """Check whether ticket or search data names any metadata by name"""
+    return any(f"{field}Name" in data for _, field in TICKET_METADATA.values())
+
+
+def _ticket_or_skip(ticket_id, future):
+    """Yield a fetched ticket, or report why it couldn't be retrieved"""
+    response = future.result()
+    if response is not None and response.status_code == 200:
+        yield decode_response(response)
+    else:
+        print(f"Skipping ticket {ticket_id}: {describe_failure(response)}")
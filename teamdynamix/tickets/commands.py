@@ -363,7 +363,9 @@ def get_ticket_details_command(tickets_client, app_id, ticket_id):
         # Offer to show ticket history/feed
         show_history = input("\nShow ticket history/comments? (y/n): ").strip().lower()
         if show_history == "y":
-            feed_entries = tickets_client.get_ticket_feed(app_id, ticket_id)
+            feed_entries = tickets_client.get_ticket_feed(
+                app_id, ticket_id, ticket.get("ModifiedDate")
+            )
             display_feed_entries(feed_entries)
 
         # Option to save full JSON to file
@@ -5,7 +5,9 @@ TeamDynamix Ticket Display Functions
 Functions for displaying ticket information in the CLI
 """
 
-import datetime
+from teamdynamix.tickets.feed import feed_entry_time
+from teamdynamix.utils.dates import format_local_time, record_timestamp
+from teamdynamix.utils.pager import ListPager
 
 
 def format_ticket_summary(ticket):
@@ -49,13 +51,7 @@ def display_ticket_details(ticket):
     # Dates
     created_date = ticket.get("CreatedDate")
     if created_date:
-        # Convert from "/Date(1234567890000)/" format if needed
-        if isinstance(created_date, str) and created_date.startswith("/Date("):
-            timestamp = int(created_date[6:-2]) / 1000
-            created_date = datetime.datetime.fromtimestamp(timestamp).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            )
-        print(f"Created: {created_date}")
+        print(f"Created: {format_local_time(created_date)}")
 
     # People
     if ticket.get("RequestorName"):
@@ -91,34 +87,34 @@ def display_tickets_list(tickets):
         print("No tickets found.")
         return None, None
 
-    print(f"\nFound {len(tickets)} tickets:")
-    print("-" * 40)
-
-    for i, ticket in enumerate(tickets, 1):
-        app_id = ticket.get("AppID", "N/A")
-        ticket_id = ticket.get("ID", "N/A")
-        title = ticket.get("Title", "Untitled")
-        status = ticket.get("StatusName", "Unknown Status")
-        priority = ticket.get("PriorityName", "Unknown Priority")
-
-        print(f"{i}. #{ticket_id} - {title}")
-        print(f"   Status: {status} | Priority: {priority} | App ID: {app_id}")
-        print()
+    # Long lists are shown a page at a time
+    pager = ListPager(
+        tickets,
+        _format_ticket_row,
+        header=f"\nFound {len(tickets)} tickets:\n{'-' * 40}\n",
+        instructions=(
+            "\nEnter a number to view ticket details, "
+            "or press Enter to return to menu.\n"
+        ),
+        prompt=f"Select ticket [1-{len(tickets)}]: ",
+    )
+    index = pager.run()
+    if index is None:
+        return None, None
+    return tickets[index].get("AppID"), tickets[index].get("ID")
 
-    # Prompt for selection
-    print("\nEnter a number to view ticket details, or press Enter to return to menu.")
-    selection = input("Select ticket [1-{}]: ".format(len(tickets))).strip()
 
-    if selection and selection.isdigit():
-        index = int(selection) - 1
-        if 0 <= index < len(tickets):
-            app_id = tickets[index].get("AppID")
-            ticket_id = tickets[index].get("ID")
-            return app_id, ticket_id
-        else:
-            print("Invalid selection.")
-
-    return None, None
+def _format_ticket_row(number, ticket):
+    """Format one ticket as a list row"""
+    app_id = ticket.get("AppID", "N/A")
+    ticket_id = ticket.get("ID", "N/A")
+    title = ticket.get("Title", "Untitled")
+    status = ticket.get("StatusName", "Unknown Status")
+    priority = ticket.get("PriorityName", "Unknown Priority")
+    return (
+        f"{number}. #{ticket_id} - {title}\n"
+        f"   Status: {status} | Priority: {priority} | App ID: {app_id}\n\n"
+    )
 
 
 def display_feed_entries(feed_entries):
@@ -135,27 +131,16 @@ def display_feed_entries(feed_entries):
     print("-" * 40)
 
     # Sort entries by created date if available
-    sorted_entries = sorted(
-        feed_entries,
-        key=lambda x: x.get("CreatedDate", "0") if x.get("CreatedDate") else "0",
-        reverse=True,
-    )
+    sorted_entries = sorted(feed_entries, key=feed_entry_time, reverse=True)
 
     for entry in sorted_entries:
         # Get creator information
         creator = entry.get("CreatedByName", "Unknown")
 
-        # Get date information
-        created_date = entry.get("CreatedDate")
-        if (
-            created_date
-            and isinstance(created_date, str)
-            and created_date.startswith("/Date(")
-        ):
-            timestamp = int(created_date[6:-2]) / 1000
-            created_date = datetime.datetime.fromtimestamp(timestamp).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            )
+        # Get date information (already parsed for the sort above)
+        created_date = format_local_time(
+            record_timestamp(entry, "CreatedDate") or entry.get("CreatedDate")
+        )
 
         # Entry type and content
         entry_type = entry.get("TypeName", "Comment")
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix API Ticket Export Module
+
+Flattens tickets into typed columns for Parquet, Arrow or CSV files
+"""
+
+import csv
+import datetime
+import os
+import tempfile
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # Parquet and Arrow export are optional
+    pyarrow = None
+
+from teamdynamix.utils.dates import record_timestamp
+
+DEFAULT_BATCH_SIZE = 10000  # rows per record batch
+
+# Ticket field -> column type ("int", "str" or "timestamp")
+TICKET_COLUMNS = (
+    ("ID", "int"),
+    ("AppID", "int"),
+    ("AppName", "str"),
+    ("Title", "str"),
+    ("TypeName", "str"),
+    ("StatusName", "str"),
+    ("PriorityName", "str"),
+    ("UrgencyName", "str"),
+    ("ImpactName", "str"),
+    ("SourceName", "str"),
+    ("AccountName", "str"),
+    ("RequestorName", "str"),
+    ("RequestorEmail", "str"),
+    ("RequestorUid", "str"),
+    ("ResponsibleGroupName", "str"),
+    ("ResponsibleFullName", "str"),
+    ("CreatedDate", "timestamp"),
+    ("ModifiedDate", "timestamp"),
+    ("StartDate", "timestamp"),
+    ("EndDate", "timestamp"),
+    ("RespondedDate", "timestamp"),
+    ("CompletedDate", "timestamp"),
+    ("DaysOld", "int"),
+)
+
+# Prefix for columns pivoted from custom attributes
+ATTRIBUTE_PREFIX = "Attributes."
+
+# File suffix -> format used when format="auto"
+FORMAT_SUFFIXES = {
+    ".parquet": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".csv": "csv",
+}
+
+
+def _int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _attribute_value(attribute):
+    """Get the display value of a custom attribute"""
+    value = attribute.get("ValueText")
+    return attribute.get("Value") if value in (None, "") else value
+
+
+def attribute_names(tickets):
+    """Collect custom attribute names in order of first appearance
+
+    Args:
+        tickets (iterable): Tickets with an "Attributes" list
+
+    Returns:
+        list: Attribute names
+    """
+    names = {}
+    for ticket in tickets:
+        for attribute in ticket.get("Attributes") or ():
+            if attribute.get("Name"):
+                names.setdefault(attribute["Name"], None)
+    return list(names)
+
+
+def flatten_ticket(ticket, attributes=()):
+    """Flatten a ticket into a row of typed values
+
+    Args:
+        ticket (dict): Ticket details
+        attributes (iterable): Custom attribute names to pivot into columns
+
+    Returns:
+        dict: Column name -> value, with dates as UTC datetimes
+    """
+    row = {}
+    for field, kind in TICKET_COLUMNS:
+        if kind == "timestamp":
+            row[field] = record_timestamp(ticket, field)
+        elif kind == "int":
+            row[field] = _int(ticket.get(field))
+        else:
+            row[field] = ticket.get(field)
+
+    values = {
+        attribute.get("Name"): _attribute_value(attribute)
+        for attribute in ticket.get("Attributes") or ()
+    }
+    for name in attributes:
+        value = values.get(name)
+        row[ATTRIBUTE_PREFIX + name] = None if value is None else str(value)
+    return row
+
+
+class _ArrowWriter:
+    """Parquet or Arrow IPC file written one record batch at a time"""
+
+    def __init__(self, path, columns, file_format):
+        types = {
+            "int": pyarrow.int64(),
+            "str": pyarrow.string(),
+            "timestamp": pyarrow.timestamp("ms", tz="UTC"),
+        }
+        self.schema = pyarrow.schema([(name, types[kind]) for name, kind in columns])
+        if file_format == "parquet":
+            self._writer = pyarrow.parquet.ParquetWriter(path, self.schema)
+        else:
+            self._writer = pyarrow.ipc.new_file(path, self.schema)
+
+    def write_batch(self, rows):
+        batch = pyarrow.RecordBatch.from_pylist(rows, schema=self.schema)
+        if isinstance(self._writer, pyarrow.parquet.ParquetWriter):
+            self._writer.write_batch(batch)
+        else:
+            self._writer.write(batch)
+
+    def close(self):
+        self._writer.close()
+
+
+class _CsvWriter:
+    """CSV file with ISO 8601 dates and empty cells for missing values"""
+
+    def __init__(self, path, columns):
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._names = [name for name, _ in columns]
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self._names)
+
+    def write_batch(self, rows):
+        self._writer.writerows(
+            [[_csv_value(row.get(name)) for name in self._names] for row in rows]
+        )
+
+    def close(self):
+        self._file.close()
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime.datetime):
+        return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+    return value
+
+
+def resolve_format(path, file_format="auto"):
+    """Pick the export format for a file
+
+    With "auto" the format comes from the file suffix; files without a
+    known suffix get Parquet when pyarrow is installed and CSV otherwise.
+
+    Args:
+        path (str): Destination file
+        file_format (str): "parquet", "arrow", "csv" or "auto"
+
+    Returns:
+        str: "parquet", "arrow" or "csv"
+
+    Raises:
+        ValueError: If the format is unknown, or needs pyarrow and it's missing
+    """
+    if file_format == "auto":
+        file_format = FORMAT_SUFFIXES.get(os.path.splitext(path)[1].lower())
+        if file_format is None:
+            file_format = "parquet" if pyarrow is not None else "csv"
+    if file_format not in ("parquet", "arrow", "csv"):
+        raise ValueError(f"Unknown export format: {file_format}")
+    if file_format != "csv" and pyarrow is None:
+        raise ValueError(f"{file_format} export needs the pyarrow package")
+    return file_format
+
+
+def export_ticket_columns(
+    tickets,
+    path,
+    file_format="auto",
+    attributes=None,
+    batch_size=DEFAULT_BATCH_SIZE,
+):
+    """Write tickets to a columnar file in record batches
+
+    Custom attributes become one string column each. The columns are fixed
+    when the file is created: unless attributes is given, they are taken
+    from the tickets in the first batch, and attributes that only appear
+    later are left out (with a warning).
+
+    Args:
+        tickets (iterable): Tickets to export (may be a generator)
+        path (str): Destination file (.parquet, .arrow/.feather or .csv)
+        file_format (str): "parquet", "arrow", "csv" or "auto" (from the suffix)
+        attributes (list, optional): Custom attribute names to include
+        batch_size (int): Tickets per record batch
+
+    Returns:
+        int: Number of tickets written
+
+    Raises:
+        ValueError: If the format is unknown or needs a missing package
+    """
+    file_format = resolve_format(path, file_format)
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    os.close(fd)
+
+    writer = None
+    count = 0
+    skipped = set()
+    tickets = iter(tickets)
+    try:
+        while True:
+            batch = [ticket for _, ticket in zip(range(batch_size), tickets)]
+            if not batch and writer is not None:
+                break
+
+            if writer is None:
+                if attributes is None:
+                    attributes = attribute_names(batch)
+                columns = list(TICKET_COLUMNS) + [
+                    (ATTRIBUTE_PREFIX + name, "str") for name in attributes
+                ]
+                if file_format == "csv":
+                    writer = _CsvWriter(tmp_path, columns)
+                else:
+                    writer = _ArrowWriter(tmp_path, columns, file_format)
+                known = set(attributes)
+
+            skipped.update(name for name in attribute_names(batch) if name not in known)
+            if batch:
+                writer.write_batch(
+                    [flatten_ticket(ticket, attributes) for ticket in batch]
+                )
+                count += len(batch)
+
+        writer.close()
+        os.replace(tmp_path, path)
+    except BaseException:
+        if writer is not None:
+            try:
+                writer.close()
+            except Exception:
+                pass
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    if skipped:
+        print(
+            "Warning: attributes not in the first batch were left out: "
+            + ", ".join(sorted(skipped))
+        )
+    return count
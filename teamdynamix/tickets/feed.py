@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix API Ticket Feed Module
+
+Feed timeline merging and the per-ticket feed cache
+"""
+
+import datetime
+import heapq
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from teamdynamix.tickets.search import format_search_date, parse_search_date
+from teamdynamix.utils.dates import parse_timestamp, record_timestamp
+from teamdynamix.utils.decode import decode_json
+from teamdynamix.utils.models import json_default
+from teamdynamix.utils.storage import cache_dir
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS feed_entries (
+    app_id TEXT NOT NULL,
+    ticket_id INTEGER NOT NULL,
+    entry_id INTEGER NOT NULL,
+    created_date TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (app_id, ticket_id, entry_id)
+);
+CREATE TABLE IF NOT EXISTS feed_state (
+    app_id TEXT NOT NULL,
+    ticket_id INTEGER NOT NULL,
+    modified_date TEXT,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (app_id, ticket_id)
+);
+"""
+
+# Sort position for entries without a usable CreatedDate
+_NO_DATE = datetime.datetime.min.replace(tzinfo=datetime.timezone.utc)
+
+
+def feed_entry_time(entry):
+    """Get when a feed entry was created
+
+    Args:
+        entry (dict): Feed entry
+
+    Returns:
+        datetime.datetime: UTC creation time (datetime.min if unknown)
+    """
+    return record_timestamp(entry, "CreatedDate") or _NO_DATE
+
+
+def _feed_run(ticket_id, entries, newest_first, since):
+    """Sort one ticket's feed into (created, ticket_id, entry) tuples"""
+    run = [(feed_entry_time(entry), ticket_id, entry) for entry in entries or ()]
+    if since is not None:
+        run = [item for item in run if item[0] >= since]
+    run.sort(key=_sort_key, reverse=newest_first)
+    return run
+
+
+def merge_feeds(feeds, newest_first=True, since=None):
+    """Merge ticket feeds into one timeline
+
+    Each feed is sorted on its own, then the sorted feeds are merged k ways
+    with heapq.merge, which produces the timeline lazily instead of sorting
+    every entry again. The first entry of a merged timeline depends on every
+    feed, so nothing is produced until all feeds have been read; see
+    stream_feeds for entries as each feed arrives.
+
+    Args:
+        feeds (iterable): (ticket_id, entries) pairs
+        newest_first (bool): Start with the most recent entry
+        since (datetime.datetime, optional): Drop entries created before this
+            (naive values are taken as UTC)
+
+    Returns:
+        iterator: (created, ticket_id, entry) tuples in timeline order
+
+    Raises:
+        ValueError: If since isn't a date
+    """
+    since = parse_search_date(since)
+    runs = [
+        _feed_run(ticket_id, entries, newest_first, since)
+        for ticket_id, entries in feeds
+    ]
+    return heapq.merge(*runs, key=_sort_key, reverse=newest_first)
+
+
+def stream_feeds(feeds, newest_first=True, since=None):
+    """Yield each ticket's feed entries as soon as its feed arrives
+
+    Entries are in timeline order within each ticket, and tickets follow
+    in the order their feeds arrive.
+
+    Args:
+        feeds (iterable): (ticket_id, entries) pairs
+        newest_first (bool): Start each ticket with its most recent entry
+        since (datetime.datetime, optional): Drop entries created before this
+            (naive values are taken as UTC)
+
+    Yields:
+        tuple: (created, ticket_id, entry)
+
+    Raises:
+        ValueError: If since isn't a date
+    """
+    since = parse_search_date(since)
+    for ticket_id, entries in feeds:
+        yield from _feed_run(ticket_id, entries, newest_first, since)
+
+
+def _sort_key(item):
+    return item[0]
+
+
+def _date_key(modified_date):
+    """Normalize an API date so it compares and sorts as text"""
+    parsed = parse_timestamp(modified_date)
+    return format_search_date(parsed) if parsed else None
+
+
+class FeedCache:
+    """Ticket feeds stored locally in SQLite, entry by entry
+
+    Each ticket's feed is stored along with the ticket's ModifiedDate when it
+    was fetched. A feed is only fetched again once the ticket has been
+    modified since, and then only new or changed entries are written.
+    Entries deleted in TeamDynamix stay in the cache.
+    """
+
+    def __init__(self, path):
+        """Open (and create if needed) a feed database
+
+        Args:
+            path (str): SQLite database file, or ":memory:"
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+        if path != ":memory:":
+            os.chmod(path, 0o600)
+
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self._conn.close()
+
+    def _entries(self, app_id, ticket_id):
+        """Read a ticket's cached entries, newest first (lock must be held)"""
+        rows = self._conn.execute(
+            "SELECT data FROM feed_entries WHERE app_id = ? AND ticket_id = ? "
+            "ORDER BY created_date DESC, entry_id DESC",
+            (str(app_id), int(ticket_id)),
+        ).fetchall()
+        return [decode_json(row[0]) for row in rows]
+
+    def get(self, app_id, ticket_id, modified_date):
+        """Get a ticket's cached feed if the ticket hasn't changed since
+
+        Args:
+            app_id (str): The application ID
+            ticket_id (int): The ticket ID
+            modified_date: The ticket's current ModifiedDate
+
+        Returns:
+            list: Feed entries newest first, or None if the feed must be fetched
+        """
+        key = _date_key(modified_date)
+        if key is None:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT modified_date FROM feed_state "
+                "WHERE app_id = ? AND ticket_id = ?",
+                (str(app_id), int(ticket_id)),
+            ).fetchone()
+            if row is None or row[0] != key:
+                return None
+            return self._entries(app_id, ticket_id)
+
+    def merge(self, app_id, ticket_id, entries, modified_date=None):
+        """Add a freshly fetched feed to the cache
+
+        Args:
+            app_id (str): The application ID
+            ticket_id (int): The ticket ID
+            entries (list): Feed entries as returned by the API
+            modified_date: The ticket's ModifiedDate when the feed was fetched
+
+        Returns:
+            list: Every cached entry for the ticket, newest first
+        """
+        rows = [
+            (
+                str(app_id),
+                int(ticket_id),
+                entry["ID"],
+                _date_key(entry.get("CreatedDate")),
+                json.dumps(entry, sort_keys=True, default=json_default),
+            )
+            for entry in entries or ()
+            if entry.get("ID") is not None
+        ]
+        with self._lock, self._conn:
+            # Unchanged entries are left alone
+            self._conn.executemany(
+                "INSERT INTO feed_entries "
+                "(app_id, ticket_id, entry_id, created_date, data) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (app_id, ticket_id, entry_id) DO UPDATE SET "
+                "created_date = excluded.created_date, data = excluded.data "
+                "WHERE data != excluded.data",
+                rows,
+            )
+            self._conn.execute(
+                "INSERT INTO feed_state (app_id, ticket_id, modified_date, fetched_at) "
+                "VALUES (?, ?, ?, ?) ON CONFLICT (app_id, ticket_id) DO UPDATE SET "
+                "modified_date = excluded.modified_date, "
+                "fetched_at = excluded.fetched_at",
+                (
+                    str(app_id),
+                    int(ticket_id),
+                    _date_key(modified_date),
+                    time.time(),
+                ),
+            )
+            return self._entries(app_id, ticket_id)
+
+    def clear(self, app_id, ticket_id=None):
+        """Remove cached feeds for an application or a single ticket"""
+        where = "app_id = ?"
+        args = [str(app_id)]
+        if ticket_id is not None:
+            where += " AND ticket_id = ?"
+            args.append(int(ticket_id))
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM feed_entries WHERE {where}", args)
+            self._conn.execute(f"DELETE FROM feed_state WHERE {where}", args)
+
+
+def open_feed_cache(environment):
+    """Open the feed cache for an environment in the cache directory
+
+    Args:
+        environment (str): Environment name ('sandbox' or 'production')
+
+    Returns:
+        FeedCache: The environment's feed cache
+    """
+    return FeedCache(os.path.join(cache_dir("feeds"), f"{environment}.sqlite3"))
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix API Ticket Patch Module
+
+Builds JSON Patch operations from changes to a ticket
+"""
+
+# Fields the API sets itself; changes to them are never sent
+READ_ONLY_FIELDS = frozenset(
+    (
+        "ID",
+        "AppID",
+        "AppName",
+        "Uri",
+        "CreatedDate",
+        "CreatedUid",
+        "CreatedFullName",
+        "CreatedEmail",
+        "ModifiedDate",
+        "ModifiedUid",
+        "ModifiedFullName",
+        "DaysOld",
+        "Attachments",
+        "Tasks",
+        "Notify",
+    )
+)
+
+
+def _escape(field):
+    """Escape a field name for use in a JSON Pointer"""
+    return str(field).replace("~", "~0").replace("/", "~1")
+
+
+def _is_derived(field, ticket):
+    """Check whether a field is a display value for an ID field
+
+    StatusName is derived from StatusID, RequestorName from RequestorUid,
+    and so on; the API ignores changes to them.
+    """
+    for suffix in ("FullName", "Name", "Email"):
+        if field.endswith(suffix) and field != suffix:
+            base = field[: -len(suffix)]
+            if f"{base}ID" in ticket or f"{base}Uid" in ticket:
+                return True
+    return False
+
+
+def _attribute_values(ticket):
+    """Map custom attribute IDs to their values"""
+    return {
+        attribute["ID"]: attribute.get("Value")
+        for attribute in ticket.get("Attributes") or ()
+        if attribute.get("ID") is not None
+    }
+
+
+def diff_ticket(original, modified, remove_missing=False):
+    """Compute the JSON Patch that turns one ticket into another
+
+    Only top-level fields and custom attribute values are compared; a
+    changed nested value is replaced as a whole. Read-only fields and
+    display names derived from an ID field are skipped. Fields and custom
+    attributes left out of the modified ticket are kept as they are, so it
+    can hold just the changed fields.
+
+    Args:
+        original (dict): The ticket as retrieved
+        modified (dict): The same ticket with changes applied
+        remove_missing (bool): Remove fields and custom attributes that are
+            missing from the modified ticket
+
+    Returns:
+        list: JSON Patch operations (empty if nothing changed)
+    """
+    operations = []
+    for field in sorted(set(original) | set(modified)):
+        if (
+            field in READ_ONLY_FIELDS
+            or field == "Attributes"
+            or _is_derived(field, original)
+            or _is_derived(field, modified)
+        ):
+            continue
+        if field not in modified:
+            if remove_missing:
+                operations.append({"op": "remove", "path": f"/{_escape(field)}"})
+        elif field not in original:
+            operations.append(
+                {"op": "add", "path": f"/{_escape(field)}", "value": modified[field]}
+            )
+        elif original[field] != modified[field]:
+            operations.append(
+                {
+                    "op": "replace",
+                    "path": f"/{_escape(field)}",
+                    "value": modified[field],
+                }
+            )
+
+    before = _attribute_values(original)
+    after = _attribute_values(modified)
+    for attribute_id in sorted(set(before) | set(after)):
+        path = f"/attributes/{attribute_id}"
+        if attribute_id not in after:
+            if remove_missing:
+                operations.append({"op": "remove", "path": path})
+        elif before.get(attribute_id) != after[attribute_id]:
+            operations.append(
+                {
+                    "op": "add" if attribute_id not in before else "replace",
+                    "path": path,
+                    "value": after[attribute_id],
+                }
+            )
+    return operations
+
+
+def field_patch(fields):
+    """Build a patch that sets fields to new values
+
+    Useful for applying the same change to many tickets.
+
+    Args:
+        fields (dict): Field name -> new value, e.g. {"StatusID": 123}
+
+    Returns:
+        list: JSON Patch "replace" operations
+    """
+    return [
+        {"op": "replace", "path": f"/{_escape(field)}", "value": value}
+        for field, value in fields.items()
+    ]
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix API Ticket Query Module
+
+Translates ticket search parameters into SQL for the local ticket store
+"""
+
+from teamdynamix.tickets.search import format_search_date, parse_search_date
+
+# Search parameter -> (column, how it matches)
+QUERY_FILTERS = {
+    "ID": ("id", "equals"),
+    "TicketIDs": ("id", "in"),
+    "Title": ("title", "contains"),
+    "StatusName": ("status_name", "equals"),
+    "StatusIDs": ("status_id", "in"),
+    "PriorityName": ("priority_name", "equals"),
+    "PriorityIDs": ("priority_id", "in"),
+    "RequestorName": ("requestor_name", "contains"),
+    "RequestorUids": ("requestor_uid", "in"),
+    "ResponsibleGroupName": ("group_name", "equals"),
+    "ResponsibleGroupIDs": ("group_id", "in"),
+    "CreatedDateFrom": ("created_date", "from"),
+    "CreatedDateTo": ("created_date", "to"),
+    "ModifiedDateFrom": ("modified_date", "from"),
+    "ModifiedDateTo": ("modified_date", "to"),
+}
+
+# Ticket field -> column, for sorting and grouping
+QUERY_FIELDS = {
+    "ID": "id",
+    "Title": "title",
+    "StatusName": "status_name",
+    "PriorityName": "priority_name",
+    "RequestorName": "requestor_name",
+    "ResponsibleGroupName": "group_name",
+    "CreatedDate": "created_date",
+    "ModifiedDate": "modified_date",
+}
+
+# Name columns compare case-insensitively, as declared in the store's schema
+NOCASE_COLUMNS = frozenset(("status_name", "priority_name", "group_name"))
+
+# Indexes for the filters and groupings dashboards use most
+QUERY_INDEXES = """
+CREATE INDEX IF NOT EXISTS tickets_status ON tickets (app_id, status_name);
+CREATE INDEX IF NOT EXISTS tickets_status_id ON tickets (app_id, status_id);
+CREATE INDEX IF NOT EXISTS tickets_priority ON tickets (app_id, priority_name);
+CREATE INDEX IF NOT EXISTS tickets_group ON tickets (app_id, group_id);
+CREATE INDEX IF NOT EXISTS tickets_group_name ON tickets (app_id, group_name);
+CREATE INDEX IF NOT EXISTS tickets_requestor ON tickets (app_id, requestor_uid);
+CREATE INDEX IF NOT EXISTS tickets_created ON tickets (app_id, created_date);
+CREATE INDEX IF NOT EXISTS tickets_modified ON tickets (app_id, modified_date);
+"""
+
+
+def collated(column):
+    """Get a column as it is compared, sorted and grouped"""
+    return f"{column} COLLATE NOCASE" if column in NOCASE_COLUMNS else column
+
+
+def _escape_like(text):
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def build_where(app_id, search_params):
+    """Build the WHERE clause for a search against the local store
+
+    Parameters without a local equivalent are ignored. Filters combine
+    with AND, the way the search endpoint combines them.
+
+    Args:
+        app_id (str): The application ID
+        search_params (dict): Parameters for ticket search
+
+    Returns:
+        tuple: (sql, args) with sql starting "WHERE"
+
+    Raises:
+        ValueError: If a filter value can't be used (e.g. an invalid date)
+    """
+    clauses = ["app_id = ?"]
+    args = [str(app_id)]
+
+    for name, value in (search_params or {}).items():
+        if name not in QUERY_FILTERS or value is None or value == "":
+            continue
+        column, match = QUERY_FILTERS[name]
+
+        if match == "equals":
+            clauses.append(f"{collated(column)} = ?")
+            args.append(value)
+        elif match == "contains":
+            clauses.append(f"{column} LIKE ? ESCAPE '\\'")
+            args.append(f"%{_escape_like(str(value))}%")
+        elif match == "in":
+            values = list(value) if isinstance(value, (list, tuple, set)) else [value]
+            if not values:
+                continue
+            clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+            args.extend(values)
+        else:
+            date = format_search_date(parse_search_date(value))
+            clauses.append(f"{column} {'>=' if match == 'from' else '<='} ?")
+            args.append(date)
+
+    return "WHERE " + " AND ".join(clauses), args
+
+
+def build_order(sort_by, descending=False):
+    """Build the ORDER BY clause for a sort field
+
+    Args:
+        sort_by (str): Ticket field to sort by (see QUERY_FIELDS)
+        descending (bool): Sort largest/newest first
+
+    Returns:
+        str: The ORDER BY clause, with ID as the tie breaker
+
+    Raises:
+        ValueError: If the field can't be sorted on
+    """
+    if sort_by not in QUERY_FIELDS:
+        raise ValueError(f"Can't sort tickets by {sort_by}")
+    direction = "DESC" if descending else "ASC"
+    column = QUERY_FIELDS[sort_by]
+    if column == "id":
+        return f"ORDER BY id {direction}"
+    return f"ORDER BY {collated(column)} {direction}, id {direction}"
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix API Tickets Search Module
+
+Splits large ticket searches into date windows
+"""
+
+import datetime
+
+from teamdynamix.utils.dates import parse_timestamp
+
+DEFAULT_PAGE_SIZE = 1000  # MaxResults sent for each window
+DEFAULT_WINDOW = datetime.timedelta(days=30)
+MIN_WINDOW = datetime.timedelta(seconds=1)
+
+# Searches without a start date begin here
+DEFAULT_SEARCH_START = datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class SearchError(Exception):
+    """A search window couldn't be fetched, so the results are incomplete
+
+    Attributes:
+        resume_from (datetime.datetime): Start of the window that failed;
+            every ticket before it has already been yielded
+    """
+
+    def __init__(self, message, resume_from):
+        super().__init__(message)
+        self.resume_from = resume_from
+
+
+def parse_search_date(value):
+    """Parse a search date given as a datetime, date or TeamDynamix date string
+
+    Args:
+        value: datetime, date, ISO 8601 or "/Date(...)/" string (naive values
+            are taken as UTC)
+
+    Returns:
+        datetime.datetime: UTC datetime, or None if value is empty
+
+    Raises:
+        ValueError: If value isn't a date
+    """
+    if not value:
+        return None
+    result = parse_timestamp(value)
+    if result is None:
+        raise ValueError(f"Invalid date: {value!r}")
+    return result
+
+
+def format_search_date(value):
+    """Format a datetime the way the search API expects it
+
+    Args:
+        value (datetime.datetime): Timezone-aware datetime
+
+    Returns:
+        str: ISO 8601 UTC timestamp, e.g. "2024-01-31T00:00:00Z"
+    """
+    return value.astimezone(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def iter_search_windows(
+    search,
+    search_params,
+    page_size=DEFAULT_PAGE_SIZE,
+    window=DEFAULT_WINDOW,
+    date_field="CreatedDate",
+):
+    """Run a ticket search one date window at a time
+
+    Windows that come back full (page_size results) are split in half and
+    searched again, and windows that come back nearly empty make the next
+    window twice as long, so dense and sparse periods both take few
+    requests. Tickets on the boundary of two windows are only returned once.
+
+    Args:
+        search (callable): Takes a search body and returns a list of tickets,
+            or None if the request failed
+        search_params (dict): Search filters; {date_field}From/{date_field}To
+            limit the overall range (default 2000-01-01 to now)
+        page_size (int): MaxResults sent for each window
+        window (datetime.timedelta): Length of the first window
+        date_field (str): "CreatedDate" or "ModifiedDate"
+
+    Yields:
+        tuple: (window_end, tickets) for each completed window, in date order
+
+    Raises:
+        SearchError: If a window's search fails (after the windows before it
+            were yielded)
+    """
+    search_params = dict(search_params or {})
+    search_params.pop("MaxResults", None)
+    start = parse_search_date(search_params.pop(f"{date_field}From", None))
+    end = parse_search_date(search_params.pop(f"{date_field}To", None))
+    start = start or DEFAULT_SEARCH_START
+    end = end or datetime.datetime.now(datetime.timezone.utc)
+
+    previous_ids = set()  # IDs from the last window, for boundary duplicates
+    while start < end:
+        stop = min(start + window, end)
+        params = dict(search_params)
+        params[f"{date_field}From"] = format_search_date(start)
+        params[f"{date_field}To"] = format_search_date(stop)
+        params["MaxResults"] = page_size
+
+        tickets = search(params)
+        if tickets is None:
+            raise SearchError(
+                f"Error searching tickets by {date_field} from "
+                f"{params[f'{date_field}From']} to {params[f'{date_field}To']}",
+                start,
+            )
+
+        if len(tickets) >= page_size and stop - start > MIN_WINDOW:
+            # Too many tickets for one request, try a shorter window
+            window = max((stop - start) / 2, MIN_WINDOW)
+            continue
+        if len(tickets) >= page_size:
+            print(
+                f"Warning: more than {page_size} tickets with {date_field} "
+                f"{params[f'{date_field}From']}, some may be missing"
+            )
+
+        window_ids = set()
+        unique = []
+        for ticket in tickets:
+            ticket_id = ticket.get("ID")
+            if ticket_id in previous_ids or ticket_id in window_ids:
+                continue
+            window_ids.add(ticket_id)
+            unique.append(ticket)
+        yield stop, unique
+
+        previous_ids = window_ids
+        if len(tickets) < page_size // 4:
+            window = (stop - start) * 2
+        start = stop
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix API Ticket Store Module
+
+Local SQLite copy of tickets kept current by incremental sync
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from teamdynamix.tickets.query import (
+    QUERY_FIELDS,
+    QUERY_INDEXES,
+    build_order,
+    build_where,
+    collated,
+)
+from teamdynamix.tickets.search import format_search_date, parse_search_date
+from teamdynamix.utils.dates import parse_timestamp
+from teamdynamix.utils.decode import decode_json
+from teamdynamix.utils.models import json_default
+from teamdynamix.utils.storage import cache_dir
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tickets (
+    app_id TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    title TEXT,
+    status_id INTEGER,
+    status_name TEXT COLLATE NOCASE,
+    priority_id INTEGER,
+    priority_name TEXT COLLATE NOCASE,
+    requestor_uid TEXT,
+    requestor_name TEXT,
+    group_id INTEGER,
+    group_name TEXT COLLATE NOCASE,
+    created_date TEXT,
+    modified_date TEXT,
+    data TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (app_id, id)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    app_id TEXT PRIMARY KEY,
+    watermark TEXT,
+    synced_at REAL
+);
+"""
+
+# Columns filled from ticket fields, in insert order
+_COLUMNS = (
+    ("title", "Title"),
+    ("status_id", "StatusID"),
+    ("status_name", "StatusName"),
+    ("priority_id", "PriorityID"),
+    ("priority_name", "PriorityName"),
+    ("requestor_uid", "RequestorUid"),
+    ("requestor_name", "RequestorName"),
+    ("group_id", "ResponsibleGroupID"),
+    ("group_name", "ResponsibleGroupName"),
+)
+
+
+def _store_date(value):
+    """Normalize an API date so stored dates sort as text"""
+    if not value:
+        return None
+    parsed = parse_timestamp(value)
+    return format_search_date(parsed) if parsed else value
+
+
+class TicketStore:
+    """Tickets stored locally in SQLite, one database for every application
+
+    Each application has a watermark: the ModifiedDate up to which the
+    store is known to be complete. Tickets and the watermark are written in
+    the same transaction, so an interrupted sync never moves the watermark
+    past tickets that weren't stored.
+    """
+
+    def __init__(self, path):
+        """Open (and create if needed) a ticket database
+
+        Args:
+            path (str): SQLite database file, or ":memory:"
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.executescript(QUERY_INDEXES)
+        self._conn.commit()
+
+        if path != ":memory:":
+            os.chmod(path, 0o600)
+
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self._conn.close()
+
+    def count(self, app_id=None):
+        """Count stored tickets
+
+        Args:
+            app_id (str, optional): Only count this application's tickets
+
+        Returns:
+            int: Number of tickets
+        """
+        with self._lock:
+            if app_id is None:
+                row = self._conn.execute("SELECT COUNT(*) FROM tickets").fetchone()
+            else:
+                row = self._conn.execute(
+                    "SELECT COUNT(*) FROM tickets WHERE app_id = ?", (str(app_id),)
+                ).fetchone()
+        return row[0]
+
+    def upsert(self, app_id, tickets, watermark=None):
+        """Add or replace tickets, optionally moving the watermark
+
+        Args:
+            app_id (str): The application ID
+            tickets (iterable): Ticket records as returned by the API
+            watermark (datetime.datetime, optional): New watermark, stored in
+                the same transaction as the tickets
+
+        Returns:
+            int: Number of tickets stored
+        """
+        now = time.time()
+        rows = [
+            (
+                str(app_id),
+                ticket["ID"],
+                *(ticket.get(field) for _, field in _COLUMNS),
+                _store_date(ticket.get("CreatedDate")),
+                _store_date(ticket.get("ModifiedDate")),
+                json.dumps(ticket, default=json_default),
+                now,
+            )
+            for ticket in tickets
+            if ticket and ticket.get("ID") is not None
+        ]
+        columns = ", ".join(column for column, _ in _COLUMNS)
+        updates = ", ".join(
+            f"{column} = excluded.{column}"
+            for column in [column for column, _ in _COLUMNS]
+            + ["created_date", "modified_date", "data", "synced_at"]
+        )
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT INTO tickets (app_id, id, {columns}, created_date, "
+                "modified_date, data, synced_at) "
+                f"VALUES ({', '.join('?' * (len(_COLUMNS) + 6))}) "
+                f"ON CONFLICT (app_id, id) DO UPDATE SET {updates}",
+                rows,
+            )
+            if watermark is not None:
+                self._conn.execute(
+                    "INSERT INTO sync_state (app_id, watermark, synced_at) "
+                    "VALUES (?, ?, ?) ON CONFLICT (app_id) DO UPDATE SET "
+                    "watermark = excluded.watermark, synced_at = excluded.synced_at",
+                    (str(app_id), format_search_date(watermark), now),
+                )
+        return len(rows)
+
+    def get_ticket(self, app_id, ticket_id):
+        """Get a stored ticket
+
+        Returns:
+            dict: Ticket details or None if not in the store
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM tickets WHERE app_id = ? AND id = ?",
+                (str(app_id), int(ticket_id)),
+            ).fetchone()
+        return decode_json(row[0]) if row else None
+
+    def query(
+        self,
+        app_id,
+        search_params=None,
+        sort_by="ModifiedDate",
+        descending=True,
+    ):
+        """Search stored tickets
+
+        Takes the same parameters as the search endpoint: Title,
+        StatusName/StatusIDs, PriorityName/PriorityIDs, RequestorName/
+        RequestorUids, ResponsibleGroupName/ResponsibleGroupIDs, ID, the
+        Created/ModifiedDate From/To ranges and MaxResults. Name filters
+        match the whole name (ignoring case) except Title and RequestorName,
+        which match any part.
+
+        Args:
+            app_id (str): The application ID
+            search_params (dict, optional): Parameters for ticket search
+            sort_by (str): Ticket field to sort by (see QUERY_FIELDS)
+            descending (bool): Sort largest/newest first
+
+        Returns:
+            list: Matching tickets
+
+        Raises:
+            ValueError: If sort_by or a date filter is invalid
+        """
+        search_params = search_params or {}
+        where, args = build_where(app_id, search_params)
+        sql = f"SELECT data FROM tickets {where} {build_order(sort_by, descending)}"
+        if search_params.get("MaxResults"):
+            sql += " LIMIT ?"
+            args.append(int(search_params["MaxResults"]))
+
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+        return [decode_json(row[0]) for row in rows]
+
+    def count_by(self, app_id, group_by, search_params=None):
+        """Count stored tickets grouped by a field
+
+        Args:
+            app_id (str): The application ID
+            group_by (str): Ticket field to group by, e.g. "StatusName"
+            search_params (dict, optional): Filters, as for query
+
+        Returns:
+            list: (value, count) pairs, largest group first
+
+        Raises:
+            ValueError: If the field can't be grouped on
+        """
+        if group_by not in QUERY_FIELDS:
+            raise ValueError(f"Can't group tickets by {group_by}")
+        column = collated(QUERY_FIELDS[group_by])
+        where, args = build_where(app_id, search_params)
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {column}, COUNT(*) FROM tickets {where} "
+                f"GROUP BY {column} ORDER BY COUNT(*) DESC, {column}",
+                args,
+            ).fetchall()
+        return [(value, count) for value, count in rows]
+
+    def get_watermark(self, app_id):
+        """Get the ModifiedDate up to which an application is synced
+
+        Returns:
+            datetime.datetime: The watermark, or None if never synced
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT watermark FROM sync_state WHERE app_id = ?", (str(app_id),)
+            ).fetchone()
+        return parse_search_date(row[0]) if row else None
+
+    def clear(self, app_id):
+        """Remove an application's tickets and watermark"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM tickets WHERE app_id = ?", (str(app_id),))
+            self._conn.execute(
+                "DELETE FROM sync_state WHERE app_id = ?", (str(app_id),)
+            )
+
+
+def open_ticket_store(environment):
+    """Open the ticket store for an environment in the cache directory
+
+    Args:
+        environment (str): Environment name ('sandbox' or 'production')
+
+    Returns:
+        TicketStore: The environment's ticket store
+    """
+    return TicketStore(os.path.join(cache_dir("tickets"), f"{environment}.sqlite3"))
@@ -5,17 +5,20 @@ TeamDynamix CLI Utilities
 Common utility functions for the TeamDynamix CLI
 """
 
-import os
+import functools
 import random
 from colorama import Fore, Back, Style, init
 
+from teamdynamix.utils.pager import ListPager
+from teamdynamix.utils.screen import get_screen
+
 # Initialize colorama
 init(autoreset=True)
 
 
 def clear_screen():
     """Clear the terminal screen"""
-    os.system("cls" if os.name == "nt" else "clear")
+    get_screen().clear()
 
 
 # ASCII Art Title
@@ -99,6 +102,18 @@ def display_title(style="default"):
 # Display the bordered TDX Python CLI ASCII art
 def display_bordered_ascii():
     """Display the bordered TDX Python CLI ASCII text art"""
+    print(render_bordered_ascii())
+
+
+@functools.lru_cache(maxsize=None)
+def render_bordered_ascii():
+    """Render the bordered TDX Python CLI ASCII text art
+
+    The art never changes, so it's colored once and reused.
+
+    Returns:
+        str: The colored art, ending with a newline
+    """
     lines = [
         " _  _  _  _  _  _  _  _  _  _  _  _  _  _  _  _  _  _  _  _  _  _  _  _  _  _  _  _  _  _  _  _  _  _  _  _  _  _ ",
         "|_||_||_||_||_||_||_||_||_||_||_||_||_||_||_||_||_||_||_||_||_||_||_||_||_||_||_||_||_||_||_||_||_||_||_||_||_||_|",
@@ -117,9 +132,10 @@ def display_bordered_ascii():
 
     # Create a gradient from cyan to blue for the border
     # and white for the text inside
+    rendered = []
     for i, line in enumerate(lines):
         if i <= 2 or i >= 10:  # Border lines (top and bottom)
-            print(f"{Fore.CYAN}{Style.BRIGHT}{line}{Style.RESET_ALL}")
+            rendered.append(f"{Fore.CYAN}{Style.BRIGHT}{line}{Style.RESET_ALL}")
         else:  # Text lines
             # Split the line into border and content
             if len(line) > 4:  # Make sure the line is long enough to split
@@ -127,14 +143,13 @@ def display_bordered_ascii():
                 content = line[4:-4]  # Get the middle content
                 border_right = line[-4:]  # Get "  |_|"
 
-                # Print with colors
-                print(
+                rendered.append(
                     f"{Fore.CYAN}{Style.BRIGHT}{border_left}{Fore.WHITE}{content}{Fore.CYAN}{border_right}{Style.RESET_ALL}"
                 )
             else:
-                print(f"{Fore.CYAN}{Style.BRIGHT}{line}{Style.RESET_ALL}")
+                rendered.append(f"{Fore.CYAN}{Style.BRIGHT}{line}{Style.RESET_ALL}")
 
-    print()
+    return "\n".join(rendered) + "\n"
 
 
 # Also add a pixelated style that more closely matches the image
@@ -179,6 +194,7 @@ def display_pixelated_tdx():
 
 
 # Box drawing utilities
+@functools.lru_cache(maxsize=128)  # Screens redraw the same boxes
 def box(content, width=60, style="single"):
     """Create a box around content text
 
@@ -376,44 +392,45 @@ def display_people_list(people):
         print(error("No results found."))
         return None
 
-    print(f"\n{info('Found')} {success(str(len(people)))} {info('people:')}")
-    print(divider())
+    # Long lists are shown a page at a time
+    pager = ListPager(
+        people,
+        _format_person_row,
+        header=(
+            f"\n{info('Found')} {success(str(len(people)))} {info('people:')}\n"
+            f"{divider()}\n"
+        ),
+        instructions=(
+            f"\n{info('Enter a number to view person details, or press Enter to return to menu.')}\n"
+        ),
+        prompt=prompt(f"Select person [1-{len(people)}]: "),
+        invalid=f"{error('Invalid selection.')}\n",
+        row_height=4,
+    )
+    index = pager.run()
+    return None if index is None else people[index].get("UID")
 
-    for i, person in enumerate(people, 1):
-        print(
-            f"{Fore.WHITE}{i}. {highlight(person.get('FullName', 'Unknown'))} ({info(person.get('PrimaryEmail', 'No email'))})"
-        )
-        print(f"   {info('UID:')} {success(person.get('UID', 'N/A'))}")
-
-        # Display additional information if available
-        details = []
-        if person.get("Title"):
-            details.append(f"{info('Title:')} {person['Title']}")
-        if person.get("Phone"):
-            details.append(f"{info('Phone:')} {person['Phone']}")
-        if person.get("IsActive") is not None:
-            status_color = Fore.GREEN if person["IsActive"] else Fore.RED
-            status_text = "Active" if person["IsActive"] else "Inactive"
-            details.append(
-                f"{info('Status:')} {status_color}{status_text}{Style.RESET_ALL}"
-            )
-
-        if details:
-            print(f"   {' | '.join(details)}")
-
-        print()
-
-    # Prompt for selection
-    print(
-        f"\n{info('Enter a number to view person details, or press Enter to return to menu.')}"
+
+def _format_person_row(number, person):
+    """Format one person as a list row"""
+    row = (
+        f"{Fore.WHITE}{number}. {highlight(person.get('FullName', 'Unknown'))} ({info(person.get('PrimaryEmail', 'No email'))})\n"
+        f"   {info('UID:')} {success(person.get('UID', 'N/A'))}\n"
     )
-    selection = input(prompt(f"Select person [1-{len(people)}]: ")).strip()
 
-    if selection and selection.isdigit():
-        index = int(selection) - 1
-        if 0 <= index < len(people):
-            return people[index].get("UID")
-        else:
-            print(error("Invalid selection."))
+    # Display additional information if available
+    details = []
+    if person.get("Title"):
+        details.append(f"{info('Title:')} {person['Title']}")
+    if person.get("Phone"):
+        details.append(f"{info('Phone:')} {person['Phone']}")
+    if person.get("IsActive") is not None:
+        status_color = Fore.GREEN if person["IsActive"] else Fore.RED
+        status_text = "Active" if person["IsActive"] else "Inactive"
+        details.append(
+            f"{info('Status:')} {status_color}{status_text}{Style.RESET_ALL}"
+        )
 
-    return None
+    if details:
+        row += f"   {' | '.join(details)}\n"
+    return row + "\n"
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix Date Utilities
+
+Parses TeamDynamix dates ("/Date(...)/" and ISO 8601), one at a time or by column
+"""
+
+import datetime
+import functools
+import re
+
+try:
+    import numpy
+except ImportError:  # vectorized column parsing is optional
+    numpy = None
+
+# Distinct date strings remembered by parse_timestamp
+DATE_CACHE_SIZE = 65536
+
+DISPLAY_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# "/Date(1234567890000)/", optionally with the server's UTC offset appended;
+# the milliseconds are always since the epoch in UTC
+_LEGACY_DATE = re.compile(r"/Date\((-?\d+)(?:[+-]\d{4})?\)/")
+
+# ISO 8601 with an explicit UTC offset, e.g. "2024-01-31T08:00:00-05:00"
+_ISO_OFFSET = re.compile(r"T.*[+-]\d{2}:?\d{2}$")
+
+# .NET writes up to 7 fractional digits; older Pythons only accept 6
+_LONG_FRACTION = re.compile(r"(\.\d{6})\d+")
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def parse_iso_date(text):
+    """Parse an ISO 8601 date or timestamp
+
+    Args:
+        text (str): e.g. "2024-01-31", "2024-01-31T08:00:00Z" or
+            "2024-01-31T08:00:00.1234567-05:00" (naive values are taken as UTC)
+
+    Returns:
+        datetime.datetime: UTC datetime
+
+    Raises:
+        ValueError: If text isn't ISO 8601
+    """
+    text = text.strip()
+    if text.endswith(("Z", "z")):
+        text = text[:-1] + "+00:00"
+    if "." in text:
+        text = _LONG_FRACTION.sub(r"\1", text)
+    result = datetime.datetime.fromisoformat(text)
+    if result.tzinfo is None:
+        return result.replace(tzinfo=datetime.timezone.utc)
+    return result.astimezone(datetime.timezone.utc)
+
+
+@functools.lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_text(text):
+    match = _LEGACY_DATE.fullmatch(text)
+    if match:
+        return _EPOCH + datetime.timedelta(milliseconds=int(match.group(1)))
+    try:
+        return parse_iso_date(text)
+    except ValueError:
+        return None
+
+
+def parse_timestamp(value):
+    """Parse a TeamDynamix date in ISO 8601 or "/Date(1234567890000)/" format
+
+    Strings are memoized, so parsing the same value again (when sorting and
+    then rendering, say) is a dictionary lookup.
+
+    Args:
+        value: Date string, datetime or date
+
+    Returns:
+        datetime.datetime: UTC datetime, or None if the value is empty or invalid
+    """
+    if not value:
+        return None
+    if isinstance(value, str):
+        return _parse_text(value)
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            return value.replace(tzinfo=datetime.timezone.utc)
+        return value.astimezone(datetime.timezone.utc)
+    if isinstance(value, datetime.date):
+        return datetime.datetime.combine(
+            value, datetime.time(), tzinfo=datetime.timezone.utc
+        )
+    return None
+
+
+def parse_timestamps(values):
+    """Parse a column of TeamDynamix dates
+
+    Args:
+        values (iterable): Date strings, datetimes or None
+
+    Returns:
+        list: UTC datetimes, with None for empty or invalid values
+    """
+    return [parse_timestamp(value) for value in values]
+
+
+def timestamp_array(values):
+    """Parse a column of TeamDynamix dates into a NumPy array
+
+    Legacy dates and UTC ISO timestamps are converted in bulk by NumPy; only
+    values with an explicit UTC offset are parsed one by one.
+
+    Args:
+        values (iterable): Date strings, datetimes or None
+
+    Returns:
+        numpy.ndarray: datetime64[ms] values in UTC, NaT for empty or invalid
+
+    Raises:
+        ValueError: If numpy isn't installed
+    """
+    if numpy is None:
+        raise ValueError("timestamp_array needs the numpy package")
+
+    values = list(values)
+    result = numpy.full(len(values), numpy.datetime64("NaT"), dtype="datetime64[ms]")
+    legacy_index, legacy_millis = [], []
+    iso_index, iso_text = [], []
+    for index, value in enumerate(values):
+        if isinstance(value, str):
+            if value.startswith("/Date("):
+                match = _LEGACY_DATE.fullmatch(value)
+                if match:
+                    legacy_index.append(index)
+                    legacy_millis.append(int(match.group(1)))
+                continue
+            if not _ISO_OFFSET.search(value):
+                iso_index.append(index)
+                iso_text.append(value[:-1] if value.endswith(("Z", "z")) else value)
+                continue
+        parsed = parse_timestamp(value)
+        if parsed is not None:
+            result[index] = numpy.datetime64(_millis(parsed), "ms")
+
+    if legacy_index:
+        result[legacy_index] = numpy.array(legacy_millis, dtype="datetime64[ms]")
+    if iso_index:
+        try:
+            result[iso_index] = numpy.array(iso_text, dtype="datetime64[ms]")
+        except ValueError:
+            # A malformed value spoils the batch, fall back to one at a time
+            for index, text in zip(iso_index, iso_text):
+                parsed = parse_timestamp(text)
+                if parsed is not None:
+                    result[index] = numpy.datetime64(_millis(parsed), "ms")
+    return result
+
+
+def _millis(value):
+    return (value - _EPOCH) // datetime.timedelta(milliseconds=1)
+
+
+def record_timestamp(record, field):
+    """Get a date field of a record as a UTC datetime
+
+    Records that memoize their own dates (see utils.models) parse each field
+    once; plain dicts go through the parse_timestamp cache.
+
+    Args:
+        record: Ticket, person or feed entry (dict or record model)
+        field (str): Date field, e.g. "CreatedDate"
+
+    Returns:
+        datetime.datetime: UTC datetime, or None if missing or invalid
+    """
+    timestamp = getattr(record, "timestamp", None)
+    if timestamp is not None:
+        return timestamp(field)
+    return parse_timestamp(record.get(field))
+
+
+def format_local_time(value, fmt=DISPLAY_FORMAT):
+    """Format a TeamDynamix date in the local time zone for display
+
+    Args:
+        value: Date string or datetime
+        fmt (str): strftime format
+
+    Returns:
+        str: Formatted local time, or the value unchanged if it can't be parsed
+    """
+    parsed = parse_timestamp(value)
+    if parsed is None:
+        return value
+    return parsed.astimezone().strftime(fmt)
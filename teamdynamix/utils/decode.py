@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix JSON Decoding Utilities
+
+Fast JSON decoding with optional field projection
+"""
+
+import functools
+import json
+from typing import Any, List, Union
+
+try:
+    import orjson
+except ImportError:  # orjson decoding is optional
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # msgspec decoding is optional
+    msgspec = None
+
+
+def json_backend():
+    """Get the name of the library used for full decoding
+
+    Returns:
+        str: "orjson", "msgspec" or "json"
+    """
+    if orjson is not None:
+        return "orjson"
+    if msgspec is not None:
+        return "msgspec"
+    return "json"
+
+
+def _loads(data):
+    """Decode a whole JSON document with the fastest installed library"""
+    if orjson is not None:
+        return orjson.loads(data)
+    if msgspec is not None:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        return msgspec.json.decode(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=64)
+def _projection_decoder(fields):
+    """Build a msgspec decoder that only materializes the given fields
+
+    Fields not listed are skipped while parsing, so their values (including
+    nested objects like Attributes) are never built.
+    """
+    names = {f"f{index}": field for index, field in enumerate(fields)}
+    projection = msgspec.defstruct(
+        "Projection",
+        [(name, Any, msgspec.UNSET) for name in names],
+        rename=names,
+    )
+    return msgspec.json.Decoder(Union[List[projection], projection]), names
+
+
+def _from_struct(value, names):
+    result = {}
+    for name, field in names.items():
+        field_value = getattr(value, name)
+        if field_value is not msgspec.UNSET:
+            result[field] = field_value
+    return result
+
+
+def project(value, fields):
+    """Keep only some fields of a decoded object or list of objects
+
+    Args:
+        value: Decoded JSON (a dict, or a list of dicts)
+        fields (iterable): Field names to keep
+
+    Returns:
+        The same shape with only the requested fields
+    """
+    fields = tuple(fields)
+    if isinstance(value, list):
+        return [project(item, fields) for item in value]
+    if isinstance(value, dict):
+        return {field: value[field] for field in fields if field in value}
+    return value
+
+
+def decode_json(data, fields=None):
+    """Decode a JSON document, optionally keeping only some fields
+
+    Uses orjson or msgspec when installed and the standard library otherwise.
+    With fields, each top-level object (or each object of a top-level list)
+    is reduced to those fields; with msgspec installed the other fields are
+    skipped while parsing instead of being decoded and thrown away.
+
+    Args:
+        data (bytes or str): JSON text
+        fields (iterable, optional): Field names to keep
+
+    Returns:
+        The decoded value
+
+    Raises:
+        ValueError: If data isn't valid JSON
+    """
+    if fields is None:
+        return _loads(data)
+
+    fields = tuple(dict.fromkeys(fields))
+    if msgspec is not None:
+        decoder, names = _projection_decoder(fields)
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        try:
+            value = decoder.decode(data)
+        except msgspec.ValidationError:
+            pass  # not an object or list of objects, decode it as is
+        else:
+            if isinstance(value, list):
+                return [_from_struct(item, names) for item in value]
+            return _from_struct(value, names)
+    return project(_loads(data), fields)
+
+
+def decode_response(response, fields=None):
+    """Decode an HTTP response body as JSON
+
+    Drop-in replacement for response.json() that uses decode_json.
+
+    Args:
+        response: requests.Response (or anything with .content or .text)
+        fields (iterable, optional): Field names to keep
+
+    Returns:
+        The decoded value
+    """
+    content = getattr(response, "content", None)
+    if content is None:
+        content = response.text
+    return decode_json(content, fields)
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix Export Utilities
+
+Streaming NDJSON export with optional gzip or zstd compression
+"""
+
+import gzip
+import io
+import json
+import os
+import tempfile
+
+try:
+    import zstandard
+except ImportError:  # zstd export is optional
+    zstandard = None
+
+from teamdynamix.utils.decode import decode_json
+from teamdynamix.utils.models import json_default
+
+# File suffix -> compression used when compression="auto"
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".gzip": "gzip", ".zst": "zstd"}
+
+
+def compression_for(path):
+    """Pick a compression from a file name
+
+    Args:
+        path (str): Export file name, e.g. "tickets.ndjson.gz"
+
+    Returns:
+        str: "gzip", "zstd" or None for an uncompressed file
+    """
+    return COMPRESSION_SUFFIXES.get(os.path.splitext(path)[1].lower())
+
+
+class NdjsonWriter:
+    """Write records to a file as newline-delimited JSON
+
+    Records are encoded and written one at a time, so memory use doesn't
+    grow with the number of records. Output goes to a temporary file that
+    replaces the target only when the writer closes without an error;
+    an interrupted export leaves any existing file untouched.
+
+    Use it as a context manager:
+
+        with NdjsonWriter("tickets.ndjson.gz") as writer:
+            for ticket in tickets:
+                writer.write(ticket)
+    """
+
+    def __init__(self, path, compression="auto", mode=0o600):
+        """Open a temporary file next to the destination
+
+        Args:
+            path (str): Destination file
+            compression (str): "gzip", "zstd", None, or "auto" to pick from
+                the file suffix (.gz, .zst)
+            mode (int): File permissions for the new file
+
+        Raises:
+            ValueError: If the compression is unknown or zstandard isn't installed
+        """
+        if compression == "auto":
+            compression = compression_for(path)
+        if compression not in (None, "gzip", "zstd"):
+            raise ValueError(f"Unknown compression: {compression}")
+        if compression == "zstd" and zstandard is None:
+            raise ValueError("zstd export needs the zstandard package")
+
+        self.path = path
+        self.compression = compression
+        self.count = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(
+            dir=directory, prefix=".tmp-", suffix=".ndjson"
+        )
+        os.chmod(self._tmp_path, mode)
+        self._file = os.fdopen(fd, "wb")
+
+        if compression == "gzip":
+            name = os.path.basename(os.path.splitext(path)[0])
+            self._stream = gzip.GzipFile(
+                filename=name, mode="wb", fileobj=self._file, compresslevel=6
+            )
+        elif compression == "zstd":
+            self._stream = zstandard.ZstdCompressor().stream_writer(
+                self._file, closefd=False
+            )
+        else:
+            self._stream = self._file
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, record):
+        """Append one record
+
+        Args:
+            record: JSON-serializable record
+        """
+        line = json.dumps(record, separators=(",", ":"), default=json_default)
+        self._stream.write(line.encode("utf-8") + b"\n")
+        self.count += 1
+
+    def write_all(self, records):
+        """Append every record from an iterable
+
+        Returns:
+            int: Number of records written by this call
+        """
+        start = self.count
+        for record in records:
+            self.write(record)
+        return self.count - start
+
+    def close(self):
+        """Finish the file and move it over the destination"""
+        if self._file.closed:
+            return
+        try:
+            if self._stream is not self._file:
+                self._stream.close()
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            os.replace(self._tmp_path, self.path)
+        except BaseException:
+            self.abort()
+            raise
+
+    def abort(self):
+        """Discard the temporary file, leaving the destination unchanged"""
+        if not self._file.closed:
+            self._file.close()
+        try:
+            os.unlink(self._tmp_path)
+        except OSError:
+            pass
+
+
+def export_ndjson(records, path, compression="auto"):
+    """Stream records to an NDJSON file
+
+    Works with any iterable, including the generators returned by
+    iter_search_tickets and iter_tickets.
+
+    Args:
+        records (iterable): JSON-serializable records
+        path (str): Destination file
+        compression (str): "gzip", "zstd", None, or "auto" (from the suffix)
+
+    Returns:
+        int: Number of records written
+    """
+    with NdjsonWriter(path, compression) as writer:
+        writer.write_all(records)
+    return writer.count
+
+
+def read_ndjson(path, compression="auto"):
+    """Read records back from an NDJSON export
+
+    Args:
+        path (str): Export file
+        compression (str): "gzip", "zstd", None, or "auto" (from the suffix)
+
+    Yields:
+        The decoded records, one at a time
+    """
+    if compression == "auto":
+        compression = compression_for(path)
+
+    with open(path, "rb") as raw:
+        if compression == "gzip":
+            stream = gzip.GzipFile(fileobj=raw)
+        elif compression == "zstd":
+            if zstandard is None:
+                raise ValueError("zstd import needs the zstandard package")
+            stream = io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(raw))
+        else:
+            stream = raw
+
+        for line in stream:
+            if line.strip():
+                yield decode_json(line)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix Journal Utilities
+
+Append-only checkpoint journal for resumable bulk operations
+"""
+
+import json
+import os
+import threading
+
+
+class Journal:
+    """Durable record of what a bulk operation has done
+
+    Each state change is appended as one JSON line and flushed to disk
+    before the call returns, so after a crash the journal shows exactly
+    which items were finished. Replaying it keeps the last state of each key.
+    """
+
+    def __init__(self, path):
+        """Open (and create if needed) a journal file
+
+        Args:
+            path (str): Journal file, e.g. "tickets.csv.journal"
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.entries = self._replay()
+        torn = self._ends_mid_line()
+        self._file = open(path, "a", encoding="utf-8")
+        os.chmod(path, 0o600)
+        if torn:
+            self._file.write("\n")  # start a fresh line after a torn write
+
+    def _ends_mid_line(self):
+        """Check whether the journal's last line was cut off"""
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return False
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) != b"\n"
+        except FileNotFoundError:
+            return False
+
+    def _replay(self):
+        """Read the last state of every key from an existing journal"""
+        entries = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # torn final line from a crash
+                    entries[entry["key"]] = entry
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def get(self, key):
+        """Get the last recorded state of a key
+
+        Returns:
+            dict: The journal entry, or None if the key was never recorded
+        """
+        with self._lock:
+            return self.entries.get(str(key))
+
+    def record(self, key, state, **data):
+        """Append a state change and flush it to disk
+
+        Args:
+            key: Item the change is about (stored as a string)
+            state (str): New state, e.g. "pending", "done" or "failed"
+            **data: Extra JSON-serializable details
+        """
+        entry = dict(data, key=str(key), state=state)
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self.entries[entry["key"]] = entry
+
+    def close(self):
+        """Close the journal file"""
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix Record Models
+
+Compact read-only records for holding many tickets, people or feed entries
+"""
+
+import json
+from collections.abc import Mapping
+
+from teamdynamix.utils.dates import parse_timestamp
+
+# Slot value for a hot field the record doesn't have
+_MISSING = object()
+
+
+class Record(Mapping):
+    """Read-only record with its most used fields in slots
+
+    The fields named in HOT_FIELDS are kept as attributes; every other
+    field is kept as one compact JSON string and only decoded the first
+    time one of them is read, after which the string is dropped.
+
+    A record behaves like the dict it was made from (record["Title"],
+    record.get("Title"), iteration, len), so code written for API dicts
+    works unchanged. Hot fields can also be read as attributes
+    (record.Title). Generators that yield many tickets, people or feed
+    entries build records when called with records=True.
+    """
+
+    __slots__ = ("_cold", "_cold_fields", "_dates")
+    HOT_FIELDS = ()
+    _hot = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._hot = frozenset(cls.HOT_FIELDS)
+
+    def __init__(self, data):
+        """Build a record from an API dict
+
+        Args:
+            data (dict): Record as returned by the API
+        """
+        for field in self.HOT_FIELDS:
+            object.__setattr__(self, field, data.get(field, _MISSING))
+        cold = {key: value for key, value in data.items() if key not in self._hot}
+        self._cold = json.dumps(cold, separators=(",", ":")) if cold else None
+        self._cold_fields = None
+        self._dates = None
+
+    @classmethod
+    def wrap(cls, records):
+        """Wrap API dicts as records, one at a time
+
+        Args:
+            records (iterable): Dicts, e.g. from iter_search_tickets
+
+        Yields:
+            Record: One record per dict (existing records are passed through)
+        """
+        for record in records:
+            yield record if isinstance(record, cls) else cls(record)
+
+    def _decoded(self):
+        """Get the non-hot fields, decoding them on first use"""
+        if self._cold_fields is None:
+            self._cold_fields = json.loads(self._cold) if self._cold else {}
+            self._cold = None  # Don't keep both copies
+        return self._cold_fields
+
+    def __getitem__(self, key):
+        if key in self._hot:
+            value = getattr(self, key)
+            if value is _MISSING:
+                raise KeyError(key)
+            return value
+        return self._decoded()[key]
+
+    def __iter__(self):
+        for field in self.HOT_FIELDS:
+            if getattr(self, field) is not _MISSING:
+                yield field
+        yield from self._decoded()
+
+    def __len__(self):
+        hot = sum(getattr(self, field) is not _MISSING for field in self.HOT_FIELDS)
+        return hot + len(self._decoded())
+
+    def __contains__(self, key):
+        if key in self._hot:
+            return getattr(self, key) is not _MISSING
+        return key in self._decoded()
+
+    def __setattr__(self, name, value):
+        if name in ("_cold", "_cold_fields", "_dates"):
+            object.__setattr__(self, name, value)
+        else:
+            raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __repr__(self):
+        fields = ", ".join(
+            f"{field}={getattr(self, field)!r}"
+            for field in self.HOT_FIELDS[:3]
+            if getattr(self, field) is not _MISSING
+        )
+        return f"<{type(self).__name__} {fields}>"
+
+    def __reduce__(self):
+        return (type(self), (self.to_dict(),))
+
+    def timestamp(self, field):
+        """Get a date field as a UTC datetime, parsing it only once
+
+        Args:
+            field (str): Date field, e.g. "CreatedDate"
+
+        Returns:
+            datetime.datetime: UTC datetime, or None if missing or invalid
+        """
+        if self._dates is None:
+            self._dates = {}
+        if field not in self._dates:
+            self._dates[field] = parse_timestamp(self.get(field))
+        return self._dates[field]
+
+    def to_dict(self):
+        """Get the record as a plain dict
+
+        Returns:
+            dict: Every field of the record
+        """
+        return dict(self.items())
+
+
+class Ticket(Record):
+    """Compact ticket record"""
+
+    HOT_FIELDS = (
+        "ID",
+        "AppID",
+        "Title",
+        "StatusName",
+        "PriorityName",
+        "RequestorName",
+        "ResponsibleGroupName",
+        "CreatedDate",
+        "ModifiedDate",
+    )
+    __slots__ = HOT_FIELDS
+
+
+class Person(Record):
+    """Compact person record"""
+
+    HOT_FIELDS = ("UID", "UserName", "FullName", "PrimaryEmail", "IsActive")
+    __slots__ = HOT_FIELDS
+
+
+class FeedEntry(Record):
+    """Compact feed entry record"""
+
+    HOT_FIELDS = ("ID", "CreatedDate", "CreatedFullName", "Body")
+    __slots__ = HOT_FIELDS
+
+
+def json_default(value):
+    """json.dump hook that writes records as plain objects
+
+    Pass as default= when serializing data that may contain records.
+    """
+    if isinstance(value, Record):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix List Pager
+
+Paged, buffered display of long result lists in the CLI
+"""
+
+import shutil
+import sys
+
+# Terminal lines kept free for the header, page footer and prompt
+RESERVED_LINES = 8
+
+
+class ListPager:
+    """Shows a long list one screen at a time and lets the user pick an item
+
+    Only the rows on the current page are formatted, and each page is
+    written to the terminal in a single write, so even very long lists
+    appear at once. Items keep their list number on every page, so the
+    number typed always selects the same item.
+    """
+
+    def __init__(
+        self,
+        items,
+        format_row,
+        header="",
+        instructions="",
+        prompt="Select: ",
+        invalid="Invalid selection.\n",
+        page_size=None,
+        row_height=3,
+        stream=None,
+        read=None,
+    ):
+        """Initialize the pager
+
+        Args:
+            items (sequence): Items to show (indexed and sliced, never copied)
+            format_row (callable): Takes (number, item) and returns the row
+                text, ending in a newline
+            header (str): Text written above the rows on every page
+            instructions (str): Text written below the rows on every page
+            prompt (str): Selection prompt
+            invalid (str): Message written when the answer isn't a valid choice
+            page_size (int, optional): Items per page (default: fits the terminal)
+            row_height (int): Lines each row takes, for sizing pages
+            stream (file, optional): Where pages are written (default: stdout)
+            read (callable, optional): Reads the answer to a prompt (default: input)
+        """
+        self.items = items
+        self.format_row = format_row
+        self.header = header
+        self.instructions = instructions
+        self.prompt = prompt
+        self.invalid = invalid
+        if page_size is None:
+            lines = shutil.get_terminal_size((80, 24)).lines
+            page_size = (lines - RESERVED_LINES) // max(row_height, 1)
+        self.page_size = max(page_size, 1)
+        self.stream = stream
+        self.read = read
+
+    @property
+    def page_count(self):
+        """Number of pages"""
+        return max(-(-len(self.items) // self.page_size), 1)
+
+    def render(self, page):
+        """Build the text of one page
+
+        Args:
+            page (int): Page number, starting at 0
+
+        Returns:
+            str: The page, ready to be written in one go
+        """
+        start = page * self.page_size
+        stop = min(start + self.page_size, len(self.items))
+        parts = [self.header]
+        for number, item in enumerate(self.items[start:stop], start + 1):
+            parts.append(self.format_row(number, item))
+        if self.page_count > 1:
+            parts.append(
+                f"Page {page + 1} of {self.page_count} "
+                f"({start + 1}-{stop} of {len(self.items)}) - "
+                "n: next page, p: previous page\n"
+            )
+        parts.append(self.instructions)
+        return "".join(parts)
+
+    def run(self):
+        """Show pages until the user selects an item or leaves
+
+        Returns:
+            int: Index of the selected item, or None if nothing was selected
+        """
+        stream = self.stream or sys.stdout
+        read = self.read or input
+        last_page = self.page_count - 1
+        page = 0
+        while True:
+            stream.write(self.render(page))
+            stream.flush()
+            selection = read(self.prompt).strip().lower()
+
+            if selection in ("n", "next") and last_page > 0:
+                page = min(page + 1, last_page)
+            elif selection in ("p", "prev", "previous") and last_page > 0:
+                page = max(page - 1, 0)
+            elif selection.isdigit() and 0 < int(selection) <= len(self.items):
+                return int(selection) - 1
+            elif selection:
+                stream.write(self.invalid)
+                return None
+            else:
+                return None
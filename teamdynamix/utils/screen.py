@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix Screen Utilities
+
+Full-screen frames that only redraw the lines that changed
+"""
+
+import re
+import shutil
+import sys
+
+# Clear the screen and move the cursor to the top left
+CLEAR = "\x1b[2J\x1b[H"
+
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+_screen = None
+
+
+def visible_width(line):
+    """Get the number of columns a line takes, ignoring color codes"""
+    return len(_ANSI_ESCAPE.sub("", line))
+
+
+class Screen:
+    """Terminal screen drawn as a frame of stacked regions
+
+    The first frame is drawn after clearing the screen. Later frames are
+    compared line by line with the one on screen, and only the changed lines
+    are rewritten (with ANSI cursor movement, which colorama translates on
+    Windows), followed by clearing whatever was printed below the frame.
+    Each frame is sent to the terminal in a single write.
+
+    Anything else that draws on the screen must call invalidate (clear does)
+    so the next frame is drawn in full.
+    """
+
+    def __init__(self, stream=None):
+        """Initialize the screen
+
+        Args:
+            stream (file, optional): Terminal to draw on (default: stdout)
+        """
+        self.stream = stream
+        self._lines = None  # Frame on screen, None if unknown
+
+    def _stream(self):
+        return self.stream or sys.stdout
+
+    def _is_terminal(self):
+        isatty = getattr(self._stream(), "isatty", None)
+        return bool(isatty and isatty())
+
+    def invalidate(self):
+        """Forget what's on screen, so the next frame is drawn in full"""
+        self._lines = None
+
+    def clear(self):
+        """Clear the terminal (without starting a subprocess)"""
+        self._lines = None
+        if self._is_terminal():
+            stream = self._stream()
+            stream.write(CLEAR)
+            stream.flush()
+
+    def draw(self, *regions):
+        """Draw a frame, leaving the cursor on the line below it
+
+        Lines may be rewritten on their own, so each line has to carry its
+        own color codes.
+
+        Args:
+            *regions (str): Blocks of text stacked from the top of the screen
+        """
+        lines = []
+        for region in regions:
+            lines.extend(region.split("\n"))
+
+        stream = self._stream()
+        if not self._is_terminal():
+            stream.write("\n".join(lines) + "\n")
+            stream.flush()
+            return
+
+        # Frames that would scroll or wrap can't be patched in place; the
+        # line below the frame is kept free for the prompt
+        size = shutil.get_terminal_size()
+        fits = len(lines) < size.lines and all(
+            visible_width(line) <= size.columns for line in lines
+        )
+
+        if self._lines is None or not fits:
+            output = [CLEAR, "\n".join(lines), "\n"]
+        else:
+            output = [
+                f"\x1b[{row + 1};1H{line}\x1b[K"
+                for row, line in enumerate(lines)
+                if row >= len(self._lines) or self._lines[row] != line
+            ]
+            # Remove the previous prompt and anything printed after it
+            output.append(f"\x1b[{len(lines) + 1};1H\x1b[J")
+
+        stream.write("".join(output))
+        stream.flush()
+        self._lines = lines if fits else None
+
+
+def get_screen():
+    """Get the screen shared by the CLI
+
+    Returns:
+        Screen: The shared screen, drawing on stdout
+    """
+    global _screen
+    if _screen is None:
+        _screen = Screen()
+    return _screen
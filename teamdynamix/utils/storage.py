@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+TeamDynamix Local Storage Utilities
+
+Helpers for the on-disk caches kept by the CLI and API clients
+"""
+
+import json
+import os
+import tempfile
+
+
+def cache_dir(*parts):
+    """Get (and create) a directory under the TeamDynamix cache root
+
+    The root is TDX_CACHE_DIR if set, otherwise ~/.cache/teamdynamix.
+    Directories are created readable by the current user only.
+
+    Args:
+        *parts (str): Subdirectory names below the cache root
+
+    Returns:
+        str: Path to the directory
+    """
+    root = os.getenv("TDX_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "teamdynamix"
+    )
+    path = os.path.join(root, *parts)
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    return path
+
+
+def atomic_write_json(path, data, mode=0o600):
+    """Write JSON to a file atomically
+
+    The data is written to a temporary file in the same directory and then
+    moved over the target, so readers never see a partially written file.
+
+    Args:
+        path (str): Destination file
+        data: JSON-serializable data
+        mode (int): File permissions for the new file
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+    try:
+        os.chmod(tmp_path, mode)
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def read_json(path, default=None):
+    """Read a JSON file, returning a default if it is missing or unreadable
+
+    Args:
+        path (str): File to read
+        default: Value returned when the file can't be loaded
+
+    Returns:
+        The decoded JSON data or the default
+    """
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
@@ -14,6 +14,8 @@ init(autoreset=True)
 
 # Import modules from the package
 from teamdynamix.auth.client import AuthClient
+from teamdynamix.auth.ratelimit import RateLimitError
+from teamdynamix.auth.transport import close_transports
 from teamdynamix.people.client import PeopleClient
 from teamdynamix.tickets.client import TicketsClient
 from teamdynamix.people.commands import (
@@ -36,6 +38,27 @@ from teamdynamix.utils.cli import (
     box,
     display_pixelated_tdx,
     display_bordered_ascii,
+    render_bordered_ascii,
+)
+from teamdynamix.utils.screen import get_screen
+
+# Menu options, drawn below the status box
+MAIN_MENU = "\n".join(
+    [
+        f"{Fore.MAGENTA}{Style.BRIGHT}PEOPLE OPERATIONS:{Style.RESET_ALL}",
+        f"{Fore.WHITE}1. {Fore.LIGHTBLUE_EX}Search for People{Style.RESET_ALL}",
+        f"{Fore.WHITE}2. {Fore.LIGHTBLUE_EX}Get Person Details by UID{Style.RESET_ALL}",
+        f"{Fore.WHITE}3. {Fore.LIGHTBLUE_EX}Get Person Details by Username{Style.RESET_ALL}",
+        f"{Fore.WHITE}4. {Fore.LIGHTBLUE_EX}Get UID by Username{Style.RESET_ALL}",
+        "",
+        f"{Fore.MAGENTA}{Style.BRIGHT}TICKET OPERATIONS:{Style.RESET_ALL}",
+        f"{Fore.WHITE}5. {Fore.LIGHTBLUE_EX}Ticket Operations{Style.RESET_ALL}",
+        "",
+        f"{Fore.MAGENTA}{Style.BRIGHT}SYSTEM:{Style.RESET_ALL}",
+        f"{Fore.WHITE}S. {Fore.LIGHTBLUE_EX}Switch Environment{Style.RESET_ALL}",
+        f"{Fore.WHITE}X. {Fore.LIGHTBLUE_EX}Exit{Style.RESET_ALL}",
+        "",
+    ]
 )
 
 
@@ -45,12 +68,13 @@ def main_menu(auth):
     people_client = PeopleClient(auth)
     tickets_client = TicketsClient(auth)
 
-    while True:
-        clear_screen()
-        display_bordered_ascii()
+    # Only the parts of the menu that changed are redrawn
+    screen = get_screen()
+    screen.invalidate()
 
+    while True:
         # Status information in a box
-        user_info = auth.get_current_user()
+        user_info = auth.current_user.get()
         user_name = "Unknown"
         if user_info:
             user_name = user_info.get("FullName", "Unknown")
@@ -60,56 +84,57 @@ def main_menu(auth):
             f"API URL: {auth.base_url}\n"
             f"User: {user_name}"
         )
-        print(
-            f"{Fore.CYAN}{box(status_info, width=60, style='rounded')}{Style.RESET_ALL}"
+        status_box = box(status_info, width=60, style="rounded")
+        screen.draw(
+            render_bordered_ascii(),
+            "".join(
+                f"{Fore.CYAN}{line}{Style.RESET_ALL}\n"
+                for line in status_box.split("\n")
+            ),
+            MAIN_MENU,
         )
-        print()
-
-        # Menu options
-        print(f"{Fore.MAGENTA}{Style.BRIGHT}PEOPLE OPERATIONS:{Style.RESET_ALL}")
-        print(f"{Fore.WHITE}1. {Fore.LIGHTBLUE_EX}Search for People{Style.RESET_ALL}")
-        print(
-            f"{Fore.WHITE}2. {Fore.LIGHTBLUE_EX}Get Person Details by UID{Style.RESET_ALL}"
-        )
-        print(
-            f"{Fore.WHITE}3. {Fore.LIGHTBLUE_EX}Get Person Details by Username{Style.RESET_ALL}"
-        )
-        print(f"{Fore.WHITE}4. {Fore.LIGHTBLUE_EX}Get UID by Username{Style.RESET_ALL}")
-        print()
-        print(f"{Fore.MAGENTA}{Style.BRIGHT}TICKET OPERATIONS:{Style.RESET_ALL}")
-        print(f"{Fore.WHITE}5. {Fore.LIGHTBLUE_EX}Ticket Operations{Style.RESET_ALL}")
-        print()
-        print(f"{Fore.MAGENTA}{Style.BRIGHT}SYSTEM:{Style.RESET_ALL}")
-        print(f"{Fore.WHITE}S. {Fore.LIGHTBLUE_EX}Switch Environment{Style.RESET_ALL}")
-        print(f"{Fore.WHITE}X. {Fore.LIGHTBLUE_EX}Exit{Style.RESET_ALL}")
-        print()
 
         choice = (
             input(f"{Fore.GREEN}Select an option: {Style.RESET_ALL}").strip().lower()
         )
 
-        # People operations
-        if choice == "1":
-            search_people_command(people_client)
-        elif choice == "2":
-            get_person_details_command(people_client)
-        elif choice == "3":
-            get_person_by_username_command(people_client)
-        elif choice == "4":
-            get_uid_by_username_command(people_client)
-
-        # Ticket operations
-        elif choice == "5":
-            select_application_command(tickets_client)
-
-        # System operations
-        elif choice == "s":
-            return True  # Signal to switch environment
-        elif choice == "x":
-            return False  # Signal to exit
-        else:
-            print(f"{Fore.RED}Invalid selection. Please try again.{Style.RESET_ALL}")
+        # Commands draw their own screens
+        if choice in ("1", "2", "3", "4", "5"):
+            screen.invalidate()
+
+        try:
+            # People operations
+            if choice == "1":
+                search_people_command(people_client)
+            elif choice == "2":
+                get_person_details_command(people_client)
+            elif choice == "3":
+                get_person_by_username_command(people_client)
+            elif choice == "4":
+                get_uid_by_username_command(people_client)
+
+            # Ticket operations
+            elif choice == "5":
+                select_application_command(tickets_client)
+
+            # System operations
+            elif choice == "s":
+                return True  # Signal to switch environment
+            elif choice == "x":
+                return False  # Signal to exit
+            else:
+                print(
+                    f"{Fore.RED}Invalid selection. Please try again.{Style.RESET_ALL}"
+                )
+                input(f"\n{Fore.YELLOW}Press Enter to continue...{Style.RESET_ALL}")
+                # The lines below the menu may have scrolled it on a short terminal
+                screen.invalidate()
+        except RateLimitError as e:
+            print(
+                f"{Fore.RED}Error: {str(e)}. Please try again later.{Style.RESET_ALL}"
+            )
             input(f"\n{Fore.YELLOW}Press Enter to continue...{Style.RESET_ALL}")
+            screen.invalidate()
 
 
 def main():
@@ -137,6 +162,10 @@ def main():
 
         # Show main menu
         switch_env = main_menu(auth)
+        auth.token_refresher.stop()
+
+    # Release pooled connections
+    close_transports()
 
     # Goodbye message
     clear_screen()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Bulk Ticket Tests
+
+Reading ticket rows from CSV and JSONL files and resuming from a journal
+"""
+
+import os
+import tempfile
+import unittest
+
+from teamdynamix.tickets.bulk import (
+    BulkCreateResult,
+    is_transient,
+    read_ticket_rows,
+    row_fingerprint,
+    unjournaled,
+)
+from teamdynamix.utils.journal import Journal
+
+
+class ReadTicketRowsTest(unittest.TestCase):
+    def _write(self, suffix, text):
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        self.addCleanup(os.unlink, path)
+        return path
+
+    def test_csv_converts_only_numeric_id_fields(self):
+        path = self._write(
+            ".csv",
+            "Title,TypeID,ExternalID,IsRichHtml,RequestorUid,Description\n"
+            "Printer,12,0012,true,45-ab,\n",
+        )
+
+        rows = list(read_ticket_rows(path))
+
+        self.assertEqual(
+            rows,
+            [
+                (
+                    1,
+                    {
+                        "Title": "Printer",
+                        "TypeID": 12,
+                        "ExternalID": "0012",
+                        "IsRichHtml": True,
+                        "RequestorUid": "45-ab",
+                    },
+                )
+            ],
+        )
+
+    def test_jsonl_keeps_its_own_types(self):
+        path = self._write(
+            ".jsonl", '{"Title": "A", "ExternalID": 12}\n\n{"Title": "B"}\n'
+        )
+
+        rows = list(read_ticket_rows(path))
+
+        self.assertEqual(
+            rows, [(1, {"Title": "A", "ExternalID": 12}), (3, {"Title": "B"})]
+        )
+
+
+class UnjournaledTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "tickets.csv.journal")
+        self.rows = [(row, {"Title": f"Ticket {row}"}) for row in (1, 2, 3)]
+
+    def _items(self):
+        return [(row, data, row_fingerprint(data)) for row, data in self.rows]
+
+    def _resume(self, retry_uncertain=False):
+        result = BulkCreateResult()
+        with Journal(self.path) as journal:
+            items = list(unjournaled(journal, self._items(), result, retry_uncertain))
+        return [item[0] for item in items], result
+
+    def test_skips_created_rows_and_holds_back_uncertain_ones(self):
+        with Journal(self.path) as journal:
+            items = self._items()
+            journal.record(1, "created", fingerprint=items[0][2], id=101)
+            journal.record(2, "pending", fingerprint=items[1][2])
+
+        sent, result = self._resume()
+
+        self.assertEqual(sent, [3])
+        self.assertEqual(result.created, {1: 101})
+        self.assertEqual(result.resumed, 1)
+        self.assertEqual(list(result.uncertain), [2])
+
+    def test_sends_uncertain_rows_when_asked(self):
+        with Journal(self.path) as journal:
+            journal.record(2, "pending", fingerprint=self._items()[1][2])
+
+        sent, result = self._resume(retry_uncertain=True)
+
+        self.assertEqual(sent, [1, 2, 3])
+        self.assertEqual(result.uncertain, {})
+
+    def test_reports_rows_changed_since_they_were_journaled(self):
+        with Journal(self.path) as journal:
+            journal.record(1, "created", fingerprint="0" * 16, id=101)
+
+        sent, result = self._resume()
+
+        self.assertEqual(sent, [2, 3])
+        self.assertEqual(list(result.failed), [1])
+        self.assertEqual(result.created, {})
+
+
+class IsTransientTest(unittest.TestCase):
+    def test_retries_only_missing_throttled_and_server_errors(self):
+        class Response:
+            def __init__(self, status_code):
+                self.status_code = status_code
+
+        self.assertTrue(is_transient(None))
+        for status_code in (429, 500, 502, 503):
+            self.assertTrue(is_transient(Response(status_code)), status_code)
+        for status_code in (200, 400, 401, 404, 409, 422):
+            self.assertFalse(is_transient(Response(status_code)), status_code)
+
+
+if __name__ == "__main__":
+    unittest.main()
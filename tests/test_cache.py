@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Ticket Metadata Tests
+
+Downloading metadata per application and resolving search names
+"""
+
+import os
+import tempfile
+import unittest
+
+from teamdynamix.tickets.cache import TicketMetadata
+
+
+class TicketMetadataTest(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".json")
+        os.close(handle)
+        self.addCleanup(os.remove, self.path)
+        self.endpoints = []
+        self.metadata = TicketMetadata("sandbox", "42", self.fetch, path=self.path)
+        self.metadata.warm()
+
+    def fetch(self, endpoint):
+        self.endpoints.append(endpoint)
+        return [{"ID": 7, "Name": "Open"}, {"ID": 8, "Name": "Closed"}]
+
+    def test_downloads_every_kind_for_the_application(self):
+        self.assertEqual(len(self.endpoints), 5)
+        for endpoint in self.endpoints:
+            self.assertTrue(endpoint.startswith("api/42/tickets/"), endpoint)
+
+    def test_resolves_a_name_to_an_id_filter(self):
+        resolved = self.metadata.resolve_search_params({"StatusName": "open"})
+        self.assertEqual(resolved, {"StatusIDs": [7]})
+
+    def test_keeps_the_name_when_ids_are_already_set(self):
+        params = {"StatusName": "Open", "StatusIDs": [8]}
+        self.assertEqual(self.metadata.resolve_search_params(params), params)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Feed Timeline Tests
+
+Merging and streaming ticket feeds
+"""
+
+import datetime
+import unittest
+
+from teamdynamix.tickets.feed import merge_feeds, stream_feeds
+
+
+def entry(entry_id, created):
+    return {"ID": entry_id, "CreatedDate": created}
+
+
+FEEDS = [
+    (1, [entry(11, "2024-01-01T10:00:00Z"), entry(12, "2024-01-03T10:00:00Z")]),
+    (2, [entry(21, "2024-01-02T10:00:00Z"), entry(22, "/Date(1704448800000)/")]),
+]
+
+
+class MergeFeedsTest(unittest.TestCase):
+    def test_merges_feeds_newest_first(self):
+        timeline = [item[2]["ID"] for item in merge_feeds(FEEDS)]
+        self.assertEqual(timeline, [22, 12, 21, 11])
+
+    def test_accepts_naive_since_as_utc(self):
+        since = datetime.datetime(2024, 1, 2, 10, 0)
+        timeline = [
+            item[2]["ID"]
+            for item in merge_feeds(FEEDS, newest_first=False, since=since)
+        ]
+        self.assertEqual(timeline, [21, 12, 22])
+
+
+class StreamFeedsTest(unittest.TestCase):
+    def test_yields_a_feed_before_the_next_one_is_read(self):
+        read = []
+
+        def feeds():
+            for ticket_id, entries in FEEDS:
+                read.append(ticket_id)
+                yield ticket_id, entries
+
+        stream = stream_feeds(feeds())
+        first = next(stream)
+
+        self.assertEqual((first[1], first[2]["ID"]), (1, 12))
+        self.assertEqual(read, [1])
+        self.assertEqual([item[2]["ID"] for item in stream], [11, 22, 21])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Record Model Tests
+
+Compact records standing in for API dicts
+"""
+
+import json
+import unittest
+
+from teamdynamix.utils.models import Ticket, json_default
+
+TICKET = {
+    "ID": 5,
+    "Title": "Printer jam",
+    "CreatedDate": "2024-01-02T10:00:00Z",
+    "Description": "Tray 2",
+}
+
+
+class TicketRecordTest(unittest.TestCase):
+    def test_reads_like_the_dict_it_was_made_from(self):
+        ticket = Ticket(TICKET)
+        self.assertEqual(ticket.Title, "Printer jam")
+        self.assertEqual(ticket["Description"], "Tray 2")
+        self.assertNotIn("StatusName", ticket)
+        self.assertEqual(ticket.to_dict(), TICKET)
+
+    def test_wrap_passes_existing_records_through(self):
+        ticket = Ticket(TICKET)
+        wrapped = list(Ticket.wrap([ticket, dict(TICKET, ID=6)]))
+        self.assertIs(wrapped[0], ticket)
+        self.assertEqual(wrapped[1].ID, 6)
+
+    def test_serializes_as_a_plain_object(self):
+        text = json.dumps(Ticket(TICKET), default=json_default)
+        self.assertEqual(json.loads(text), TICKET)
+
+
+if __name__ == "__main__":
+    unittest.main()
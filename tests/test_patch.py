@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Ticket Patch Tests
+
+JSON Patch operations built from changes to a ticket
+"""
+
+import unittest
+
+from teamdynamix.tickets.patch import diff_ticket, field_patch
+
+ORIGINAL = {
+    "ID": 5,
+    "Title": "Printer jam",
+    "StatusID": 1,
+    "StatusName": "New",
+    "ModifiedDate": "2024-01-01T00:00:00Z",
+    "Attributes": [{"ID": 10, "Value": "A"}, {"ID": 11, "Value": "B"}],
+}
+
+
+class DiffTicketTest(unittest.TestCase):
+    def test_skips_read_only_and_derived_fields(self):
+        modified = dict(
+            ORIGINAL,
+            StatusID=2,
+            StatusName="Open",
+            ModifiedDate="2024-02-01T00:00:00Z",
+        )
+
+        self.assertEqual(
+            diff_ticket(ORIGINAL, modified),
+            [{"op": "replace", "path": "/StatusID", "value": 2}],
+        )
+
+    def test_keeps_fields_missing_from_the_modified_ticket(self):
+        modified = {"Title": "Printer fixed", "Description": "Tray 2"}
+
+        self.assertEqual(
+            diff_ticket(ORIGINAL, modified),
+            [
+                {"op": "add", "path": "/Description", "value": "Tray 2"},
+                {"op": "replace", "path": "/Title", "value": "Printer fixed"},
+            ],
+        )
+
+    def test_removes_missing_fields_when_asked(self):
+        modified = {key: value for key, value in ORIGINAL.items() if key != "Title"}
+        modified["Attributes"] = [{"ID": 10, "Value": "A"}]
+
+        self.assertEqual(
+            diff_ticket(ORIGINAL, modified, remove_missing=True),
+            [
+                {"op": "remove", "path": "/Title"},
+                {"op": "remove", "path": "/attributes/11"},
+            ],
+        )
+
+    def test_diffs_custom_attributes_by_id(self):
+        modified = dict(
+            ORIGINAL,
+            Attributes=[{"ID": 11, "Value": "C"}, {"ID": 12, "Value": "D"}],
+        )
+
+        self.assertEqual(
+            diff_ticket(ORIGINAL, modified),
+            [
+                {"op": "replace", "path": "/attributes/11", "value": "C"},
+                {"op": "add", "path": "/attributes/12", "value": "D"},
+            ],
+        )
+
+
+class FieldPatchTest(unittest.TestCase):
+    def test_escapes_field_names(self):
+        self.assertEqual(
+            field_patch({"a/b": 1}), [{"op": "replace", "path": "/a~1b", "value": 1}]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
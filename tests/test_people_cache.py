@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+People Cache Tests
+
+Shared person lookups by UID and username
+"""
+
+import unittest
+from unittest import mock
+
+from teamdynamix.people.cache import PeopleCache
+
+PERSON = {"UID": "ABC-123", "UserName": "jdoe", "FullName": "J. Doe"}
+
+
+class PeopleCacheTest(unittest.TestCase):
+    def test_person_answers_uid_and_username_lookups(self):
+        cache = PeopleCache()
+        cache.put_person(PERSON)
+
+        self.assertEqual(cache.get_by_uid("abc-123"), (True, PERSON))
+        self.assertEqual(cache.get_by_username("JDOE"), (True, PERSON))
+        self.assertEqual(cache.get_uid("jdoe"), (True, "ABC-123"))
+
+    def test_returns_copies(self):
+        cache = PeopleCache()
+        cache.put_person(PERSON)
+
+        _, person = cache.get_by_uid("ABC-123")
+        person["FullName"] = "Changed"
+
+        self.assertEqual(cache.get_by_uid("ABC-123")[1]["FullName"], "J. Doe")
+
+    def test_missing_lookups_expire_after_negative_ttl(self):
+        cache = PeopleCache(negative_ttl=60)
+        with mock.patch("teamdynamix.people.cache.time.monotonic", return_value=100):
+            cache.put_missing("username", "nobody")
+            self.assertEqual(cache.get_by_username("nobody"), (True, None))
+        with mock.patch("teamdynamix.people.cache.time.monotonic", return_value=161):
+            self.assertEqual(cache.get_by_username("nobody"), (False, None))
+        self.assertEqual(cache.get_stats()["negative_hits"], 1)
+
+    def test_finding_a_person_clears_the_missing_entry(self):
+        cache = PeopleCache()
+        cache.put_missing("username", "jdoe")
+        cache.put_person(PERSON)
+
+        self.assertEqual(cache.get_by_username("jdoe"), (True, PERSON))
+
+    def test_evicts_least_recently_used_people(self):
+        cache = PeopleCache(max_size=2)
+        for uid in ("a", "b"):
+            cache.put_person({"UID": uid})
+        cache.get_by_uid("a")
+        cache.put_person({"UID": "c"})
+
+        self.assertEqual(cache.get_by_uid("b"), (False, None))
+        self.assertTrue(cache.get_by_uid("a")[0])
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
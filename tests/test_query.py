@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Ticket Query Tests
+
+SQL built from search parameters for the local ticket store
+"""
+
+import unittest
+
+from teamdynamix.tickets.query import build_order, build_where
+from teamdynamix.tickets.store import TicketStore
+
+TICKETS = [
+    {"ID": 1, "Title": "100% broken", "StatusName": "Open", "PriorityName": "High"},
+    {"ID": 2, "Title": "Printer", "StatusName": "open", "PriorityName": "Low"},
+    {"ID": 3, "Title": "Laptop", "StatusName": "Closed", "PriorityName": "high"},
+]
+
+
+class BuildWhereTest(unittest.TestCase):
+    def test_combines_filters_with_and(self):
+        where, args = build_where(
+            7,
+            {
+                "StatusName": "Open",
+                "PriorityIDs": [1, 2],
+                "CreatedDateFrom": "2024-01-01",
+                "Unknown": "x",
+            },
+        )
+
+        self.assertEqual(
+            where,
+            "WHERE app_id = ? AND status_name COLLATE NOCASE = ? "
+            "AND priority_id IN (?, ?) AND created_date >= ?",
+        )
+        self.assertEqual(args, ["7", "Open", 1, 2, "2024-01-01T00:00:00Z"])
+
+    def test_escapes_like_wildcards(self):
+        where, args = build_where(7, {"Title": "100%"})
+
+        self.assertEqual(where, "WHERE app_id = ? AND title LIKE ? ESCAPE '\\'")
+        self.assertEqual(args, ["7", "%100\\%%"])
+
+    def test_rejects_invalid_dates(self):
+        with self.assertRaises(ValueError):
+            build_where(7, {"ModifiedDateTo": "yesterday"})
+
+
+class BuildOrderTest(unittest.TestCase):
+    def test_breaks_ties_by_id(self):
+        self.assertEqual(
+            build_order("StatusName", descending=True),
+            "ORDER BY status_name COLLATE NOCASE DESC, id DESC",
+        )
+
+    def test_rejects_unknown_fields(self):
+        with self.assertRaises(ValueError):
+            build_order("Description")
+
+
+class StoreQueryTest(unittest.TestCase):
+    def setUp(self):
+        self.store = TicketStore(":memory:")
+        self.addCleanup(self.store.close)
+        self.store.upsert("7", TICKETS)
+
+    def test_name_filters_ignore_case(self):
+        tickets = self.store.query("7", {"StatusName": "OPEN"}, sort_by="ID")
+
+        self.assertEqual([ticket["ID"] for ticket in tickets], [2, 1])
+
+    def test_title_filter_matches_literal_percent(self):
+        tickets = self.store.query("7", {"Title": "100%"})
+
+        self.assertEqual([ticket["ID"] for ticket in tickets], [1])
+
+    def test_counts_names_ignoring_case(self):
+        counts = self.store.count_by("7", "PriorityName")
+
+        self.assertEqual([count for _, count in counts], [2, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter Tests
+
+Waiting on learned limits and giving up on throttled requests
+"""
+
+import unittest
+from unittest import mock
+
+from teamdynamix.auth.ratelimit import (
+    DEFAULT_WINDOW,
+    RateLimiter,
+    RateLimitError,
+    endpoint_key,
+)
+from teamdynamix.auth.transport import Transport
+
+
+class StubResponse:
+    def __init__(self, status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class StubAuth:
+    environment = "test"
+    base_url = "https://example.invalid/"
+
+    def make_api_request(self, method, endpoint, **kwargs):
+        return StubResponse()
+
+
+class EndpointKeyTest(unittest.TestCase):
+    def test_replaces_ids_and_drops_query(self):
+        self.assertEqual(
+            endpoint_key("get", "api/12/tickets/345?x=1"), "GET api/{id}/tickets/{id}"
+        )
+
+    def test_replaces_usernames_on_people_routes(self):
+        self.assertEqual(endpoint_key("GET", "api/people/jdoe"), "GET api/people/{id}")
+        self.assertEqual(
+            endpoint_key("GET", "api/people/getuid/asmith"),
+            "GET api/people/getuid/{id}",
+        )
+
+    def test_keeps_fixed_people_routes(self):
+        self.assertEqual(
+            endpoint_key("POST", "api/people/search"), "POST api/people/search"
+        )
+        self.assertEqual(
+            endpoint_key("GET", "api/people/lookup?searchText=a"),
+            "GET api/people/lookup",
+        )
+
+
+class RateLimiterTest(unittest.TestCase):
+    def test_waits_for_default_window_without_reset_header(self):
+        limiter = RateLimiter()
+        key = "GET api/tickets"
+        clock = mock.patch("teamdynamix.auth.ratelimit.time.monotonic")
+        with clock as monotonic:
+            monotonic.return_value = 1000.0
+            limiter.update(key, StubResponse(headers={"X-RateLimit-Limit": "1"}))
+            self.assertGreater(limiter.try_acquire(key), 0)
+
+            # The window ends, one request goes out and fails to connect
+            monotonic.return_value = 1000.0 + DEFAULT_WINDOW + 1
+            self.assertEqual(limiter.try_acquire(key), 0)
+            limiter.update(key, None)
+
+            delay = limiter.try_acquire(key)
+            self.assertAlmostEqual(delay, DEFAULT_WINDOW, delta=1)
+
+
+class TransportThrottleTest(unittest.TestCase):
+    def test_raises_when_still_throttled_after_retries(self):
+        transport = Transport(
+            StubAuth(), rate_limiter=RateLimiter(), throttle_retries=2
+        )
+        throttled = StubResponse(429, {"Retry-After": "0"})
+
+        with mock.patch.object(
+            transport, "_send", return_value=throttled
+        ) as send, mock.patch("teamdynamix.auth.ratelimit.time.sleep"):
+            with self.assertRaises(RateLimitError) as raised:
+                transport.request("GET", "api/tickets")
+
+        self.assertIs(raised.exception.response, throttled)
+        self.assertEqual(send.call_count, 3)
+        self.assertIn("still rate limited after 2 retries", str(raised.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
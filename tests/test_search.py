@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Ticket Search Tests
+
+Splitting ticket searches into date windows
+"""
+
+import datetime
+import unittest
+
+from teamdynamix.tickets.search import (
+    SearchError,
+    iter_search_windows,
+    parse_search_date,
+)
+
+START = "2024-01-01T00:00:00Z"
+END = "2024-01-03T00:00:00Z"
+
+
+def ticket(ticket_id, created):
+    return {"ID": ticket_id, "CreatedDate": created}
+
+
+class FakeSearch:
+    """Search endpoint over a fixed list of tickets"""
+
+    def __init__(self, tickets, fail_from=None):
+        self.tickets = tickets
+        self.fail_from = fail_from
+        self.windows = []
+
+    def __call__(self, params):
+        start = parse_search_date(params["CreatedDateFrom"])
+        stop = parse_search_date(params["CreatedDateTo"])
+        self.windows.append((start, stop))
+        if self.fail_from is not None and start >= self.fail_from:
+            return None
+        # Both ends are inclusive, like the search endpoint
+        matches = [
+            item
+            for item in self.tickets
+            if start <= parse_search_date(item["CreatedDate"]) <= stop
+        ]
+        return matches[: params["MaxResults"]]
+
+
+class IterSearchWindowsTest(unittest.TestCase):
+    def test_splits_full_windows(self):
+        search = FakeSearch(
+            [
+                ticket(1, "2024-01-01T06:00:00Z"),
+                ticket(2, "2024-01-01T18:00:00Z"),
+                ticket(3, "2024-01-02T06:00:00Z"),
+            ]
+        )
+        params = {"CreatedDateFrom": START, "CreatedDateTo": END}
+
+        windows = list(
+            iter_search_windows(
+                search, params, page_size=2, window=datetime.timedelta(days=2)
+            )
+        )
+
+        ids = [item["ID"] for _, tickets in windows for item in tickets]
+        self.assertEqual(ids, [1, 2, 3])
+        # The two day window was full, so it was searched again in halves
+        lengths = [stop - start for start, stop in search.windows]
+        self.assertEqual(
+            lengths[:3],
+            [
+                datetime.timedelta(days=2),
+                datetime.timedelta(days=1),
+                datetime.timedelta(hours=12),
+            ],
+        )
+        self.assertEqual(windows[-1][0], parse_search_date(END))
+
+    def test_returns_boundary_tickets_once(self):
+        search = FakeSearch([ticket(1, "2024-01-02T00:00:00Z")])
+        params = {"CreatedDateFrom": START, "CreatedDateTo": END}
+
+        windows = list(
+            iter_search_windows(
+                search, params, page_size=10, window=datetime.timedelta(days=1)
+            )
+        )
+
+        self.assertEqual(len(search.windows), 2)
+        self.assertEqual(
+            [[item["ID"] for item in tickets] for _, tickets in windows], [[1], []]
+        )
+
+    def test_failed_window_raises_after_earlier_windows(self):
+        fail_from = parse_search_date("2024-01-02T00:00:00Z")
+        search = FakeSearch([ticket(1, "2024-01-01T06:00:00Z")], fail_from)
+        params = {"CreatedDateFrom": START, "CreatedDateTo": END}
+        windows = iter_search_windows(
+            search, params, page_size=10, window=datetime.timedelta(days=1)
+        )
+
+        self.assertEqual([item["ID"] for item in next(windows)[1]], [1])
+        with self.assertRaises(SearchError) as caught:
+            next(windows)
+        self.assertEqual(caught.exception.resume_from, fail_from)
+
+
+if __name__ == "__main__":
+    unittest.main()
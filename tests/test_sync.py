@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Ticket Sync Tests
+
+Incremental sync into the local ticket store
+"""
+
+import contextlib
+import datetime
+import io
+import unittest
+from unittest import mock
+
+from teamdynamix.tickets.client import TicketsClient
+from teamdynamix.tickets.search import SearchError
+from teamdynamix.tickets.store import TicketStore
+
+UTC = datetime.timezone.utc
+FIRST_END = datetime.datetime(2024, 1, 2, tzinfo=UTC)
+
+
+class StubAuth:
+    environment = "test"
+    base_url = "https://example.invalid/"
+    username = "tester"
+
+    def make_api_request(self, method, endpoint, **kwargs):
+        raise AssertionError(f"Unexpected request: {method} {endpoint}")
+
+
+def ticket(ticket_id, modified):
+    return {"ID": ticket_id, "AppID": 1, "Title": "x", "ModifiedDate": modified}
+
+
+class SyncTicketsTest(unittest.TestCase):
+    def setUp(self):
+        self.client = TicketsClient(StubAuth())
+        self.client._store = TicketStore(":memory:")
+
+    def test_watermark_stops_before_a_failed_window(self):
+        def windows(*args, **kwargs):
+            yield FIRST_END, [ticket(1, "2024-01-01T12:00:00Z")]
+            raise SearchError("Error searching tickets", FIRST_END)
+
+        output = io.StringIO()
+        with mock.patch.object(self.client, "iter_search_windows", windows):
+            with contextlib.redirect_stdout(output):
+                result = self.client.sync_tickets("1")
+
+        self.assertEqual(result["stored"], 1)
+        self.assertEqual(result["watermark"], FIRST_END)
+        self.assertFalse(result["complete"])
+        self.assertEqual(self.client._store.get_watermark("1"), FIRST_END)
+        self.assertIn("sync stopped", output.getvalue())
+
+    def test_next_sync_starts_from_the_watermark(self):
+        self.client._store.upsert("1", [], watermark=FIRST_END)
+        searches = []
+
+        def windows(app_id, search_params, *args, **kwargs):
+            searches.append(search_params)
+            return iter(())
+
+        with mock.patch.object(self.client, "iter_search_windows", windows):
+            self.client.sync_tickets("1", overlap=datetime.timedelta(minutes=5))
+
+        self.assertEqual(
+            searches[0]["ModifiedDateFrom"],
+            FIRST_END - datetime.timedelta(minutes=5),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
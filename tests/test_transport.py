@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Transport Tests
+
+Requests through the auth class and recycling of idle connection pools
+"""
+
+import contextlib
+import io
+import threading
+import unittest
+from unittest import mock
+
+import requests
+
+from teamdynamix.auth.ratelimit import RateLimiter
+from teamdynamix.auth.transport import Transport
+
+
+class StubResponse:
+    status_code = 200
+    headers = {}
+
+
+class StubAuth:
+    environment = "test"
+    base_url = "https://example.invalid/"
+
+    def __init__(self):
+        self.session = requests.Session()
+        self.calls = []
+
+    def make_api_request(self, method, endpoint, **kwargs):
+        self.calls.append((method, endpoint, kwargs))
+        return StubResponse()
+
+
+class TransportTest(unittest.TestCase):
+    def test_sends_through_auth_request_with_default_timeout(self):
+        auth = StubAuth()
+        transport = Transport(auth, rate_limiter=RateLimiter(), timeout=7)
+
+        transport.request("POST", "api/tickets", json={"Title": "x"})
+
+        self.assertEqual(
+            auth.calls,
+            [("POST", "api/tickets", {"timeout": 7, "json": {"Title": "x"}})],
+        )
+        self.assertIs(auth.session.get_adapter("https://"), transport._adapter)
+
+    def test_does_not_recycle_pool_while_request_in_flight(self):
+        auth = StubAuth()
+        transport = Transport(auth, rate_limiter=RateLimiter(), keepalive_timeout=10)
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_request(method, endpoint, **kwargs):
+            if not started.is_set():
+                started.set()
+                release.wait(5)
+            return StubResponse()
+
+        clock = mock.patch("teamdynamix.auth.transport.time.monotonic")
+        with clock as monotonic:
+            monotonic.return_value = 1000.0
+            transport.request("GET", "api/tickets")
+            adapter = transport._adapter
+
+            # One thread is still waiting on a response when the pool goes idle
+            with mock.patch.object(auth, "make_api_request", slow_request):
+                worker = threading.Thread(
+                    target=transport.request, args=("GET", "api/tickets")
+                )
+                worker.start()
+                started.wait(5)
+                monotonic.return_value = 1100.0
+                transport.request("GET", "api/tickets")
+                self.assertIs(transport._adapter, adapter)
+
+                release.set()
+                worker.join(5)
+
+            # Idle time counts from the last response, not the last request
+            monotonic.return_value = 1105.0
+            transport.request("GET", "api/tickets")
+            self.assertIs(transport._adapter, adapter)
+
+            monotonic.return_value = 1200.0
+            transport.request("GET", "api/tickets")
+            self.assertIsNot(transport._adapter, adapter)
+            self.assertEqual(transport.get_stats()["sessions_recycled"], 1)
+
+    def test_reports_unknown_reuse_without_auth_session(self):
+        auth = StubAuth()
+        auth.session = None
+        transport = Transport(auth, rate_limiter=RateLimiter())
+        output = io.StringIO()
+
+        with contextlib.redirect_stdout(output):
+            for _ in range(5):
+                transport.request("GET", "api/tickets")
+
+        stats = transport.get_stats()
+        self.assertEqual(stats["requests"], 5)
+        self.assertEqual(stats["pooled_requests"], 0)
+        self.assertIsNone(stats["connections_reused"])
+        self.assertIsNone(stats["reuse_ratio"])
+        self.assertEqual(output.getvalue().count("pooling is inactive"), 1)
+
+    def test_leaves_out_timeout_the_auth_request_does_not_take(self):
+        class NoTimeoutAuth(StubAuth):
+            def make_api_request(self, method, endpoint, json=None):
+                self.calls.append((method, endpoint, json))
+                return StubResponse()
+
+        auth = NoTimeoutAuth()
+        transport = Transport(auth, rate_limiter=RateLimiter())
+
+        response = transport.request("POST", "api/tickets", json={"Title": "x"})
+
+        self.assertIsInstance(response, StubResponse)
+        self.assertEqual(auth.calls, [("POST", "api/tickets", {"Title": "x"})])
+
+    def test_quiet_request_does_not_print_connection_errors(self):
+        auth = StubAuth()
+        transport = Transport(auth, rate_limiter=RateLimiter())
+        output = io.StringIO()
+        failure = requests.ConnectionError("refused")
+
+        with mock.patch.object(auth, "make_api_request", side_effect=failure):
+            with contextlib.redirect_stdout(output):
+                response = transport.request("GET", "api/tickets", quiet=True)
+
+        self.assertIsNone(response)
+        self.assertEqual(output.getvalue(), "")
+        self.assertEqual(transport.get_stats()["errors"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
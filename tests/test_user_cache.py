@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Current User Cache Tests
+
+Looking up the authenticated user once per session
+"""
+
+import unittest
+from unittest import mock
+
+from teamdynamix.auth.user_cache import CurrentUserCache
+
+
+class StubAuth:
+    environment = "test"
+    token = None
+
+    def __init__(self, user):
+        self.user = user
+        self.lookups = 0
+
+    def get_current_user(self):
+        self.lookups += 1
+        return self.user
+
+
+class CurrentUserCacheTest(unittest.TestCase):
+    def setUp(self):
+        clock = mock.patch("teamdynamix.auth.user_cache.time.monotonic")
+        self.monotonic = clock.start()
+        self.addCleanup(clock.stop)
+        self.monotonic.return_value = 1000.0
+
+    def test_looks_the_user_up_once_within_the_ttl(self):
+        auth = StubAuth({"FullName": "J. Doe"})
+        cache = CurrentUserCache(auth, ttl=900)
+
+        cache.get()
+        self.monotonic.return_value = 1500.0
+        self.assertEqual(cache.get(), {"FullName": "J. Doe"})
+        self.assertEqual(auth.lookups, 1)
+
+    def test_remembers_a_failed_lookup_for_failure_ttl(self):
+        auth = StubAuth(None)
+        cache = CurrentUserCache(auth, failure_ttl=60)
+
+        self.assertIsNone(cache.get())
+        self.monotonic.return_value = 1030.0
+        self.assertIsNone(cache.get())
+        self.assertEqual(auth.lookups, 1)
+
+        auth.user = {"FullName": "J. Doe"}
+        self.monotonic.return_value = 1061.0
+        self.assertEqual(cache.get(), {"FullName": "J. Doe"})
+        self.assertEqual(auth.lookups, 2)
+
+    def test_retries_a_failed_lookup_after_switching_environment(self):
+        auth = StubAuth(None)
+        cache = CurrentUserCache(auth)
+
+        cache.get()
+        auth.environment = "production"
+        cache.get()
+        self.assertEqual(auth.lookups, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()